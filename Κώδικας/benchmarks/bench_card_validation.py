@@ -0,0 +1,65 @@
+# benchmarks/bench_card_validation.py
+"""
+Bulk card validation for saved-card imports: validate_cards() against
+calling PaymentMethod.validate() on each object.
+
+Run from the project root:  python -m benchmarks.bench_card_validation
+"""
+import random
+import time
+
+from model.card_validation import validate_cards
+from model.payment_method import PaymentMethod
+
+CARDS = 200_000
+
+
+def luhn_complete(prefix: str) -> str:
+    """Append the check digit that makes `prefix` pass Luhn."""
+    for d in "0123456789":
+        digits = prefix + d
+        total = 0
+        for i, c in enumerate(reversed(digits)):
+            n = int(c)
+            if i % 2:
+                n = n * 2 - 9 if n > 4 else n * 2
+            total += n
+        if total % 10 == 0:
+            return digits
+    raise AssertionError
+
+
+def main():
+    rnd = random.Random(0)
+    holders, numbers, expiries, cvvs = [], [], [], []
+    for _ in range(CARDS):
+        number = luhn_complete(rnd.choice("45") + "".join(rnd.choices("0123456789", k=14)))
+        if rnd.random() < 0.05:
+            number = number[:-1] + str((int(number[-1]) + 1) % 10)  # typo
+        holders.append("Alice Example")
+        numbers.append(number)
+        expiries.append(f"{rnd.randint(1, 12):02d}/{rnd.randint(22, 32)}")
+        cvvs.append("123")
+
+    methods = [PaymentMethod(*row) for row in zip(holders, numbers, expiries, cvvs)]
+    t0 = time.perf_counter()
+    failed = 0
+    for pm in methods:
+        try:
+            pm.validate()
+        except Exception:
+            failed += 1
+    per_object = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = validate_cards(holders, numbers, expiries, cvvs)
+    bulk = time.perf_counter() - t0
+
+    print(f"{CARDS:,} cards")
+    print(f"  PaymentMethod.validate loop: {per_object:.2f} s ({failed:,} rejected, no Luhn)")
+    print(f"  validate_cards:              {bulk:.2f} s ({len(result.failures()):,} rejected)")
+    print(f"  speed-up: {per_object / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_catalog_query.py
+"""
+Query latency of MenuCatalog at 1k, 100k and 1M items, plus scalar vs
+vectorized (ColumnarCatalog) top-k ranking.
+
+Run from the project root:  python -m benchmarks.bench_catalog_query
+"""
+import random
+import time
+
+from model.catalog import MenuCatalog
+from model.catalog_columns import ColumnarCatalog
+from model.menu_item import MenuItem
+from model.preferences import Preferences
+from model.filters import Filters
+
+CUISINES = ["Μεσογειακή", "Ιταλική", "Ασιατική", "Γρήγορο φαγητό", "Χορτοφαγική"]
+MEALS = ["Μεσημεριανό", "Βραδινό", "Σνακ", "Πρωινό"]
+
+
+def make_items(n: int, seed: int = 42):
+    rnd = random.Random(seed)
+    return [
+        MenuItem(
+            name=f"item-{i}",
+            price=round(rnd.uniform(2.0, 30.0), 2),
+            image="burger.png",
+            cuisine=rnd.choice(CUISINES),
+            meal_type=rnd.choice(MEALS),
+            distance=round(rnd.uniform(0.1, 15.0), 1),
+            prep_time=rnd.randint(5, 90),
+            rating=round(rnd.uniform(3.0, 5.0), 1),
+        )
+        for i in range(n)
+    ]
+
+
+def timed(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def bench(n: int, repeat: int = 1000):
+    t0 = time.perf_counter()
+    catalog = MenuCatalog(make_items(n))
+    build = time.perf_counter() - t0
+
+    prefs = Preferences(cuisine="Μεσογειακή", meal_type="Μεσημεριανό")
+    fltrs = Filters(max_price=10.0, max_distance=5.0, max_time=45)
+    per_query = timed(lambda: catalog.query(prefs, fltrs, limit=20), repeat)
+    print(f"{n:>9,} items  build {build:7.2f} s  query {per_query * 1e6:8.1f} µs")
+
+    columns = ColumnarCatalog(catalog)
+    reps = max(1, repeat // 100)
+    scalar = timed(lambda: catalog.top(None, fltrs, 20), reps)
+    vector = timed(lambda: columns.top(None, fltrs, 20), reps)
+    print(f"{'':>15}top-20 scalar {scalar * 1e3:8.2f} ms  vectorized {vector * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    for n in (1_000, 100_000, 1_000_000):
+        bench(n)
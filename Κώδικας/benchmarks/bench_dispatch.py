@@ -0,0 +1,72 @@
+# benchmarks/bench_dispatch.py
+"""
+Dispatch latency with a simulated fleet of 5,000 active couriers.
+
+Run from the project root:  python -m benchmarks.bench_dispatch
+"""
+import random
+import statistics
+import time
+
+from model.delivery_person import DeliveryPerson
+from model.geopoint import GeoPoint
+from model.order import Order
+from service.dispatch_service import DispatchService
+
+FLEET = 5_000
+ORDERS = 1_000
+CENTER = GeoPoint(37.9755, 23.7348)
+VEHICLES = ["Bicycle", "Motorbike", "Car", "Van"]
+
+
+def random_point(rnd):
+    return GeoPoint(
+        CENTER.latitude + rnd.uniform(-0.15, 0.15),
+        CENTER.longitude + rnd.uniform(-0.2, 0.2),
+    )
+
+
+def main():
+    rnd = random.Random(0)
+    # Couriers answer offers right away: 20% reject, the rest accept.
+    def on_offer(courier, order):
+        if rnd.random() < 0.2:
+            courier.rejectOrder(order)
+        else:
+            courier.acceptOrder(order)
+
+    dispatcher = DispatchService(on_offer=on_offer)
+    for i in range(FLEET):
+        c = DeliveryPerson(
+            name="Courier",
+            email=f"c{i}@example.com",
+            phone="+301234567890",
+            vehicle_type=rnd.choice(VEHICLES),
+            license_plate=f"AB-{i % 10000}",
+            password="Secret123",
+            experience=1,
+        )
+        c.currentLocation = random_point(rnd)
+        dispatcher.register(c)
+
+    latencies = []
+    for _ in range(ORDERS):
+        order = Order(items=[], total_amount=10.0, delivery_address="x")
+        order.confirm()
+        dispatcher.submit(order, random_point(rnd))
+        t0 = time.perf_counter()
+        dispatcher.dispatch_pending()
+        latencies.append(time.perf_counter() - t0)
+        # deliver right away so the fleet stays at 5,000 active couriers
+        dispatcher.complete(order)
+
+    latencies.sort()
+    print(f"{FLEET:,} couriers, {ORDERS:,} orders")
+    print(f"  mean {statistics.mean(latencies) * 1e3:.3f} ms")
+    print(f"  p50  {latencies[len(latencies) // 2] * 1e3:.3f} ms")
+    print(f"  p99  {latencies[int(len(latencies) * 0.99)] * 1e3:.3f} ms")
+    print(f"  max  {latencies[-1] * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
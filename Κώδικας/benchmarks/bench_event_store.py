@@ -0,0 +1,37 @@
+# benchmarks/bench_event_store.py
+"""
+Memory per million events: plain list of UserEvent vs RingBufferEventRecorder.
+
+Run from the project root:  python -m benchmarks.bench_event_store
+"""
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from model.event_log import UserEvent
+from model.event_store import RingBufferEventRecorder
+
+N = 1_000_000
+TYPES = ["login", "preference_submit", "view_item", "add_to_cart"]
+
+
+def measure(label, make_store, record):
+    t0_time = datetime(2025, 1, 1)
+    tracemalloc.start()
+    store = make_store()
+    t0 = time.perf_counter()
+    for i in range(N):
+        record(store, UserEvent(TYPES[i & 3], t0_time + timedelta(seconds=i)))
+    elapsed = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<12} {current / 2**20:8.1f} MiB per 1M events  "
+        f"{elapsed / N * 1e9:6.0f} ns/append"
+    )
+    return store
+
+
+if __name__ == "__main__":
+    measure("list", list, lambda s, e: s.append(e))
+    measure("ring buffer", lambda: RingBufferEventRecorder(capacity=N), lambda s, e: s.record(e))
@@ -0,0 +1,53 @@
+# benchmarks/bench_geo.py
+"""
+"Points within N km" at 10k and 1M points: GeoGridIndex vs computing the
+vectorized haversine distance to every point.
+
+Run from the project root:  python -m benchmarks.bench_geo
+"""
+import random
+import time
+
+import numpy as np
+
+from model.geo import GeoGridIndex, haversine_km_array
+from model.geopoint import GeoPoint
+
+CENTER = GeoPoint(37.9755, 23.7348)  # Syntagma
+RADIUS_KM = 2.0
+
+
+def bench(n: int, repeat: int = 200):
+    rnd = random.Random(0)
+    # spread over a ~40 x 40 km metro area
+    lats = [CENTER.latitude + rnd.uniform(-0.18, 0.18) for _ in range(n)]
+    lons = [CENTER.longitude + rnd.uniform(-0.23, 0.23) for _ in range(n)]
+
+    t0 = time.perf_counter()
+    index = GeoGridIndex(cell_km=0.5)
+    for i in range(n):
+        index.insert(i, GeoPoint(lats[i], lons[i]))
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        hits = index.within(CENTER, RADIUS_KM)
+    grid = (time.perf_counter() - t0) / repeat
+
+    lat_arr, lon_arr = np.array(lats), np.array(lons)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        d = haversine_km_array(lat_arr, lon_arr, CENTER)
+        brute_hits = np.flatnonzero(d <= RADIUS_KM)
+    brute = (time.perf_counter() - t0) / repeat
+
+    assert len(hits) == len(brute_hits)
+    print(
+        f"{n:>9,} points  build {build:6.2f} s  hits {len(hits):>6}  "
+        f"grid {grid * 1e3:7.3f} ms  full-scan numpy {brute * 1e3:7.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    for n in (10_000, 1_000_000):
+        bench(n)
@@ -0,0 +1,48 @@
+# benchmarks/bench_location_ingest.py
+"""
+Single-core throughput of LocationIngestService for courier GPS pings
+(target: 100k updates/sec).
+
+Run from the project root:  python -m benchmarks.bench_location_ingest
+"""
+import random
+import time
+
+from model.location_table import LocationTable
+from service.location_service import LocationIngestService
+
+COURIERS = 5_000
+BATCH = 10_000
+BATCHES = 100
+
+
+def main():
+    rnd = random.Random(0)
+    service = LocationIngestService(LocationTable(track_len=16))
+    batches = []
+    ts = 0.0
+    for _ in range(BATCHES):
+        batch = []
+        for _ in range(BATCH):
+            ts += 0.001
+            batch.append(
+                (
+                    rnd.randrange(COURIERS),
+                    37.97 + rnd.uniform(-0.1, 0.1),
+                    23.73 + rnd.uniform(-0.1, 0.1),
+                    ts,
+                )
+            )
+        batches.append(batch)
+
+    t0 = time.perf_counter()
+    for batch in batches:
+        service.ingest(batch)
+    elapsed = time.perf_counter() - t0
+    total = BATCH * BATCHES
+    print(f"{total:,} pings from {COURIERS:,} couriers in {elapsed:.2f} s")
+    print(f"  {total / elapsed:,.0f} updates/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_pixmap_cache.py
+"""
+Time to render a 200-card product grid: decoding and scaling every image
+per card (the old ProductCard path) against the shared pixmap cache.
+
+Run from the project root:  python -m benchmarks.bench_pixmap_cache
+"""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication
+
+CARDS = 200
+IMAGES = [
+    "resources/images/smoked_burger.png",
+    "resources/images/classic_burger.png",
+    "resources/images/cheeseburger.png",
+    "resources/images/ten_years_old_beef_burger.png",
+]
+ICONS = ["resources/icons/star.png", "resources/icons/location.png"]
+
+
+def scaled(path, width, height):
+    return QPixmap(path).scaled(
+        width,
+        height,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+def products():
+    return [
+        {
+            "image": IMAGES[i % len(IMAGES)],
+            "title": f"Burger {i}",
+            "rating": "4.5",
+            "distance": "1.2km",
+            "price": "€10.00",
+        }
+        for i in range(CARDS)
+    ]
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    from view.components.product_card import ProductCard
+    from view.pixmap_cache import cached_pixmap, pixmap_cache
+
+    t0 = time.perf_counter()
+    for product in products():
+        scaled(product["image"], 144, 100)
+        for icon in ICONS:
+            scaled(icon, 14, 14)
+    uncached = time.perf_counter() - t0
+
+    pixmap_cache.clear()
+    t0 = time.perf_counter()
+    for product in products():
+        cached_pixmap(product["image"], 144, 100)
+        for icon in ICONS:
+            cached_pixmap(icon, 14, 14)
+    cached_images = time.perf_counter() - t0
+
+    pixmap_cache.clear()
+    decodes = pixmap_cache.decodes
+    t0 = time.perf_counter()
+    cards = [ProductCard(**product) for product in products()]
+    grid_time = time.perf_counter() - t0
+    decodes = pixmap_cache.decodes - decodes
+
+    print(f"{CARDS} product cards")
+    print(f"  images, decode + scale per card: {uncached * 1000:.1f} ms")
+    print(f"  images, pixmap cache (cold):     {cached_images * 1000:.1f} ms")
+    print(f"  whole ProductCards, cached:      {grid_time * 1000:.1f} ms")
+    print(
+        f"  {decodes} decodes for {3 * CARDS} pixmaps, "
+        f"{pixmap_cache.used_bytes / 1024:.0f} KiB cached"
+    )
+    for card in cards:
+        card.deleteLater()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
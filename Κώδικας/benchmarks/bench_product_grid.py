@@ -0,0 +1,84 @@
+# benchmarks/bench_product_grid.py
+"""
+Construction time, first paint and Python heap growth of the product grid
+as the catalog grows: one ProductCard widget per product (the old
+QGridLayout grid) against the virtualized ProductGrid.
+
+Run from the project root:  python -m benchmarks.bench_product_grid
+"""
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QGridLayout, QWidget
+
+SIZES = [100, 1_000, 10_000]
+EAGER_LIMIT = 1_000  # one widget tree per product gets too slow beyond this
+IMAGES = [
+    "resources/images/smoked_burger.png",
+    "resources/images/classic_burger.png",
+    "resources/images/cheeseburger.png",
+    "resources/images/ten_years_old_beef_burger.png",
+]
+
+
+def products(n):
+    return [
+        {
+            "image": IMAGES[i % len(IMAGES)],
+            "title": f"Burger {i}",
+            "rating": "4.5",
+            "distance": "1.2km",
+            "price": "€10.00",
+        }
+        for i in range(n)
+    ]
+
+
+def eager_grid(items):
+    from view.components.product_card import ProductCard
+
+    widget = QWidget()
+    grid = QGridLayout(widget)
+    for i, product in enumerate(items):
+        row, col = divmod(i, 2)
+        grid.addWidget(ProductCard(**product), row, col, alignment=Qt.AlignmentFlag.AlignCenter)
+    return widget
+
+
+def measure(app, build, items):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    widget = build(items)
+    widget.resize(400, 800)
+    widget.grab()  # first paint
+    elapsed = time.perf_counter() - t0
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    objects = len(widget.findChildren(QWidget))
+    widget.deleteLater()
+    app.processEvents()
+    return elapsed, heap, objects
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+    from view.components.product_grid import ProductGrid
+
+    measure(app, ProductGrid, products(10))  # warm the pixmap cache
+    print(f"{'products':>9} {'grid':>12} {'build+paint':>12} {'py heap':>10} {'widgets':>8}")
+    for n in SIZES:
+        items = products(n)
+        rows = [("virtualized", ProductGrid)]
+        if n <= EAGER_LIMIT:
+            rows.insert(0, ("per-card", eager_grid))
+        for name, build in rows:
+            elapsed, heap, objects = measure(app, build, items)
+            print(f"{n:>9,} {name:>12} {elapsed * 1000:>10.1f}ms {heap / 1024:>8.0f}KB {objects:>8,}")
+
+
+if __name__ == "__main__":
+    main()
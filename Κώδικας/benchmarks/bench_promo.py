@@ -0,0 +1,58 @@
+# benchmarks/bench_promo.py
+"""
+Time to evaluate every live promo campaign against one cart
+(target: microseconds with thousands of campaigns).
+
+Run from the project root:  python -m benchmarks.bench_promo
+"""
+import random
+import time
+from datetime import datetime, timedelta
+
+from model.cart import Cart
+from model.menu_item import MenuItem
+from model.promo import PromoEngine, PromoRule
+
+CAMPAIGNS = 5_000
+CUISINES = ["Μεσογειακή", "Χορτοφαγική", "Ασιατική", "Γρήγορο φαγητό"] + [
+    f"cuisine-{i}" for i in range(40)
+]
+RUNS = 20_000
+
+
+def main():
+    rnd = random.Random(0)
+    now = datetime(2025, 5, 1, 12, 0)
+    rules = []
+    for i in range(CAMPAIGNS):
+        start = now + timedelta(hours=rnd.randint(-48, 24))
+        rules.append(
+            PromoRule(
+                f"PROMO{i}",
+                percent_off=rnd.choice([0, 5, 10, 15, 20]),
+                amount_off_cents=rnd.choice([0, 100, 300, 500]),
+                min_basket_cents=rnd.randrange(0, 6000, 100),
+                cuisine=rnd.choice([None, None, *CUISINES]),
+                first_order_only=rnd.random() < 0.1,
+                starts=start,
+                ends=start + timedelta(hours=rnd.randint(1, 72)),
+            )
+        )
+    t0 = time.perf_counter()
+    engine = PromoEngine(rules, clock=lambda: now)
+    print(f"compiled {CAMPAIGNS:,} campaigns in {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    cart = Cart()
+    for cuisine in CUISINES[:3]:
+        cart.add(MenuItem(f"{cuisine} dish", 7.5, "x.png", cuisine), quantity=2)
+
+    t0 = time.perf_counter()
+    for _ in range(RUNS):
+        best = engine.best(cart)
+    elapsed = (time.perf_counter() - t0) / RUNS
+    print(f"best promo {best[0].code} (-{best[1]} cents) among {len(engine.evaluate(cart))} qualifying")
+    print(f"  {elapsed * 1e6:.1f} µs per evaluation of all campaigns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_startup.py
+"""
+Time to first frame of MainWindow: every screen built before the first
+paint (the old eager create_screens) against lazy screen factories.
+
+Run from the project root:  python -m benchmarks.bench_startup
+"""
+import logging
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, QObject
+from PyQt6.QtWidgets import QApplication
+
+RUNS = 5
+
+
+class FirstPaint(QObject):
+    """Records when the watched widget is first painted."""
+
+    def __init__(self):
+        super().__init__()
+        self.at = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and self.at is None:
+            self.at = time.perf_counter()
+        return False
+
+
+def first_frame(app, eager: bool) -> float:
+    from main import MainWindow
+
+    t0 = time.perf_counter()
+    window = MainWindow()
+    if eager:
+        for name in list(window.nav_controller.factories):
+            window.nav_controller.screen(name)
+    watcher = FirstPaint()
+    window.stacked_widget.currentWidget().installEventFilter(watcher)
+    window.show()
+    while watcher.at is None:
+        app.processEvents()
+    elapsed = watcher.at - t0
+    built = len(window.nav_controller.tab_screens)
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return elapsed, built
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    import main as app_main  # noqa: F401  (configures logging on import)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    first_frame(app, eager=True)  # warm imports and the pixmap cache
+    for eager in (True, False):
+        times = []
+        for _ in range(RUNS):
+            elapsed, built = first_frame(app, eager)
+            times.append(elapsed)
+        label = "eager (all screens)" if eager else "lazy factories"
+        print(f"{label:>20}: {min(times) * 1000:7.1f} ms to first frame, {built} screens built")
+
+
+if __name__ == "__main__":
+    main()
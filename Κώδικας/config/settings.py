@@ -15,6 +15,16 @@ LOGGING_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
 # You can add additional settings, e.g. API endpoints, here
 
+# SQLite file holding placed orders (see service/order_repository.py)
+ORDERS_DB_PATH = "orders.db"
+# Append-only log of order status transitions (see service/order_state_store.py)
+ORDER_LOG_PATH = "orders.log"
+# Memory budget for decoded images (see view/pixmap_cache.py)
+PIXMAP_CACHE_MB = 32
+# Customer whose order history the screens show. A stand-in until sign-in
+# exists; set to None to run with no customer at all.
+CUSTOMER_ID = "local"
+
 # Global settings dictionary for convenient access
 SETTINGS = {
     "colors": COLORS,
@@ -24,4 +34,8 @@ SETTINGS = {
     "heading2_size": HEADING2_SIZE,
     "heading3_size": HEADING3_SIZE,
     "debug": DEBUG,
+    "orders_db": ORDERS_DB_PATH,
+    "order_log": ORDER_LOG_PATH,
+    "pixmap_cache_mb": PIXMAP_CACHE_MB,
+    "customer_id": CUSTOMER_ID,
 }
@@ -1,6 +1,7 @@
 # controller/navigation_controller.py
 import logging
-from PyQt6.QtCore import QObject, pyqtSlot
+from collections import OrderedDict, deque
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot
 
 class NavigationController(QObject):
     """
@@ -8,16 +9,31 @@ class NavigationController(QObject):
     There are two kinds of screens:
       1. Tab screens which are persistent and registered via register_screen.
          (e.g., Home, Search, Cart, Messages, Profile)
-      2. Dynamic screens added via add_screen (e.g., Product Details).
+      2. Dynamic screens added via add_screen (e.g., Product Details). Only the
+         `max_dynamic_screens` most recently shown are kept; older ones are
+         removed from the stack and deleted.
+
+    Tab screens can also be registered lazily with register_factory: the
+    screen is built the first time it is shown (or asked for via screen()),
+    or earlier in idle time if it was queued with prewarm().
 
     on_tab_clicked() handles switching between tab screens and logs which tab is highlighted.
     on_back_clicked() always routes back to the 'home' screen.
     """
-    def __init__(self, stacked_widget, parent=None):
+    def __init__(self, stacked_widget, parent=None, max_dynamic_screens: int = 3):
         super().__init__(parent)
         self.stacked_widget = stacked_widget
+        self.max_dynamic_screens = max_dynamic_screens
+        # Dynamic screens in least- to most-recently shown order; widget -> name.
+        self.dynamic_screens = OrderedDict()
         # Registered tab screens; keys are screen names.
         self.tab_screens = {}
+        # Screens not built yet: name -> zero-argument callable returning the widget.
+        self.factories = {}
+        self._prewarm_queue = deque()
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setInterval(0)  # fires once pending events are handled
+        self._prewarm_timer.timeout.connect(self._prewarm_next)
         logging.debug("NavigationController initialized with no tab screens.")
 
     def register_screen(self, name: str, widget):
@@ -33,6 +49,41 @@ class NavigationController(QObject):
             logging.debug(f"register_screen(): Widget for screen '{name}' already exists in stacked_widget.")
         logging.debug(f"register_screen(): Current registered screens: {list(self.tab_screens.keys())}.")
 
+    def register_factory(self, name: str, factory):
+        """
+        Register a tab screen that is built by `factory()` on first use.
+        """
+        logging.debug(f"register_factory(): Screen '{name}' will be built on demand.")
+        self.factories[name] = factory
+
+    def screen(self, name: str):
+        """
+        Return the screen registered under `name`, building it now if it was
+        registered with a factory. Returns None for unknown names.
+        """
+        if name not in self.tab_screens and name in self.factories:
+            logging.debug(f"screen(): Building screen '{name}' on first use.")
+            self.register_screen(name, self.factories.pop(name)())
+        return self.tab_screens.get(name)
+
+    def prewarm(self, *names: str):
+        """
+        Build the given screens one at a time while the event loop is idle,
+        so a likely next tab is ready before it is clicked.
+        """
+        self._prewarm_queue.extend(names)
+        if self._prewarm_queue and not self._prewarm_timer.isActive():
+            self._prewarm_timer.start()
+
+    def _prewarm_next(self):
+        if not self._prewarm_queue:
+            self._prewarm_timer.stop()
+            return
+        name = self._prewarm_queue.popleft()
+        if name in self.factories:
+            logging.debug(f"_prewarm_next(): Pre-warming screen '{name}'.")
+            self.screen(name)
+
     @pyqtSlot(str)
     def on_tab_clicked(self, tab_name: str):
         """
@@ -40,8 +91,8 @@ class NavigationController(QObject):
         Logs the highlighted tab and updates the bottom nav in the new screen if available.
         """
         logging.debug(f"on_tab_clicked(): Received request to switch to tab '{tab_name}'.")
-        if tab_name in self.tab_screens:
-            screen = self.tab_screens[tab_name]
+        screen = self.screen(tab_name)
+        if screen is not None:
             self.stacked_widget.setCurrentWidget(screen)
             logging.debug(f"on_tab_clicked(): Successfully switched to tab screen '{tab_name}'.")
             # Attempt to update the bottom navigation on the new screen
@@ -61,12 +112,29 @@ class NavigationController(QObject):
         """
         Adds a dynamic screen (e.g., product details) to the stacked widget and displays it.
         Dynamic screens are not kept in history since the back button always routes to home.
+        Adding a screen that is already on the stack just shows it again. Beyond
+        max_dynamic_screens, the least recently shown one is evicted with deleteLater().
         """
         logging.debug(f"add_screen(): Adding dynamic screen '{screen_name}'.")
-        self.stacked_widget.addWidget(widget)
+        if widget in self.dynamic_screens:
+            self.dynamic_screens.move_to_end(widget)
+        else:
+            self.dynamic_screens[widget] = screen_name
+            self.stacked_widget.addWidget(widget)
         self.stacked_widget.setCurrentWidget(widget)
+        while len(self.dynamic_screens) > self.max_dynamic_screens:
+            self.evict_screen(next(iter(self.dynamic_screens)))
         logging.debug(f"add_screen(): Dynamic screen '{screen_name}' added and displayed.")
 
+    def evict_screen(self, widget):
+        """
+        Remove a dynamic screen from the stacked widget and schedule its deletion.
+        """
+        name = self.dynamic_screens.pop(widget)
+        self.stacked_widget.removeWidget(widget)
+        widget.deleteLater()
+        logging.debug(f"evict_screen(): Dynamic screen '{name}' evicted.")
+
     @pyqtSlot()
     def on_back_clicked(self):
         """
@@ -74,8 +142,8 @@ class NavigationController(QObject):
         Always routes back to the registered 'home' screen and updates the bottom nav.
         """
         logging.debug("on_back_clicked(): Back button pressed; attempting to switch to 'home' screen.")
-        if "home" in self.tab_screens:
-            home_screen = self.tab_screens["home"]
+        home_screen = self.screen("home")
+        if home_screen is not None:
             self.stacked_widget.setCurrentWidget(home_screen)
             logging.debug("on_back_clicked(): Successfully switched to 'home' screen.")
             # Update the bottom navigation on the home screen if available.
@@ -0,0 +1,141 @@
+# controller/recommendation_runner.py
+import logging
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+
+class _TaskSignals(QObject):
+    # (request id, recommendations or None, error message or None)
+    done = pyqtSignal(int, object, object)
+    # (request id, cached recommendations), sent before the real work starts
+    fallback = pyqtSignal(int, object)
+
+
+class _RecommendationTask(QRunnable):
+    """
+    Runs analyzeBehavior + getRecommendations off the GUI thread. The cached
+    result for the query, if any, is looked up first (on the same thread, so
+    it never races with the profile updates) and reported as a fallback.
+    """
+
+    def __init__(self, request_id, algorithm, user, prefs, fltrs):
+        super().__init__()
+        self.request_id = request_id
+        self.algorithm = algorithm
+        self.user = user
+        self.prefs = prefs
+        self.fltrs = fltrs
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            cached = self.algorithm.cached_recommendations(
+                self.user, self.prefs, self.fltrs
+            )
+            if cached is not None:
+                self.signals.fallback.emit(self.request_id, cached)
+            self.algorithm.analyzeBehavior(self.user)
+            recs = self.algorithm.getRecommendations(self.user, self.prefs, self.fltrs)
+        except Exception as e:
+            logging.error(f"_RecommendationTask.run(): {e}")
+            self.signals.done.emit(self.request_id, None, str(e))
+            return
+        self.signals.done.emit(self.request_id, recs, None)
+
+
+class RecommendationRunner(QObject):
+    """
+    Computes recommendations on a worker thread and delivers them through
+    signals on the GUI thread.
+
+      - Only the newest request is answered; a new request() removes any
+        task still waiting in the pool and ignores late results of older ones.
+      - If a request is not answered within `budget_ms`, the cached result
+        for the same query (or the popular items) is delivered with
+        `fallback=True`. The fresh result still follows, with
+        `fallback=False`, when it is ready.
+    Everything that reads or updates user profiles runs in the pool, which
+    has a single thread. The GUI thread only reads the precomputed popular
+    items, which do not depend on any profile.
+    """
+
+    # (recommendations, fallback)
+    finished = pyqtSignal(list, bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, algorithm, budget_ms: int = 300, parent=None):
+        super().__init__(parent)
+        self.algorithm = algorithm
+        self.budget_ms = budget_ms
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._request_id = 0
+        self._answered = True
+        self._pending_task = None
+        # Python references to tasks that have not reported back yet. The
+        # last finished task is held one round longer, as its run() may still
+        # be returning when its signal arrives.
+        self._tasks = {}
+        self._last_finished = None
+        self._query = None
+        self._fallback = None
+        self._budget_timer = QTimer(self)
+        self._budget_timer.setSingleShot(True)
+        self._budget_timer.timeout.connect(self._on_budget_expired)
+
+    def request(self, user, prefs, fltrs):
+        """Start a new request, superseding any previous one."""
+        if self._pending_task is not None and self.pool.tryTake(self._pending_task):
+            # never started, so it will never report back
+            self._tasks.pop(self._pending_task.request_id, None)
+        self._request_id += 1
+        self._answered = False
+        self._query = (user, prefs, fltrs)
+        self._fallback = None
+        task = _RecommendationTask(self._request_id, self.algorithm, user, prefs, fltrs)
+        task.setAutoDelete(False)
+        task.signals.done.connect(self._on_task_done)
+        task.signals.fallback.connect(self._on_fallback_ready)
+        self._pending_task = task
+        self._tasks[task.request_id] = task
+        self.pool.start(task)
+        self._budget_timer.start(self.budget_ms)
+        logging.debug(f"RecommendationRunner.request(): started request {self._request_id}.")
+
+    @pyqtSlot(int, object, object)
+    def _on_task_done(self, request_id, recs, error):
+        self._last_finished = self._tasks.pop(request_id, None)
+        if request_id != self._request_id:
+            logging.debug(f"RecommendationRunner: dropping stale result {request_id}.")
+            return
+        self._pending_task = None
+        fallback_shown = self._answered
+        self._answered = True
+        self._budget_timer.stop()
+        if error is None:
+            # replaces the fallback, if one was shown
+            self.finished.emit(list(recs), False)
+        elif fallback_shown:
+            logging.warning(
+                f"RecommendationRunner: request {request_id} failed, keeping the fallback: {error}"
+            )
+        else:
+            self.failed.emit(error)
+
+    @pyqtSlot(int, object)
+    def _on_fallback_ready(self, request_id, recs):
+        if request_id == self._request_id:
+            self._fallback = recs
+
+    @pyqtSlot()
+    def _on_budget_expired(self):
+        if self._answered:
+            return
+        self._answered = True
+        _, _, fltrs = self._query
+        recs = self._fallback
+        if recs is None:
+            recs = self.algorithm.popular_recommendations(fltrs)
+        logging.debug(
+            f"RecommendationRunner: request {self._request_id} over budget, using fallback."
+        )
+        self.finished.emit(recs, True)
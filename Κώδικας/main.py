@@ -1,5 +1,7 @@
+import os
 import sys
 import logging
+import threading
 from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget
 from PyQt6.QtGui import QFont
 from colorama import Fore, Style, init
@@ -27,6 +29,10 @@ from controller.navigation_controller import NavigationController
 
 # Import custom widgets.
 from model.payment_method import PaymentMethod
+from service.order_repository import OrderRepository
+from service.order_state_store import OrderStateStore
+from service.provider_registry import default_registry
+from service.order_service import async_order_service
 
 from model.delivery_person import (
     DeliveryPerson,
@@ -36,7 +42,7 @@ from model.delivery_person import (
     WeakPasswordError,
 )
 from model.errors import MissingNameError
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QStandardPaths, QTimer
 from PyQt6.QtWidgets import QLabel, QMessageBox
 
 # ----------------------------------------------------------------
@@ -81,15 +87,51 @@ logging.debug(
 # ----------------------------------------------------------------
 
 
+def app_data_path(name: str) -> str:
+    """`name` inside the per-user application data directory (created if needed)."""
+    if os.path.isabs(name):
+        return name
+    base = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.AppDataLocation
+    )
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, name)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Taken from settings until the login flow knows who the customer is.
+        self.customer_id = SETTINGS["customer_id"]
+        self.order_repository = OrderRepository(app_data_path(SETTINGS["orders_db"]))
+        async_order_service.repository = self.order_repository
+        self.order_states = OrderStateStore(
+            app_data_path(SETTINGS["order_log"]), repository=self.order_repository
+        )
+        async_order_service.state_store = self.order_states
+        self.setup_payment_providers()
         self.initialize_window()
-        self.create_screens()
         self.setup_navigation_controller()
-        self.connect_signals()
         self.delivery_persons: list[DeliveryPerson] = []
 
+    def closeEvent(self, event):
+        """Flush and close the order stores before the window goes away."""
+        self.order_states.close()
+        self.order_repository.close()
+        super().closeEvent(event)
+
+    def setup_payment_providers(self):
+        """Route card payments by brand and keep provider health fresh in the background."""
+        self.provider_registry = default_registry()
+        async_order_service.registry = self.provider_registry
+        self.health_timer = QTimer(self)
+        self.health_timer.timeout.connect(
+            lambda: threading.Thread(
+                target=self.provider_registry.refresh_health, daemon=True
+            ).start()
+        )
+        self.health_timer.start(30_000)
+
     def initialize_window(self):
         """Set window title, size, and stylesheet."""
         self.setWindowTitle("SmartBite")
@@ -106,105 +148,149 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
-    def create_screens(self):
-        """Instantiate all application screens."""
-        self.login_screen = LoginScreen()
-        self.home_screen = HomeScreen()
-        self.search_screen = SearchScreen()
-        self.cart_screen = CartScreen()
-        self.messages_screen = MessagesScreen()
-        self.profile_screen = ProfileScreen()
-        self.register_screen = RegisterScreen()
-        self.edit_profile_screen = EditProfileScreen()
-        self.payment_methonds_screen = PaymentMethodsScreen()
-        self.add_card_dialog = AddCardDialog()
-        self.delivery_reg_screen = DeliveryRegistrationScreen()
-        self.recommendation_screen = RecommendationScreen()
-
     def setup_navigation_controller(self):
-        """Create and register tab screens with the NavigationController."""
+        """
+        Register every screen with the NavigationController as a factory.
+        Screens are built the first time they are shown; the likely next
+        tabs are pre-warmed after the first frame (see paintEvent).
+        """
         self.nav_controller = NavigationController(self.stacked_widget)
-        # Register persistent tab screens.
-        self.nav_controller.register_screen("home", self.home_screen)
-        self.nav_controller.register_screen("search", self.search_screen)
-        self.nav_controller.register_screen("cart", self.cart_screen)
-        self.nav_controller.register_screen("messages", self.messages_screen)
-        self.nav_controller.register_screen("profile", self.profile_screen)
-        self.nav_controller.register_screen("login", self.login_screen)
-        self.nav_controller.register_screen("register", self.register_screen)
-        self.nav_controller.register_screen("edit_profile", self.edit_profile_screen)
-        self.nav_controller.register_screen(
-            "payment_methonds", self.payment_methonds_screen
-        )
-        self.nav_controller.register_screen("add_card_dialog", self.add_card_dialog)
-        self.nav_controller.register_screen(
-            "delivery_register", self.delivery_reg_screen
-        )
-        self.nav_controller.register_screen(
-            "recommendations", self.recommendation_screen
+        self.product_details_screen = None
+        self.first_frame_painted = False
+        screen_factories = {
+            "login": self.create_login_screen,
+            "home": self.create_home_screen,
+            "search": self.create_search_screen,
+            "cart": self.create_cart_screen,
+            "messages": self.create_messages_screen,
+            "profile": self.create_profile_screen,
+            "register": self.create_register_screen,
+            "edit_profile": self.create_edit_profile_screen,
+            "payment_methonds": self.create_payment_methods_screen,
+            "add_card_dialog": self.create_add_card_dialog,
+            "delivery_register": self.create_delivery_reg_screen,
+            "recommendations": self.create_recommendation_screen,
+        }
+        for name, factory in screen_factories.items():
+            self.nav_controller.register_factory(name, factory)
+
+        # Start on the recommendations screen; it is the only one built up front.
+        self.stacked_widget.setCurrentWidget(
+            self.nav_controller.screen("recommendations")
         )
 
-        # Start by displaying the Home screen.
-        self.stacked_widget.setCurrentWidget(self.recommendation_screen)
+    def paintEvent(self, event):
+        """Once the first frame is painted, build the likely next tabs in idle time."""
+        super().paintEvent(event)
+        if not self.first_frame_painted:
+            self.first_frame_painted = True
+            QTimer.singleShot(
+                0,
+                lambda: self.nav_controller.prewarm("home", "search", "cart", "profile"),
+            )
 
-    def connect_signals(self):
-        """Connect signals between screens and the navigation controller."""
-        # Connect bottom nav signals from each tab screen to the navigation controller.
-        self.home_screen.bottom_nav.tab_clicked.connect(
-            self.nav_controller.on_tab_clicked
-        )
-        self.cart_screen.bottom_nav.tab_clicked.connect(
-            self.nav_controller.on_tab_clicked
-        )
-        self.messages_screen.bottom_nav.tab_clicked.connect(
-            self.nav_controller.on_tab_clicked
+    # ----------------------------------------------------------------
+    # Screen factories: each builds one screen and connects its signals.
+    # ----------------------------------------------------------------
+
+    def connect_bottom_nav(self, screen):
+        screen.bottom_nav.tab_clicked.connect(self.nav_controller.on_tab_clicked)
+
+    def create_login_screen(self):
+        self.login_screen = LoginScreen()
+        self.login_screen.loginSuccessful.connect(
+            lambda: self.nav_controller.on_tab_clicked("home")
         )
-        self.profile_screen.bottom_nav.tab_clicked.connect(
-            self.nav_controller.on_tab_clicked
+        self.login_screen.goToRegister.connect(
+            lambda: self.nav_controller.on_tab_clicked("register")
         )
+        return self.login_screen
 
+    def create_home_screen(self):
+        self.home_screen = HomeScreen()
+        self.connect_bottom_nav(self.home_screen)
         # Connect product click signal from HomeScreen's product grid to show product details.
         self.home_screen.product_grid.productClicked.connect(self.show_product_details)
         self.home_screen.top_bar.searchClicked.connect(
             lambda: self.nav_controller.on_tab_clicked("search")
         )
+        self.home_screen.top_bar.searchClicked.connect(
+            lambda: self.nav_controller.on_tab_clicked("recommendations")
+        )
+        return self.home_screen
 
-        # Connect back button signals for dynamic screens.
-        self.profile_screen.backClicked.connect(self.nav_controller.on_back_clicked)
+    def create_search_screen(self):
+        self.search_screen = SearchScreen(
+            repository=self.order_repository, customer_id=self.customer_id
+        )
+        self.search_screen.back.connect(self.nav_controller.on_back_clicked)
+        return self.search_screen
+
+    def create_cart_screen(self):
+        self.cart_screen = CartScreen(first_order=self.is_first_order())
+        self.connect_bottom_nav(self.cart_screen)
         self.cart_screen.backClicked.connect(self.nav_controller.on_back_clicked)
+        return self.cart_screen
+
+    def is_first_order(self) -> bool:
+        """True if the signed-in customer has no orders yet (False while unknown)."""
+        if self.customer_id is None:
+            return False
+        orders, _ = self.order_repository.recent(self.customer_id, limit=1)
+        return not orders
+
+    def create_messages_screen(self):
+        self.messages_screen = MessagesScreen()
+        self.connect_bottom_nav(self.messages_screen)
         self.messages_screen.backClicked.connect(self.nav_controller.on_back_clicked)
-        self.search_screen.back.connect(self.nav_controller.on_back_clicked)
-        self.edit_profile_screen.back.connect(self.nav_controller.on_back_clicked)
-        self.payment_methonds_screen.back.connect(self.nav_controller.on_back_clicked)
-        self.delivery_reg_screen.backClicked.connect(
-            self.nav_controller.on_back_clicked
-        )
-        self.delivery_reg_screen.registerClicked.connect(self.handle_new_deliveryman)
-        # Connect LoginScreen navigation signals.
-        self.login_screen.loginSuccessful.connect(
-            lambda: self.nav_controller.on_tab_clicked("home")
-        )
-        self.login_screen.goToRegister.connect(
-            lambda: self.nav_controller.on_tab_clicked("register")
+        return self.messages_screen
+
+    def create_profile_screen(self):
+        self.profile_screen = ProfileScreen(
+            repository=self.order_repository, customer_id=self.customer_id
         )
-        # Connect RegisterScreen navigation signals.
-        self.register_screen.goToLogin.connect(
+        self.connect_bottom_nav(self.profile_screen)
+        self.profile_screen.backClicked.connect(self.nav_controller.on_back_clicked)
+        self.profile_screen.signOutClicked.connect(
             lambda: self.nav_controller.on_tab_clicked("login")
         )
-        # Connect ProfileScreen sign out signal.
-        self.profile_screen.signOutClicked.connect(
+        return self.profile_screen
+
+    def create_register_screen(self):
+        self.register_screen = RegisterScreen()
+        self.register_screen.goToLogin.connect(
             lambda: self.nav_controller.on_tab_clicked("login")
         )
+        return self.register_screen
+
+    def create_edit_profile_screen(self):
+        self.edit_profile_screen = EditProfileScreen()
+        self.edit_profile_screen.back.connect(self.nav_controller.on_back_clicked)
+        return self.edit_profile_screen
 
+    def create_payment_methods_screen(self):
+        self.payment_methonds_screen = PaymentMethodsScreen()
+        self.payment_methonds_screen.back.connect(self.nav_controller.on_back_clicked)
         self.payment_methonds_screen.addNewCard.connect(self.open_add_card_dialog)
+        return self.payment_methonds_screen
+
+    def create_add_card_dialog(self):
+        self.add_card_dialog = AddCardDialog()
         self.add_card_dialog.saved.connect(self.handle_new_card)
+        return self.add_card_dialog
 
-        # from Home: when app starts, go to recommendations
-        self.home_screen.top_bar.searchClicked.connect(
-            lambda: self.nav_controller.on_tab_clicked("recommendations")
+    def create_delivery_reg_screen(self):
+        self.delivery_reg_screen = DeliveryRegistrationScreen()
+        self.delivery_reg_screen.backClicked.connect(
+            self.nav_controller.on_back_clicked
         )
-        # back from recommendations
+        self.delivery_reg_screen.registerClicked.connect(self.handle_new_deliveryman)
+        return self.delivery_reg_screen
+
+    def create_recommendation_screen(self):
+        self.recommendation_screen = RecommendationScreen()
         self.recommendation_screen.back.connect(self.nav_controller.on_back_clicked)
+        return self.recommendation_screen
 
     def open_add_card_dialog(self):
         """Show the AddCardDialog as a modal dialog."""
@@ -237,17 +323,24 @@ class MainWindow(QMainWindow):
             return
 
         # 2) add to PaymentMethodsScreen
-        self.payment_methonds_screen.add_payment_method(pm)
+        self.nav_controller.screen("payment_methonds").add_payment_method(pm)
 
     def show_product_details(self, product_data: dict):
         """
         Slot to handle a product click.
-        Creates a ProductDetailsScreen, connects its back signal,
-        and adds it as a dynamic screen.
+        A single ProductDetailsScreen is created on the first click and
+        rebound to each product after that, then shown as a dynamic screen.
         """
-        product_details_screen = ProductDetailsScreen(product_data)
-        product_details_screen.backClicked.connect(self.nav_controller.on_back_clicked)
-        self.nav_controller.add_screen("details", product_details_screen)
+        if self.product_details_screen is None:
+            self.product_details_screen = ProductDetailsScreen()
+            self.product_details_screen.backClicked.connect(
+                self.nav_controller.on_back_clicked
+            )
+            self.product_details_screen.productClicked.connect(
+                self.show_product_details
+            )
+        self.product_details_screen.set_product(product_data)
+        self.nav_controller.add_screen("details", self.product_details_screen)
         logging.debug("Product details screen displayed.")
 
     def handle_new_deliveryman(self, data: dict):
@@ -300,6 +393,7 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setApplicationName("SmartBite")  # names the app data directory
     window = MainWindow()
     window.show()
     logging.debug("Application started; MainWindow is now visible.")
@@ -0,0 +1,89 @@
+# model/behavior_profile.py
+from datetime import datetime, timedelta
+from typing import Dict
+
+from model.event_log import UserEvent
+
+
+class BehaviorProfile:
+    """
+    Per-user aggregates, updated incrementally from each UserEvent.
+
+    Keeps exponentially decayed counts per cuisine and meal type, a 24-bin
+    time-of-day histogram and a decayed mean of the prices of dishes the
+    user interacted with.
+
+    Decay is applied lazily: an event at time t is added with weight
+    2 ** ((t - t_ref) / half_life) instead of shrinking every stored value.
+    All stored values share the same scale, so shares and means are plain
+    ratios and an update is O(1). Values are rescaled only when the weight
+    grows too large (rarely, once per ~64 half-lives).
+    """
+
+    _RESCALE_EXPONENT = 64
+
+    def __init__(self, half_life: timedelta = timedelta(days=7)):
+        self.half_life = half_life.total_seconds()
+        self._t_ref = None
+        self.cuisine_counts: Dict[str, float] = {}
+        self.meal_counts: Dict[str, float] = {}
+        self.hour_histogram = [0.0] * 24
+        self._item_weight = 0.0
+        self._price_sum = 0.0
+        self.last_seen: datetime = None
+
+    def _weight(self, ts: float) -> float:
+        if self._t_ref is None:
+            self._t_ref = ts
+        exponent = (ts - self._t_ref) / self.half_life
+        if exponent > self._RESCALE_EXPONENT:
+            self._rescale(ts)
+            exponent = 0.0
+        return 2.0 ** exponent
+
+    def _rescale(self, ts: float) -> None:
+        factor = 2.0 ** (-(ts - self._t_ref) / self.half_life)
+        for counts in (self.cuisine_counts, self.meal_counts):
+            for key in counts:
+                counts[key] *= factor
+        self.hour_histogram = [v * factor for v in self.hour_histogram]
+        self._item_weight *= factor
+        self._price_sum *= factor
+        self._t_ref = ts
+
+    def update(self, e: UserEvent) -> None:
+        """Fold a single event into the profile."""
+        w = self._weight(e.timestamp.timestamp())
+        self.hour_histogram[e.timestamp.hour] += w
+        self.last_seen = e.timestamp
+        item = e.item
+        if item is None:
+            return
+        if item.cuisine:
+            self.cuisine_counts[item.cuisine] = self.cuisine_counts.get(item.cuisine, 0.0) + w
+        if item.meal_type:
+            self.meal_counts[item.meal_type] = self.meal_counts.get(item.meal_type, 0.0) + w
+        self._item_weight += w
+        self._price_sum += item.price * w
+
+    def cuisine_share(self, cuisine: str) -> float:
+        """Decayed fraction of item events for `cuisine` (0..1)."""
+        if not self._item_weight:
+            return 0.0
+        return self.cuisine_counts.get(cuisine, 0.0) / self._item_weight
+
+    def meal_share(self, meal_type: str) -> float:
+        """Decayed fraction of item events for `meal_type` (0..1)."""
+        if not self._item_weight:
+            return 0.0
+        return self.meal_counts.get(meal_type, 0.0) / self._item_weight
+
+    def mean_price(self) -> float:
+        """Decayed average price of the dishes the user interacted with."""
+        if not self._item_weight:
+            return 0.0
+        return self._price_sum / self._item_weight
+
+    def peak_hour(self) -> int:
+        """Hour of day (0-23) with the most decayed activity."""
+        return max(range(24), key=self.hour_histogram.__getitem__)
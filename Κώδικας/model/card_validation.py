@@ -0,0 +1,119 @@
+# model/card_validation.py
+import re
+from array import array
+from datetime import datetime
+from typing import Iterable, List, NamedTuple, Sequence
+
+from model.payment_method import detect_brand
+
+# Per-record result codes, in the order the checks run (first failure wins).
+OK = 0
+MISSING_HOLDER = 1
+MISSING_CVV = 2
+INVALID_NUMBER = 3  # not 16 digits
+LUHN_FAILED = 4
+BAD_EXPIRY_FORMAT = 5
+EXPIRED = 6
+
+ERROR_NAMES = (
+    "ok",
+    "missing_holder",
+    "missing_cvv",
+    "invalid_number",
+    "luhn_failed",
+    "bad_expiry_format",
+    "expired",
+)
+
+# What datetime.strptime(expiry, "%m/%y") accepts: "1/30" as well as "01/30".
+_EXPIRY = re.compile(r"(1[0-2]|0[1-9]|[1-9])/(\d\d)")
+# digit -> digit sum of twice that digit, for the Luhn positions that double
+_LUHN_DOUBLE = str.maketrans("0123456789", "0246813579")
+
+
+def luhn_ok(digits: str) -> bool:
+    """Luhn checksum of a string of ASCII digits."""
+    # summing the encoded bytes adds ord("0") == 48 per digit; subtract it back
+    doubled = digits[-2::-2].translate(_LUHN_DOUBLE)
+    total = sum(digits[::-2].encode()) + sum(doubled.encode()) - 48 * len(digits)
+    return total % 10 == 0
+
+
+class CardBatchResult(NamedTuple):
+    codes: array  # one result code ('B') per record
+    brands: List[str]  # detect_brand() of each number ("" if invalid)
+
+    def failures(self) -> List[int]:
+        """Indices of the records that did not validate."""
+        return [i for i, code in enumerate(self.codes) if code != OK]
+
+
+def validate_cards(
+    holders: Sequence[str],
+    numbers: Sequence[str],
+    expiries: Sequence[str],
+    cvvs: Sequence[str],
+    now: datetime = None,
+) -> CardBatchResult:
+    """
+    Validate many cards given as parallel sequences; nothing is raised.
+
+    Runs PaymentMethod.validate's checks, in the same order, against a
+    single `now`. Each distinct expiry string is parsed only once. Expiry
+    parsing follows strptime("%m/%y"): one- or two-digit months, and years
+    69-99 mean 1969-1999. Where the results can differ:
+      - spaces are removed from numbers first, as PaymentMethod's
+        constructor does before validate() sees them;
+      - numbers must be ASCII digits (str.isdigit also takes e.g. "²");
+      - a Luhn check runs after the length check (LUHN_FAILED);
+      - a card is valid through the last day of its expiry month, where
+        validate() rejects it from the 28th.
+    """
+    now = now or datetime.now()
+    current_month = now.year * 12 + now.month
+    expiry_months = {}  # expiry string -> year * 12 + month, or -1 if malformed
+    codes = array("B", bytes(len(numbers)))
+    brands = [""] * len(numbers)
+
+    for i, (holder, number, expiry, cvv) in enumerate(zip(holders, numbers, expiries, cvvs)):
+        if not holder or holder.isspace():
+            codes[i] = MISSING_HOLDER
+            continue
+        if not cvv:
+            codes[i] = MISSING_CVV
+            continue
+        number = number.replace(" ", "")
+        if len(number) != 16 or not (number.isascii() and number.isdigit()):
+            codes[i] = INVALID_NUMBER
+            continue
+        brands[i] = detect_brand(number)
+        if not luhn_ok(number):
+            codes[i] = LUHN_FAILED
+            continue
+        month = expiry_months.get(expiry)
+        if month is None:
+            m = _EXPIRY.fullmatch(expiry)
+            if m:
+                year = int(m[2])
+                year += 1900 if year >= 69 else 2000  # the strptime %y pivot
+                month = year * 12 + int(m[1])
+            else:
+                month = -1
+            expiry_months[expiry] = month
+        if month < 0:
+            codes[i] = BAD_EXPIRY_FORMAT
+        elif month < current_month:
+            codes[i] = EXPIRED
+    return CardBatchResult(codes, brands)
+
+
+def validate_methods(methods: Iterable, now: datetime = None) -> CardBatchResult:
+    """validate_cards() over PaymentMethod objects."""
+    methods = list(methods)
+    return validate_cards(
+        [m.holder for m in methods],
+        [m.number for m in methods],
+        [m.expiry for m in methods],
+        [m.cvv for m in methods],
+        now,
+    )
@@ -0,0 +1,160 @@
+# model/cart.py
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional
+
+from model.menu_item import MenuItem
+from model.money import Cents
+
+# Change kinds passed to listeners
+LINE_ADDED = "added"
+LINE_REMOVED = "removed"
+LINE_UPDATED = "updated"
+TOTALS_CHANGED = "totals"
+
+
+class CartLine:
+    """One product in the cart and how many of it."""
+
+    __slots__ = ("key", "item", "quantity")
+
+    def __init__(self, key: Hashable, item: MenuItem, quantity: int):
+        self.key = key
+        self.item = item
+        self.quantity = quantity
+
+    @property
+    def total_cents(self) -> Cents:
+        return self.item.price_cents * self.quantity
+
+
+class Cart:
+    """
+    Shopping cart whose totals are kept up to date incrementally.
+
+    Every add / remove / quantity change adjusts subtotal_cents and
+    item_count by the difference alone, so each costs O(1) however large
+    the cart is; subtotal_by_cuisine is maintained the same way. Delivery
+    is `delivery_fee_cents`, free once the subtotal reaches
+    `free_delivery_from_cents` (if set); the promo discount is set from
+    outside with set_discount().
+
+    Listeners registered with subscribe() are called as
+    listener(kind, line) after each change: kind is LINE_ADDED,
+    LINE_REMOVED or LINE_UPDATED with the affected line, or TOTALS_CHANGED
+    with line=None when only the fee or discount moved. The totals are
+    already updated when a listener runs.
+    """
+
+    def __init__(
+        self, delivery_fee_cents: Cents = 0, free_delivery_from_cents: Cents = None
+    ):
+        self.base_delivery_fee_cents = delivery_fee_cents
+        self.free_delivery_from_cents = free_delivery_from_cents
+        self._lines = OrderedDict()  # key -> CartLine, in the order added
+        self._listeners: List[Callable[[str, Optional[CartLine]], None]] = []
+        self.subtotal_cents: Cents = 0
+        self.subtotal_by_cuisine = {}  # cuisine -> cents, for category promos
+        self.item_count = 0
+        self.discount_cents: Cents = 0
+
+    # ---- listeners -----------------------------------------------------
+    def subscribe(self, listener: Callable[[str, Optional[CartLine]], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener) -> None:
+        self._listeners.remove(listener)
+
+    def _adjust(self, item: MenuItem, quantity_delta: int) -> None:
+        cents = item.price_cents * quantity_delta
+        self.subtotal_cents += cents
+        self.item_count += quantity_delta
+        by_cuisine = self.subtotal_by_cuisine
+        left = by_cuisine.get(item.cuisine, 0) + cents
+        if left:
+            by_cuisine[item.cuisine] = left
+        else:
+            by_cuisine.pop(item.cuisine, None)
+
+    def _emit(self, kind: str, line: Optional[CartLine]) -> None:
+        for listener in list(self._listeners):
+            listener(kind, line)
+
+    # ---- totals --------------------------------------------------------
+    @property
+    def delivery_fee_cents(self) -> Cents:
+        if not self._lines:
+            return 0
+        threshold = self.free_delivery_from_cents
+        if threshold is not None and self.subtotal_cents >= threshold:
+            return 0
+        return self.base_delivery_fee_cents
+
+    @property
+    def total_cents(self) -> Cents:
+        discount = min(self.discount_cents, self.subtotal_cents)
+        return self.subtotal_cents - discount + self.delivery_fee_cents
+
+    # ---- lines ---------------------------------------------------------
+    def __len__(self):
+        return len(self._lines)
+
+    def __iter__(self):
+        return iter(self._lines.values())
+
+    def __contains__(self, key):
+        return key in self._lines
+
+    def line(self, key: Hashable) -> Optional[CartLine]:
+        return self._lines.get(key)
+
+    def items(self) -> List[MenuItem]:
+        """One MenuItem per unit, as OrderService.place_order expects."""
+        return [line.item for line in self for _ in range(line.quantity)]
+
+    def add(self, item: MenuItem, quantity: int = 1, key: Hashable = None) -> CartLine:
+        """
+        Add `quantity` of `item`. Lines are keyed by `key` (default: the
+        item name); adding an item already in the cart raises its quantity.
+        """
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        key = item.name if key is None else key
+        line = self._lines.get(key)
+        if line is not None:
+            self.set_quantity(key, line.quantity + quantity)
+            return line
+        line = self._lines[key] = CartLine(key, item, quantity)
+        self._adjust(item, quantity)
+        self._emit(LINE_ADDED, line)
+        return line
+
+    def remove(self, key: Hashable) -> None:
+        line = self._lines.pop(key)
+        self._adjust(line.item, -line.quantity)
+        self._emit(LINE_REMOVED, line)
+
+    def set_quantity(self, key: Hashable, quantity: int) -> None:
+        """Change a line's quantity; 0 removes the line."""
+        if quantity < 0:
+            raise ValueError("quantity must not be negative")
+        if quantity == 0:
+            self.remove(key)
+            return
+        line = self._lines[key]
+        delta = quantity - line.quantity
+        if delta == 0:
+            return
+        line.quantity = quantity
+        self._adjust(line.item, delta)
+        self._emit(LINE_UPDATED, line)
+
+    def set_discount(self, cents: Cents) -> None:
+        if cents < 0:
+            raise ValueError("discount must not be negative")
+        if cents != self.discount_cents:
+            self.discount_cents = cents
+            self._emit(TOTALS_CHANGED, None)
+
+    def clear(self) -> None:
+        for key in list(self._lines):
+            self.remove(key)
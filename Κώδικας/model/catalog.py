@@ -0,0 +1,209 @@
+# model/catalog.py
+import heapq
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+from model.menu_item import MenuItem
+from model.preferences import Preferences
+from model.filters import Filters
+from model.behavior_profile import BehaviorProfile
+from model.geo import GeoGridIndex
+from model.geopoint import GeoPoint
+
+# Ranking weights: better rated, cheaper, closer and faster scores higher.
+RATING_WEIGHT = 1.0
+PRICE_WEIGHT = 0.1
+DISTANCE_WEIGHT = 0.2
+TIME_WEIGHT = 0.01
+# Bonus for cuisines / meal types the user keeps coming back to (share 0..1).
+AFFINITY_WEIGHT = 1.0
+
+
+# id(item) -> km from Filters.origin, for the located items in range
+Distances = Dict[int, float]
+
+
+def score_item(
+    item: MenuItem, profile: BehaviorProfile = None, distance: float = None
+) -> float:
+    """
+    Relevance score of a single item (higher is better). `distance`, if
+    given, replaces item.distance (e.g. measured from the customer).
+    """
+    if distance is None:
+        distance = item.distance
+    score = (
+        item.rating * RATING_WEIGHT
+        - item.price * PRICE_WEIGHT
+        - distance * DISTANCE_WEIGHT
+        - item.prep_time * TIME_WEIGHT
+    )
+    if profile is not None:
+        score += profile.cuisine_share(item.cuisine) * AFFINITY_WEIGHT
+        score += profile.meal_share(item.meal_type) * AFFINITY_WEIGHT
+    return score
+
+
+def matches(item: MenuItem, fltrs: Filters, distances: Distances = None) -> bool:
+    """
+    Whether `item` is within `fltrs`. With an origin, the distance limit is
+    checked against `distances` (MenuCatalog.distances_from) instead.
+    """
+    if item.price > fltrs.max_price or item.prep_time > fltrs.max_time:
+        return False
+    if distances is not None:
+        return id(item) in distances
+    return item.distance <= fltrs.max_distance
+
+
+def rank(
+    candidates: Iterable[MenuItem],
+    fltrs: Optional[Filters],
+    k: int,
+    profile: BehaviorProfile = None,
+    distances: Distances = None,
+) -> List[MenuItem]:
+    """
+    The `k` best-scoring `candidates` within `fltrs` (None keeps them all).
+    Pass `distances` when the filters have an origin: they decide the
+    distance limit and replace item.distance in the score. Ties keep the
+    order of `candidates`.
+    """
+    if fltrs is not None:
+        candidates = [m for m in candidates if matches(m, fltrs, distances)]
+    if distances is None:
+        return heapq.nsmallest(k, candidates, key=lambda m: -score_item(m, profile))
+    return heapq.nsmallest(
+        k, candidates, key=lambda m: -score_item(m, profile, distances[id(m)])
+    )
+
+
+class MenuCatalog:
+    """
+    Read-only collection of menu items, indexed once at load time.
+
+    Every item is filed under four keys: (cuisine, meal_type), (cuisine, None),
+    (None, meal_type) and (None, None), so a query with or without
+    preferences is a single dict lookup. Each key holds its items sorted by
+    price, which lets `max_price` be answered with a bisect instead of a scan.
+    """
+
+    def __init__(self, items: Iterable[MenuItem] = ()):
+        self.items: List[MenuItem] = sorted(items, key=lambda m: m.price)
+        self._index = {}
+        for item in self.items:
+            for key in (
+                (item.cuisine, item.meal_type),
+                (item.cuisine, None),
+                (None, item.meal_type),
+                (None, None),
+            ):
+                self._index.setdefault(key, []).append(item)
+        # parallel price lists for bisect
+        self._prices = {
+            key: [m.price for m in bucket] for key, bucket in self._index.items()
+        }
+        self._geo_index = None  # built on first nearby() call
+
+    def __len__(self):
+        return len(self.items)
+
+    def query(
+        self,
+        prefs: Optional[Preferences],
+        fltrs: Optional[Filters],
+        limit: Optional[int] = None,
+        distances: Distances = None,
+    ) -> List[MenuItem]:
+        """
+        Return the items matching `prefs` and `fltrs`, cheapest first.
+        Either argument may be None to skip that part of the match. If the
+        filters have an origin, items without a location never match;
+        `distances` saves looking them up again when already known.
+        """
+        key = (prefs.cuisine, prefs.meal_type) if prefs else (None, None)
+        bucket = self._index.get(key)
+        if not bucket:
+            return []
+        if fltrs is None:
+            return bucket[:limit]
+        if distances is None:
+            distances = self.distances_from(fltrs)
+
+        end = bisect_right(self._prices[key], fltrs.max_price)
+        result = []
+        for i in range(end):
+            item = bucket[i]
+            if item.prep_time > fltrs.max_time:
+                continue
+            if distances is not None:
+                if id(item) not in distances:
+                    continue
+            elif item.distance > fltrs.max_distance:
+                continue
+            result.append(item)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def nearby_rows(self, origin: GeoPoint, radius_km: float) -> List[Tuple[float, int]]:
+        """
+        (distance_km, row in self.items) for every located item within
+        `radius_km` of `origin`, nearest first. Uses a grid index, so only
+        items in nearby cells are measured.
+        """
+        index = self._geo_index
+        if index is None:
+            # published only once complete, so other threads never see it half built
+            index = GeoGridIndex(cell_km=1.0)
+            for row, item in enumerate(self.items):
+                if item.location is not None:
+                    index.insert(row, item.location)
+            self._geo_index = index
+        return index.within(origin, radius_km)
+
+    def nearby(self, origin: GeoPoint, radius_km: float) -> List[Tuple[float, MenuItem]]:
+        """(distance_km, item) for every located item within `radius_km`, nearest first."""
+        return [(d, self.items[row]) for d, row in self.nearby_rows(origin, radius_km)]
+
+    def distances_from(self, fltrs: Optional[Filters]) -> Optional[Distances]:
+        """
+        id(item) -> km from `fltrs.origin` for the items within
+        `fltrs.max_distance` of it, or None if the filters have no origin.
+        """
+        if fltrs is None or fltrs.origin is None:
+            return None
+        return {
+            id(item): d for d, item in self.nearby(fltrs.origin, fltrs.max_distance)
+        }
+
+    def top(
+        self,
+        prefs: Optional[Preferences],
+        fltrs: Optional[Filters],
+        k: int,
+        profile: BehaviorProfile = None,
+    ) -> List[MenuItem]:
+        """
+        Return the `k` best-scoring matches. Ties keep catalog (price) order.
+        """
+        distances = self.distances_from(fltrs)
+        candidates = self.query(prefs, fltrs, distances=distances)
+        return rank(candidates, None, k, profile, distances)
+
+
+def default_catalog() -> MenuCatalog:
+    """Small built-in catalog used until a real menu source is wired in."""
+    return MenuCatalog(
+        [
+            MenuItem("Greek Salad", 5.0, "salad.jpg", "Μεσογειακή", "Μεσημεριανό", 1.2, 15, 4.6),
+            MenuItem("Chicken Wrap", 7.5, "wrap.jpg", "Μεσογειακή", "Μεσημεριανό", 2.0, 20, 4.3),
+            MenuItem("Fruit Bowl", 4.0, "fruit.jpg", "Μεσογειακή", "Μεσημεριανό", 0.8, 10, 4.1),
+            MenuItem("Sea Bream Fillet", 14.0, "fish.jpg", "Μεσογειακή", "Βραδινό", 3.5, 40, 4.8),
+            MenuItem("Veggie Pizza", 8.0, "pizza.png", "Χορτοφαγική", "Μεσημεριανό", 2.5, 30, 4.4),
+            MenuItem("Falafel Bowl", 6.5, "falafel.jpg", "Χορτοφαγική", "Μεσημεριανό", 1.5, 15, 4.2),
+            MenuItem("Pad Thai", 9.5, "pad_thai.jpg", "Ασιατική", "Βραδινό", 4.0, 35, 4.5),
+            MenuItem("Ramen", 11.0, "ramen.jpg", "Ασιατική", "Βραδινό", 3.0, 30, 4.7),
+            MenuItem("Classic Burger", 9.5, "classic_burger.png", "Γρήγορο φαγητό", "Μεσημεριανό", 2.0, 20, 4.7),
+            MenuItem("Cheeseburger", 8.0, "cheeseburger.png", "Γρήγορο φαγητό", "Βραδινό", 3.0, 20, 4.9),
+        ]
+    )
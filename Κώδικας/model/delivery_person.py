@@ -2,6 +2,7 @@
 import re
 import uuid
 import hashlib
+import logging
 from model.person import Person
 from model.geopoint import GeoPoint
 from model.errors import (
@@ -37,6 +38,8 @@ class DeliveryPerson(Person):
         self.password_hash = self._hash_password(password)
         self.currentLocation: GeoPoint | None = None
         self.experience = experience
+        # Set by DispatchService.register(); notified of location and replies.
+        self.dispatcher = None
 
         # 1) Experience must be provided
         if experience is None or (
@@ -79,11 +82,17 @@ class DeliveryPerson(Person):
 
     # --- Your class‐diagram methods ---
     def acceptOrder(self, order: "Order"):
-        print(f"DeliveryPerson {self.id} accepted order {order.id}")
+        logging.debug(f"DeliveryPerson {self.id} accepted order {order.id}")
+        if self.dispatcher is not None:
+            self.dispatcher.on_accept(self, order)
 
     def rejectOrder(self, order: "Order"):
-        print(f"DeliveryPerson {self.id} rejected order {order.id}")
+        logging.debug(f"DeliveryPerson {self.id} rejected order {order.id}")
+        if self.dispatcher is not None:
+            self.dispatcher.on_reject(self, order)
 
     def updateLocation(self, loc: GeoPoint):
+        # Called for every GPS ping: no console output here.
         self.currentLocation = loc
-        print(f"DeliveryPerson {self.id} location set to {loc}")
+        if self.dispatcher is not None:
+            self.dispatcher.on_location(self, loc)
@@ -62,6 +62,18 @@ class PaymentDeclinedError(Exception):
     pass
 
 
+class PaymentTimeoutError(Exception):
+    """Raised when a payment provider does not answer in time, so the charge may still go through."""
+
+    pass
+
+
+class IdempotencyKeyReuseError(Exception):
+    """Raised when an idempotency key is reused for a different request."""
+
+    pass
+
+
 class MissingPaymentMethodError(Exception):
     """Raised when no payment method was supplied for an order."""
 
@@ -72,3 +84,21 @@ class MissingAddressError(Exception):
     """Raised when no delivery address was provided."""
 
     pass
+
+
+class InvalidOrderTransitionError(Exception):
+    """Raised when an order cannot move from its current status to the requested one."""
+
+    pass
+
+
+class InvalidPromoCodeError(Exception):
+    """Raised when a promo code is unknown or the cart does not qualify for it."""
+
+    pass
+
+
+class PaymentProviderUnavailableError(PaymentDeclinedError):
+    """Raised when no payment provider is available to take the transaction."""
+
+    pass
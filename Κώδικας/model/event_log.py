@@ -22,11 +22,17 @@ class UserEvent:
     Attributes:
       - type: str         # e.g. 'login', 'preference_submit'
       - timestamp: datetime
+      - user_id           # id of the Person, if known
+      - item: MenuItem    # the dish the event is about, if any
     """
 
-    def __init__(self, type: str, timestamp: datetime = None):
+    def __init__(
+        self, type: str, timestamp: datetime = None, user_id=None, item=None
+    ):
         self.type = type
         self.timestamp = timestamp or datetime.now()
+        self.user_id = user_id
+        self.item = item
 
     def __repr__(self):
         return f"<UserEvent type={self.type!r} timestamp={self.timestamp!r}>"
@@ -0,0 +1,87 @@
+# model/event_store.py
+from array import array
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from model.event_log import IEventRecorder, UserEvent
+
+
+class RingBufferEventRecorder(IEventRecorder):
+    """
+    Bounded, compact event store.
+
+    Events live in two preallocated typed arrays used as a ring buffer:
+      - event types interned to small ints ('H', 2 bytes each)
+      - timestamps as epoch seconds ('q', 8 bytes each)
+    Appending is O(1); once `capacity` is reached the oldest event is
+    overwritten. With a `retention` window, events older than
+    (newest timestamp - retention) are dropped as new ones arrive.
+    """
+
+    def __init__(self, capacity: int = 100_000, retention: Optional[timedelta] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.retention = int(retention.total_seconds()) if retention else None
+        self._types = array("H", bytes(2 * capacity))
+        self._times = array("q", bytes(8 * capacity))
+        self._head = 0  # next slot to write
+        self._size = 0
+        self._type_ids = {}
+        self._type_names = []
+
+    def _intern(self, type_name: str) -> int:
+        type_id = self._type_ids.get(type_name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            if type_id > 0xFFFF:
+                raise OverflowError("too many distinct event types")
+            self._type_ids[type_name] = type_id
+            self._type_names.append(type_name)
+        return type_id
+
+    def record(self, e: UserEvent) -> None:
+        ts = int(e.timestamp.timestamp())
+        self._types[self._head] = self._intern(e.type)
+        self._times[self._head] = ts
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        if self.retention is not None:
+            self._expire(ts - self.retention)
+
+    def _expire(self, cutoff: int) -> None:
+        # Drop from the oldest end; each event is dropped at most once.
+        tail = (self._head - self._size) % self.capacity
+        while self._size and self._times[tail] < cutoff:
+            tail = (tail + 1) % self.capacity
+            self._size -= 1
+
+    def __len__(self):
+        return self._size
+
+    def _slots(self) -> Iterator[int]:
+        tail = (self._head - self._size) % self.capacity
+        for i in range(self._size):
+            yield (tail + i) % self.capacity
+
+    def __iter__(self) -> Iterator[UserEvent]:
+        """Oldest first, rebuilt as UserEvent objects."""
+        for slot in self._slots():
+            yield UserEvent(
+                type=self._type_names[self._types[slot]],
+                timestamp=datetime.fromtimestamp(self._times[slot]),
+            )
+
+    def count(self, type_name: str, since: Optional[datetime] = None) -> int:
+        """Number of stored events of `type_name`, optionally only after `since`."""
+        type_id = self._type_ids.get(type_name)
+        if type_id is None:
+            return 0
+        cutoff = int(since.timestamp()) if since else None
+        return sum(
+            1
+            for slot in self._slots()
+            if self._types[slot] == type_id
+            and (cutoff is None or self._times[slot] >= cutoff)
+        )
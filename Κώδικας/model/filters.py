@@ -1,8 +1,16 @@
 # model/filters.py
 from dataclasses import dataclass
+from model.geopoint import GeoPoint
 
 @dataclass
 class Filters:
     max_price: float     # euros
     max_distance: float  # kilometers
     max_time: int        # minutes until meal
+    # Where the customer is. When set, max_distance is measured from here to
+    # each item's location; otherwise the item's stored distance is used.
+    origin: GeoPoint = None
+
+    def __post_init__(self):
+        if self.max_price < 0 or self.max_distance < 0 or self.max_time < 0:
+            raise ValueError("Filters must not be negative")
@@ -0,0 +1,143 @@
+# model/geo.py
+"""
+Distance math and a spatial index for GeoPoint.
+"""
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from model.geopoint import GeoPoint
+
+try:
+    import numpy as np
+except ImportError:  # vectorized helpers need NumPy
+    np = None
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+
+
+def haversine_km(a: GeoPoint, b: GeoPoint) -> float:
+    """Great-circle distance between two points in kilometers."""
+    return _haversine(a.latitude, a.longitude, b.latitude, b.longitude)
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    h = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, h)))
+
+
+def haversine_km_array(lats, lons, origin: GeoPoint):
+    """
+    Vectorized distance (km) from `origin` to every (lats[i], lons[i]).
+    Accepts anything NumPy can turn into float arrays.
+    """
+    if np is None:
+        raise ImportError("haversine_km_array requires NumPy")
+    phi1 = math.radians(origin.latitude)
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    dlmb = np.radians(np.asarray(lons, dtype=np.float64) - origin.longitude)
+    h = np.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(1.0, h)))
+
+
+class GeoGridIndex:
+    """
+    Uniform latitude/longitude grid of `cell_km` sized cells.
+
+    A radius query only visits the cells overlapping the search box and
+    computes exact distances for the points in them, instead of measuring
+    the distance to every point. Points can be moved cheaply, which makes
+    the index usable for live courier positions as well as static venues.
+    """
+
+    def __init__(self, cell_km: float = 1.0):
+        self.cell_km = cell_km
+        self._step = cell_km / KM_PER_DEGREE  # degrees per cell, both axes
+        self._cells: Dict[Tuple[int, int], Dict[Hashable, Tuple[float, float]]] = {}
+        self._where: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, key):
+        return key in self._where
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self._step)), int(math.floor(lon / self._step))
+
+    def insert(self, key: Hashable, point: GeoPoint) -> None:
+        """Add `key` at `point`, moving it if it is already indexed."""
+        cell = self._cell(point.latitude, point.longitude)
+        old = self._where.get(key)
+        if old is not None and old != cell:
+            bucket = self._cells[old]
+            del bucket[key]
+            if not bucket:
+                del self._cells[old]
+        self._cells.setdefault(cell, {})[key] = (point.latitude, point.longitude)
+        self._where[key] = cell
+
+    def remove(self, key: Hashable) -> None:
+        cell = self._where.pop(key, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+    def position(self, key: Hashable) -> Optional[GeoPoint]:
+        cell = self._where.get(key)
+        if cell is None:
+            return None
+        return GeoPoint(*self._cells[cell][key])
+
+    def within(self, center: GeoPoint, radius_km: float) -> List[Tuple[float, Hashable]]:
+        """(distance_km, key) of every point within `radius_km`, nearest first."""
+        lat, lon = center.latitude, center.longitude
+        dlat = radius_km / KM_PER_DEGREE
+        # meridians converge, so the longitude span widens towards the poles
+        max_lat = min(89.9, abs(lat) + dlat)
+        dlon = min(180.0, dlat / math.cos(math.radians(max_lat)))
+        i0, j0 = self._cell(lat - dlat, lon - dlon)
+        i1, j1 = self._cell(lat + dlat, lon + dlon)
+
+        found = []
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self._cells):
+            # huge radius: walking the occupied cells is cheaper
+            buckets = [
+                b for (i, j), b in self._cells.items() if i0 <= i <= i1 and j0 <= j <= j1
+            ]
+        else:
+            buckets = [
+                self._cells[(i, j)]
+                for i in range(i0, i1 + 1)
+                for j in range(j0, j1 + 1)
+                if (i, j) in self._cells
+            ]
+        for bucket in buckets:
+            for key, (plat, plon) in bucket.items():
+                d = _haversine(lat, lon, plat, plon)
+                if d <= radius_km:
+                    found.append((d, key))
+        found.sort(key=lambda t: t[0])
+        return found
+
+    def nearest(
+        self, center: GeoPoint, k: int = 1, max_radius_km: float = 50.0
+    ) -> List[Tuple[float, Hashable]]:
+        """
+        Up to `k` nearest points within `max_radius_km`, nearest first.
+        The search radius starts at one cell and doubles until enough
+        points are found.
+        """
+        radius = self.cell_km
+        while True:
+            found = self.within(center, min(radius, max_radius_km))
+            if len(found) >= k or radius >= max_radius_km:
+                return found[:k]
+            radius *= 2
@@ -0,0 +1,112 @@
+# model/idempotency_cache.py
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from model.errors import IdempotencyKeyReuseError
+from model.ttl_cache import TTLCache
+
+
+class IdempotencyCache:
+    """
+    Remembers the outcome of requests by idempotency key.
+
+    The first caller to claim() a key owns it and must finish with
+    resolve(), reject() or hold(); callers arriving meanwhile get the
+    owner's Future and wait on it. Successful results stay cached for `ttl`
+    seconds (at most `maxsize` keys); failures are handed to the waiters
+    and then forgotten, so the client may retry with the same key.
+
+    An attempt whose outcome is unknown (e.g. a payment timeout) is held:
+    every later claim gets its error instead of running the request again,
+    until it is reconciled with settle() or forget().
+
+    A key may carry a fingerprint of the request it stands for; claiming it
+    with a different fingerprint raises IdempotencyKeyReuseError.
+    Safe to use from several threads and event loops at once.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # key -> (fingerprint, result)
+        self.done = TTLCache(maxsize=maxsize, ttl=ttl, clock=clock)
+        # key -> (future, fingerprint)
+        self._in_flight: Dict[Hashable, Tuple[Future, Optional[str]]] = {}
+        # key -> (fingerprint, error); kept until reconciled, never expires
+        self._unknown: Dict[Hashable, Tuple[Optional[str], BaseException]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _check(key: Hashable, stored: Optional[str], fingerprint: Optional[str]) -> None:
+        if stored is not None and fingerprint is not None and stored != fingerprint:
+            raise IdempotencyKeyReuseError(
+                f"Idempotency key {key!r} was already used for a different request."
+            )
+
+    def claim(self, key: Hashable, fingerprint: str = None) -> Tuple[Future, bool]:
+        """Returns (future, owner). Only the owner should do the work."""
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is not None:
+                self._check(key, entry[1], fingerprint)
+                return entry[0], False
+            fut = Future()
+            unknown = self._unknown.get(key)
+            if unknown is not None:
+                self._check(key, unknown[0], fingerprint)
+                fut.set_exception(unknown[1])
+                return fut, False
+            stored = self.done.get(key)
+            if stored is not None:
+                self._check(key, stored[0], fingerprint)
+                fut.set_result(stored[1])
+                return fut, False
+            self._in_flight[key] = (fut, fingerprint)
+            return fut, True
+
+    def resolve(self, key: Hashable, result) -> None:
+        with self._lock:
+            fut, fingerprint = self._in_flight.pop(key)
+            self.done.put(key, (fingerprint, result))
+        fut.set_result(result)
+
+    def reject(self, key: Hashable, exc: BaseException) -> None:
+        with self._lock:
+            fut, _ = self._in_flight.pop(key)
+        fut.set_exception(exc)
+
+    def hold(self, key: Hashable, exc: BaseException) -> None:
+        """Finish an attempt whose outcome is unknown; repeats get `exc`."""
+        with self._lock:
+            fut, fingerprint = self._in_flight.pop(key)
+            self._unknown[key] = (fingerprint, exc)
+        fut.set_exception(exc)
+
+    def settle(self, key: Hashable, result) -> None:
+        """Reconciled as done: later claims get `result`."""
+        with self._lock:
+            fingerprint, _ = self._unknown.pop(key)
+            self.done.put(key, (fingerprint, result))
+
+    def forget(self, key: Hashable) -> None:
+        """Reconciled as not done: the key may be retried."""
+        with self._lock:
+            self._unknown.pop(key, None)
+
+    def unknown(self) -> list:
+        """Keys held with an unknown outcome, awaiting reconciliation."""
+        with self._lock:
+            return list(self._unknown)
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def stats(self) -> dict:
+        return dict(
+            self.done.stats(), in_flight=len(self._in_flight), unknown=len(self._unknown)
+        )
@@ -0,0 +1,118 @@
+# model/location_table.py
+from array import array
+from typing import Hashable, Iterable, List, Optional, Set, Tuple
+
+# (courier_id, latitude, longitude, epoch seconds)
+Ping = Tuple[Hashable, float, float, float]
+
+
+class LocationTable:
+    """
+    Latest position per courier plus a short track history, stored in
+    typed arrays.
+
+    Every courier gets a slot. Slot i holds its latest fix in
+    lat[i] / lon[i] / ts[i], and its last `track_len` accepted fixes in a
+    ring buffer at track_*[i * track_len : (i + 1) * track_len].
+    Pings older than the stored fix are dropped, so replays and
+    out-of-order batches cannot move a courier backwards.
+    """
+
+    def __init__(self, track_len: int = 16, initial_slots: int = 1024):
+        self.track_len = track_len
+        self._slots = {}
+        self._ids: List[Hashable] = []
+        self._capacity = 0
+        self.lat = array("d")
+        self.lon = array("d")
+        self.ts = array("d")
+        self.track_lat = array("d")
+        self.track_lon = array("d")
+        self.track_ts = array("d")
+        self._track_head = array("I")  # next write position per slot
+        self._track_size = array("I")
+        self._grow(initial_slots)
+
+    def _grow(self, new_capacity: int) -> None:
+        extra = new_capacity - self._capacity
+        self.lat.extend([0.0] * extra)
+        self.lon.extend([0.0] * extra)
+        self.ts.extend([float("-inf")] * extra)
+        self.track_lat.extend([0.0] * (extra * self.track_len))
+        self.track_lon.extend([0.0] * (extra * self.track_len))
+        self.track_ts.extend([0.0] * (extra * self.track_len))
+        self._track_head.extend([0] * extra)
+        self._track_size.extend([0] * extra)
+        self._capacity = new_capacity
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, courier_id):
+        return courier_id in self._slots
+
+    def slot(self, courier_id: Hashable) -> int:
+        """Slot of `courier_id`, allocating one on first sight."""
+        slot = self._slots.get(courier_id)
+        if slot is None:
+            slot = len(self._ids)
+            if slot >= self._capacity:
+                self._grow(max(1, self._capacity * 2))
+            self._slots[courier_id] = slot
+            self._ids.append(courier_id)
+        return slot
+
+    def ingest(self, pings: Iterable[Ping]) -> Set[Hashable]:
+        """
+        Apply a batch of pings. Returns the ids whose latest position
+        changed, each once however many pings it had in the batch.
+        """
+        changed = set()
+        slots = self._slots
+        lat, lon, ts = self.lat, self.lon, self.ts
+        t_lat, t_lon, t_ts = self.track_lat, self.track_lon, self.track_ts
+        heads, sizes, k = self._track_head, self._track_size, self.track_len
+        for courier_id, p_lat, p_lon, p_ts in pings:
+            slot = slots.get(courier_id)
+            if slot is None:
+                slot = self.slot(courier_id)  # grows the arrays in place
+            if p_ts <= ts[slot]:
+                continue
+            lat[slot] = p_lat
+            lon[slot] = p_lon
+            ts[slot] = p_ts
+            head = heads[slot]
+            pos = slot * k + head
+            t_lat[pos] = p_lat
+            t_lon[pos] = p_lon
+            t_ts[pos] = p_ts
+            heads[slot] = head + 1 if head + 1 < k else 0
+            if sizes[slot] < k:
+                sizes[slot] += 1
+            changed.add(courier_id)
+        return changed
+
+    def latest(self, courier_id: Hashable) -> Optional[Tuple[float, float, float]]:
+        """(lat, lon, ts) of the newest fix, or None if never seen."""
+        slot = self._slots.get(courier_id)
+        if slot is None or self._track_size[slot] == 0:
+            return None
+        return self.lat[slot], self.lon[slot], self.ts[slot]
+
+    def track(self, courier_id: Hashable) -> List[Tuple[float, float, float]]:
+        """Recent fixes of `courier_id`, oldest first."""
+        slot = self._slots.get(courier_id)
+        if slot is None:
+            return []
+        k = self.track_len
+        size = self._track_size[slot]
+        start = (self._track_head[slot] - size) % k
+        base = slot * k
+        return [
+            (
+                self.track_lat[base + (start + i) % k],
+                self.track_lon[base + (start + i) % k],
+                self.track_ts[base + (start + i) % k],
+            )
+            for i in range(size)
+        ]
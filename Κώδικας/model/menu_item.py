@@ -1,5 +1,7 @@
 # model/menu_item.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from model.geopoint import GeoPoint
+from model.money import Cents, to_cents
 
 
 @dataclass
@@ -7,3 +9,17 @@ class MenuItem:
     name: str
     price: float
     image: str  # just the filename under resources/images/
+    cuisine: str = ""  # e.g. "Μεσογειακή"
+    meal_type: str = ""  # e.g. "Μεσημεριανό"
+    distance: float = 0.0  # kilometers from the customer
+    prep_time: int = 0  # minutes until the meal is ready
+    rating: float = 0.0
+    location: GeoPoint = None  # where the restaurant is, if known
+    # Exact price, converted once whenever `price` is assigned, so totals
+    # read a plain int.
+    price_cents: Cents = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == "price":
+            object.__setattr__(self, "price_cents", to_cents(value))
+        object.__setattr__(self, name, value)
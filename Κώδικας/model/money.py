@@ -0,0 +1,39 @@
+# model/money.py
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Iterable, Union
+
+# Amounts are held as integer cents everywhere money is added up, so totals
+# are exact however many items they cover. Floats only appear at the edges
+# (MenuItem.price, provider APIs) and are converted once.
+Cents = int
+
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: Union[float, int, str, Decimal]) -> Cents:
+    """Euros -> cents, rounding half up (2.675 -> 268)."""
+    # str() gives the shortest repr of a float, i.e. what the user typed
+    value = Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP)
+    return int(value * 100)
+
+
+def from_cents(cents: Cents) -> float:
+    """Cents -> euros as a float, for APIs that take one."""
+    return cents / 100
+
+
+def sum_cents(items: Iterable) -> Cents:
+    """Exact total of anything with a `price_cents` attribute."""
+    return sum(item.price_cents for item in items)
+
+
+@lru_cache(maxsize=4096)
+def format_cents(cents: Cents, symbol: str = "€") -> str:
+    """
+    Display string such as "€10.00" or "-€1.50". Cached, since screens
+    render the same few prices over and over.
+    """
+    sign = "-" if cents < 0 else ""
+    euros, rest = divmod(abs(cents), 100)
+    return f"{sign}{symbol}{euros}.{rest:02d}"
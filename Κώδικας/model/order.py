@@ -1,12 +1,54 @@
 # model/order.py
 
+import threading
 import uuid
 from datetime import datetime
 
+from model.errors import InvalidOrderTransitionError
+from model.money import from_cents, to_cents
+
+# Lifecycle: pending -> confirmed -> preparing -> dispatched -> delivered,
+# with cancel allowed until the order leaves the kitchen.
+ORDER_STATUSES = (
+    "pending",
+    "confirmed",
+    "preparing",
+    "dispatched",
+    "delivered",
+    "canceled",
+)
+TRANSITIONS = {
+    "pending": ("confirmed", "canceled"),
+    "confirmed": ("preparing", "canceled"),
+    "preparing": ("dispatched", "canceled"),
+    "dispatched": ("delivered",),
+    "delivered": (),
+    "canceled": (),
+}
+
+# Serializes transitions of orders that no OrderStateStore tracks; tracked
+# orders are locked by their store. Kept out of Order so orders pickle.
+_untracked_lock = threading.Lock()
+
+
+def check_transition(order: "Order", new_status: str) -> None:
+    """Raise InvalidOrderTransitionError unless `order` may move to `new_status`."""
+    if new_status not in TRANSITIONS[order.status]:
+        raise InvalidOrderTransitionError(
+            f"Order {order.id} cannot go from {order.status} to {new_status}."
+        )
+
 
 class Order:
     """
-    Represents a customer order.
+    Represents a customer order. The total is kept in integer cents
+    (total_cents); total_amount is the same value in euros.
+
+    Status changes go through confirm/prepare/dispatch/deliver/cancel,
+    which check TRANSITIONS. If `journal` is set (an OrderStateStore), the
+    store applies the transition: it locks the order, appends the event to
+    its log and updates the repository before the status changes. The
+    journal is not pickled with the order.
     """
 
     def __init__(
@@ -15,19 +57,56 @@ class Order:
         total_amount: float,
         delivery_address: str,
         customer_note: str = None,
+        customer_id: str = None,
     ):
         self.id = uuid.uuid4()
         self.items = items
         self.total_amount = total_amount
         self.delivery_address = delivery_address
         self.customer_note = customer_note
+        self.customer_id = customer_id
         self.status = "pending"
         self.placedAt = datetime.now()
+        self.journal = None
+
+    @property
+    def total_amount(self) -> float:
+        return from_cents(self.total_cents)
+
+    @total_amount.setter
+    def total_amount(self, amount: float) -> None:
+        self.total_cents = to_cents(amount)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["journal"] = None
+        return state
+
+    def _transition(self, new_status: str) -> None:
+        journal = self.journal
+        if journal is not None:
+            journal.transition(self, new_status)
+            return
+        with _untracked_lock:
+            check_transition(self, new_status)
+            self.status = new_status
 
     def confirm(self):
         """Mark the order as successfully placed."""
-        self.status = "confirmed"
+        self._transition("confirmed")
+
+    def prepare(self):
+        """The restaurant started preparing the order."""
+        self._transition("preparing")
+
+    def dispatch(self):
+        """A courier picked the order up."""
+        self._transition("dispatched")
+
+    def deliver(self):
+        """The order reached the customer."""
+        self._transition("delivered")
 
     def cancel(self):
         """Mark the order as canceled."""
-        self.status = "canceled"
+        self._transition("canceled")
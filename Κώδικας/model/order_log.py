@@ -0,0 +1,143 @@
+# model/order_log.py
+import os
+import struct
+import threading
+import uuid
+import zlib
+from typing import Dict, Iterator, NamedTuple, Tuple
+
+from model.order import ORDER_STATUSES
+
+STATUS_CODES = {status: code for code, status in enumerate(ORDER_STATUSES)}
+
+# order id, old status, new status, epoch seconds, crc32 of the preceding bytes
+_RECORD = struct.Struct("<16sBBdI")
+_BODY = struct.Struct("<16sBBd")
+
+# magic, log offset covered, number of entries; then entries; then crc32
+_SNAP_HEADER = struct.Struct("<8sQQ")
+_SNAP_ENTRY = struct.Struct("<16sBd")
+_SNAP_MAGIC = b"ORDSNAP1"
+
+
+class OrderEvent(NamedTuple):
+    order_id: uuid.UUID
+    old_status: str
+    new_status: str
+    timestamp: float
+
+
+class OrderEventLog:
+    """
+    Append-only binary log of order status transitions.
+
+    Each event is a fixed 30-byte record (see _RECORD) carrying its own
+    CRC, so a record torn by a crash is detected on open and cut off.
+    Records are only ever appended; readers replay from any byte offset.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._truncate_torn_tail()
+        self._file = open(path, "ab")
+
+    def _truncate_torn_tail(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        valid = 0
+        for valid, _ in self._scan(0):
+            pass
+        if valid != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid)
+
+    def _scan(self, offset: int) -> Iterator[Tuple[int, OrderEvent]]:
+        """Yield (offset after record, event) for each intact record."""
+        size = _RECORD.size
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            while True:
+                raw = f.read(size)
+                if len(raw) < size:
+                    return
+                oid, old, new, ts, crc = _RECORD.unpack(raw)
+                if zlib.crc32(raw[: _BODY.size]) != crc:
+                    return
+                offset += size
+                yield offset, OrderEvent(
+                    uuid.UUID(bytes=oid), ORDER_STATUSES[old], ORDER_STATUSES[new], ts
+                )
+
+    def append(self, event: OrderEvent) -> int:
+        """Write one event; returns the log size (offset) after it."""
+        body = _BODY.pack(
+            event.order_id.bytes,
+            STATUS_CODES[event.old_status],
+            STATUS_CODES[event.new_status],
+            event.timestamp,
+        )
+        with self._lock:
+            self._file.write(body + zlib.crc32(body).to_bytes(4, "little"))
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            return self._file.tell()
+
+    def sync(self) -> None:
+        """Force everything appended so far to disk."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def replay(self, offset: int = 0) -> Iterator[OrderEvent]:
+        for _, event in self._scan(offset):
+            yield event
+
+    def size(self) -> int:
+        with self._lock:
+            return self._file.tell()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def write_snapshot(path: str, offset: int, state: Dict[uuid.UUID, Tuple[str, float]]) -> None:
+    """
+    Atomically write `state` (order id -> (status, timestamp)) as the view
+    of the log up to `offset`.
+    """
+    parts = [_SNAP_HEADER.pack(_SNAP_MAGIC, offset, len(state))]
+    parts.extend(
+        _SNAP_ENTRY.pack(oid.bytes, STATUS_CODES[status], ts)
+        for oid, (status, ts) in state.items()
+    )
+    data = b"".join(parts)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.write(zlib.crc32(data).to_bytes(4, "little"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: str) -> Tuple[int, Dict[uuid.UUID, Tuple[str, float]]]:
+    """(log offset, state) from a snapshot; (0, {}) if missing or damaged."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return 0, {}
+    body, crc = data[:-4], data[-4:]
+    if len(data) < _SNAP_HEADER.size + 4 or zlib.crc32(body) != int.from_bytes(crc, "little"):
+        return 0, {}
+    magic, offset, count = _SNAP_HEADER.unpack_from(body)
+    if magic != _SNAP_MAGIC or len(body) != _SNAP_HEADER.size + count * _SNAP_ENTRY.size:
+        return 0, {}
+    state = {}
+    for oid, code, ts in _SNAP_ENTRY.iter_unpack(body[_SNAP_HEADER.size:]):
+        state[uuid.UUID(bytes=oid)] = (ORDER_STATUSES[code], ts)
+    return offset, state
@@ -20,6 +20,17 @@ class MissingCardHolderError(Exception):
     pass
 
 
+def detect_brand(number: str) -> str:
+    """Card brand from the leading digit: "visa", "mastercard" or "card"."""
+    first = number.lstrip()[:1]
+    if first == "4":
+        return "visa"
+    if first == "5":
+        return "mastercard"
+    # fallback
+    return "card"
+
+
 class PaymentMethod:
     def __init__(self, holder: str, number: str, expiry: str, cvv: str):
         self.methodId = uuid.uuid4()
@@ -29,6 +40,10 @@ class PaymentMethod:
         self.expiry = expiry  # MM/YY
         self.cvv = cvv
 
+    @property
+    def brand(self) -> str:
+        return detect_brand(self.number)
+
     def masked_number(self):
         return f"**** **** **** {self.lastFour}"
 
@@ -1,14 +1,23 @@
 # model/payment_provider.py
+import asyncio
 
 
 class PaymentProvider:
     """
     Represents an external payment provider (e.g. Visa, PayPal).
+
+    `max_concurrency` caps the transactions in flight against this provider
+    and `timeout` (seconds) bounds each one; both are enforced by the async
+    order path (service/async_order_service.py).
     """
 
-    def __init__(self, name: str, apiKey: str):
+    def __init__(
+        self, name: str, apiKey: str, max_concurrency: int = 16, timeout: float = 10.0
+    ):
         self.name = name
         self.apiKey = apiKey
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
 
     def testConnection(self) -> bool:
         """
@@ -27,3 +36,15 @@ class PaymentProvider:
         if getattr(payment_method, "cvv", "") == "000":
             return False
         return True
+
+    async def testConnectionAsync(self) -> bool:
+        """Async counterpart of testConnection()."""
+        return await asyncio.to_thread(self.testConnection)
+
+    async def processTransactionAsync(self, payment_method, amount: float) -> bool:
+        """
+        Async counterpart of processTransaction().
+        Providers with a native async SDK should override this; the default
+        runs the blocking call on a worker thread.
+        """
+        return await asyncio.to_thread(self.processTransaction, payment_method, amount)
@@ -0,0 +1,235 @@
+# model/promo.py
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from model.cart import Cart
+from model.errors import InvalidPromoCodeError
+from model.money import Cents
+
+
+@dataclass
+class PromoRule:
+    """
+    A promo campaign as configured. Unset conditions do not apply.
+
+    The discount is `percent_off` % of the base plus `amount_off_cents`,
+    capped at `max_discount_cents` and at the base itself. The base is the
+    whole subtotal, or only the `cuisine` part of it for category promos.
+    """
+
+    code: str
+    percent_off: int = 0
+    amount_off_cents: Cents = 0
+    min_basket_cents: Cents = 0
+    cuisine: Optional[str] = None
+    first_order_only: bool = False
+    starts: Optional[datetime] = None
+    ends: Optional[datetime] = None
+    max_discount_cents: Optional[Cents] = None
+
+
+@dataclass
+class CartFacts:
+    """The cart attributes promo rules look at, read once per evaluation."""
+
+    subtotal_cents: Cents
+    subtotal_by_cuisine: Dict[str, Cents]
+    first_order: bool
+    now: datetime
+
+
+class CompiledPromo:
+    """
+    A PromoRule turned into closures, built once when the rule is added:
+      - applies(facts): every condition the rule sets, and nothing else
+      - active(now): just the time window, used when the engine rebuilds
+        its index
+      - discount(facts): cents off
+    """
+
+    __slots__ = ("rule", "applies", "active", "discount")
+
+    def __init__(self, rule: PromoRule):
+        self.rule = rule
+        self.applies = self._compile_predicate(rule)
+        self.active = self._compile_window(rule)
+        self.discount = self._compile_discount(rule)
+
+    @staticmethod
+    def _compile_window(rule: PromoRule) -> Callable[[datetime], bool]:
+        starts, ends = rule.starts, rule.ends
+        if starts is None and ends is None:
+            return lambda now: True
+        if starts is None:
+            return lambda now: now < ends
+        if ends is None:
+            return lambda now: now >= starts
+        return lambda now: starts <= now < ends
+
+    @staticmethod
+    def _compile_predicate(rule: PromoRule) -> Callable[[CartFacts], bool]:
+        checks = []
+        if rule.min_basket_cents:
+            minimum = rule.min_basket_cents
+            checks.append(lambda f: f.subtotal_cents >= minimum)
+        if rule.cuisine is not None:
+            cuisine = rule.cuisine
+            checks.append(lambda f: cuisine in f.subtotal_by_cuisine)
+        if rule.first_order_only:
+            checks.append(lambda f: f.first_order)
+        if rule.starts is not None or rule.ends is not None:
+            window = CompiledPromo._compile_window(rule)
+            checks.append(lambda f: window(f.now))
+
+        if not checks:
+            return lambda f: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda f: all(check(f) for check in checks)
+
+    @staticmethod
+    def _compile_discount(rule: PromoRule) -> Callable[[CartFacts], Cents]:
+        percent, amount, cap = rule.percent_off, rule.amount_off_cents, rule.max_discount_cents
+        if rule.cuisine is None:
+            base = lambda f: f.subtotal_cents
+        else:
+            cuisine = rule.cuisine
+            base = lambda f: f.subtotal_by_cuisine.get(cuisine, 0)
+
+        def discount(f: CartFacts) -> Cents:
+            b = base(f)
+            off = b * percent // 100 + amount
+            if cap is not None and off > cap:
+                off = cap
+            return min(off, b)
+
+        return discount
+
+
+class PromoEngine:
+    """
+    Holds the live promo campaigns and evaluates them against a Cart.
+
+    Rules are compiled on add() and indexed by the cart attributes they
+    depend on: by code, and by (cuisine, first_order_only) with each
+    bucket sorted by minimum basket. The buckets only hold campaigns
+    whose time window is open. They are rebuilt when the clock crosses
+    the next start or end of any campaign, or when campaigns change.
+
+    An evaluation therefore visits only the buckets for the cart's
+    cuisines and first-order flag, and bisects each one on the subtotal.
+    Every promo it touches qualifies; none is checked and then rejected.
+    """
+
+    def __init__(self, rules: Iterable[PromoRule] = (), clock: Callable[[], datetime] = datetime.now):
+        self._clock = clock
+        self._by_code: Dict[str, CompiledPromo] = {}
+        # (cuisine or None, first_order_only) -> (sorted minimums, promos)
+        self._buckets: Dict[Tuple[Optional[str], bool], Tuple[List[Cents], List[CompiledPromo]]] = {}
+        # the buckets are valid for valid_from <= now < valid_until
+        self._valid_from = self._valid_until = None
+        for rule in rules:
+            self.add(rule)
+
+    def __len__(self):
+        return len(self._by_code)
+
+    @staticmethod
+    def _normalize(code: str) -> str:
+        return code.strip().upper()
+
+    def add(self, rule: PromoRule) -> None:
+        self._by_code[self._normalize(rule.code)] = CompiledPromo(rule)
+        self._valid_until = None
+
+    def remove(self, code: str) -> None:
+        del self._by_code[self._normalize(code)]
+        self._valid_until = None
+
+    def _index(self, now: datetime) -> Dict:
+        if self._valid_until is not None and self._valid_from <= now < self._valid_until:
+            return self._buckets
+        valid_from, valid_until = datetime.min, datetime.max
+        buckets = {}
+        for promo in self._by_code.values():
+            rule = promo.rule
+            for edge in (rule.starts, rule.ends):
+                if edge is None:
+                    continue
+                if edge <= now:
+                    valid_from = max(valid_from, edge)
+                else:
+                    valid_until = min(valid_until, edge)
+            if promo.active(now):
+                buckets.setdefault((rule.cuisine, rule.first_order_only), []).append(promo)
+        self._buckets = {}
+        for key, promos in buckets.items():
+            promos.sort(key=lambda p: p.rule.min_basket_cents)
+            self._buckets[key] = ([p.rule.min_basket_cents for p in promos], promos)
+        self._valid_from, self._valid_until = valid_from, valid_until
+        return self._buckets
+
+    def facts(self, cart: Cart, first_order: bool = False, now: datetime = None) -> CartFacts:
+        return CartFacts(
+            cart.subtotal_cents,
+            cart.subtotal_by_cuisine,
+            first_order,
+            now if now is not None else self._clock(),
+        )
+
+    def _candidates(self, facts: CartFacts) -> Iterable[CompiledPromo]:
+        """Every promo the cart qualifies for."""
+        buckets = self._index(facts.now)
+        flags = (False, True) if facts.first_order else (False,)
+        for cuisine in (None, *facts.subtotal_by_cuisine):
+            for flag in flags:
+                bucket = buckets.get((cuisine, flag))
+                if bucket is not None:
+                    minimums, promos = bucket
+                    yield from islice(promos, bisect_right(minimums, facts.subtotal_cents))
+
+    def evaluate(
+        self, cart: Cart, first_order: bool = False, now: datetime = None
+    ) -> List[Tuple[PromoRule, Cents]]:
+        """Every promo the cart qualifies for, with its discount."""
+        facts = self.facts(cart, first_order, now)
+        return [(promo.rule, promo.discount(facts)) for promo in self._candidates(facts)]
+
+    def best(
+        self, cart: Cart, first_order: bool = False, now: datetime = None
+    ) -> Optional[Tuple[PromoRule, Cents]]:
+        """The qualifying promo with the largest discount, or None."""
+        facts = self.facts(cart, first_order, now)
+        best, best_off = None, 0
+        for promo in self._candidates(facts):
+            off = promo.discount(facts)
+            if off > best_off:
+                best, best_off = promo.rule, off
+        return (best, best_off) if best is not None else None
+
+    def discount_for(
+        self, code: str, cart: Cart, first_order: bool = False, now: datetime = None
+    ) -> Cents:
+        """
+        Discount of one entered code. Raises InvalidPromoCodeError if the
+        code is unknown or the cart does not qualify.
+        """
+        promo = self._by_code.get(self._normalize(code))
+        if promo is None:
+            raise InvalidPromoCodeError(f"Unknown promo code {code!r}.")
+        facts = self.facts(cart, first_order, now)
+        if not promo.applies(facts):
+            raise InvalidPromoCodeError(f"This cart does not qualify for {promo.rule.code}.")
+        return promo.discount(facts)
+
+
+def default_promos() -> List[PromoRule]:
+    """Campaigns offered by the app until they come from a backend."""
+    return [
+        PromoRule("WELCOME10", percent_off=10, first_order_only=True),
+        PromoRule("SAVE5", amount_off_cents=500, min_basket_cents=2000),
+        PromoRule("FASTFOOD20", percent_off=20, cuisine="Γρήγορο φαγητό", max_discount_cents=1000),
+    ]
@@ -1,38 +1,139 @@
 # model/recommendation_algorithm.py
-import random
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from model.preferences import Preferences
 from model.filters import Filters
 from model.menu_item import MenuItem
 from model.person import Person
+from model.catalog import MenuCatalog, default_catalog, matches, rank
 # from model.errors import CardExpiredError
 # from model.geopoint import GeoPoint
 from model.event_log import IEventRecorder, UserEvent
+from model.event_store import RingBufferEventRecorder
+from model.behavior_profile import BehaviorProfile
+from model.recommendation_batch import run_batch
+from model.recommendation_cache import RecommendationCache, normalize_filters
+
+try:
+    from model.catalog_columns import ColumnarCatalog
+except ImportError:  # NumPy not installed: fall back to the scalar path
+    ColumnarCatalog = None
 
 
 class RecommendationAlgorithm(IEventRecorder):
-    def __init__(self):
-        self.events: List[UserEvent] = []
+    def __init__(
+        self,
+        catalog: MenuCatalog = None,
+        limit: int = 20,
+        events: IEventRecorder = None,
+        cache: RecommendationCache = None,
+    ):
+        # Bounded store; an unbounded list would grow for the life of the process.
+        self.events = events if events is not None else RingBufferEventRecorder()
+        self.cache = cache if cache is not None else RecommendationCache()
+        # The catalog is indexed once here and shared by every query.
+        self.set_catalog(catalog if catalog is not None else default_catalog())
+        self.limit = limit
+        # Per-user aggregates, kept up to date by record().
+        self.profiles: Dict[object, BehaviorProfile] = {}
+
+    def set_catalog(self, catalog: MenuCatalog):
+        """Swap in a new catalog and drop every cached result."""
+        self.catalog = catalog
+        self.columns = ColumnarCatalog(catalog) if ColumnarCatalog else None
+        # Best overall items, used as a cheap fallback when a query is slow.
+        self.popular = catalog.top(None, None, 50)
+        self.cache.invalidate()
 
     def record(self, e: UserEvent):
-        self.events.append(e)
+        self.events.record(e)
+        if e.user_id is not None:
+            profile = self.profiles.get(e.user_id)
+            if profile is None:
+                profile = self.profiles[e.user_id] = BehaviorProfile()
+            profile.update(e)
+
+    def analyzeBehavior(self, user: Person) -> Optional[BehaviorProfile]:
+        """
+        Record a login for `user` and return their behavior profile.
+        The profile is maintained incrementally, so no history is rescanned.
+        """
+        user_id = user.id if user is not None else None
+        self.record(UserEvent(type="login", timestamp=None, user_id=user_id))
+        return self.profiles.get(user_id)
+
+    def profile(self, user: Person) -> Optional[BehaviorProfile]:
+        if user is None:
+            return None
+        return self.profiles.get(user.id)
+
+    def _candidates(self, prefs: Preferences, fltrs: Filters, compute: bool = True):
+        """
+        Cached, non-personalized candidates for the bucket of `fltrs`: row
+        numbers with the columnar catalog, items otherwise. None when not
+        cached and `compute` is False.
+        """
+        bucket = normalize_filters(fltrs)
+        key = self.cache.key(prefs, bucket)
+        if not compute:
+            return self.cache.peek(key)
+        candidates = self.cache.get(key)
+        if candidates is None:
+            if self.columns is not None:
+                candidates = self.columns.rows(prefs, bucket)
+            else:
+                candidates = tuple(self.catalog.query(prefs, bucket))
+            self.cache.put(key, candidates)
+        return candidates
 
-    def analyzeBehavior(self, user: Person):
-        # stub: record login event
-        self.record(UserEvent(type="login", timestamp=None))
-        # possibly analyze past events here
-        return
+    def _rank(self, candidates, fltrs: Filters, profile: BehaviorProfile):
+        if self.columns is not None:
+            return self.columns.rank(candidates, fltrs, self.limit, profile)
+        distances = self.catalog.distances_from(fltrs)
+        return rank(candidates, fltrs, self.limit, profile, distances)
+
+    def cached_recommendations(
+        self, user: Person, prefs: Preferences, fltrs: Filters
+    ) -> Optional[List[MenuItem]]:
+        """
+        Result for this query if its candidates are cached, or None. Only
+        ranks the cached candidates; never queries the catalog.
+        """
+        candidates = self._candidates(prefs, fltrs, compute=False)
+        if candidates is None:
+            return None
+        return self._rank(candidates, fltrs, self.profile(user))
+
+    def popular_recommendations(self, fltrs: Filters) -> List[MenuItem]:
+        """Precomputed popular items that satisfy `fltrs`."""
+        if fltrs is None:
+            return self.popular[: self.limit]
+        distances = self.catalog.distances_from(fltrs)
+        return [m for m in self.popular if matches(m, fltrs, distances)][: self.limit]
 
     def getRecommendations(
         self, user: Person, prefs: Preferences, fltrs: Filters
     ) -> List[MenuItem]:
-        # In real life, call AI service here.
-        # We'll just return 4 dummy MenuItems that roughly match filters.
-        sample = [
-            MenuItem(name="Greek Salad", price=5.0, image="salad.jpg"),
-            MenuItem(name="Chicken Wrap", price=7.5, image="wrap.jpg"),
-            MenuItem(name="Veggie Pizza", price=8.0, image="pizza.jpg"),
-            MenuItem(name="Fruit Bowl", price=4.0, image="fruit.jpg"),
-        ]
-        # filter by max_price
-        return [m for m in sample if m.price <= fltrs.max_price]
+        # Best-scoring matching items first, capped at `limit`.
+        # Candidates are cached per filter bucket (rounded up), so
+        # near-identical queries share the catalog filtering; the exact limits
+        # and the user's own profile are applied to them on every call.
+        candidates = self._candidates(prefs, fltrs)
+        return self._rank(candidates, fltrs, self.profile(user))
+
+    def getRecommendationsBatch(
+        self,
+        requests: Iterable[Tuple[Person, Preferences, Filters]],
+        workers: Optional[int] = None,
+        chunk_size: int = 512,
+    ) -> Iterator[List[MenuItem]]:
+        """
+        Recommendations for many (user, prefs, filters) triples, e.g. for
+        nightly precomputation. Yields one list per triple, in input order.
+        Requests sharing preferences and filters share the catalog filtering;
+        chunks run on a process pool (`workers=None` uses every CPU,
+        `workers=0` stays in this process). Results bypass the cache.
+        """
+        shipped = (
+            (prefs, fltrs, self.profile(user)) for user, prefs, fltrs in requests
+        )
+        return run_batch(self.catalog, shipped, self.limit, workers, chunk_size)
@@ -0,0 +1,112 @@
+# model/recommendation_batch.py
+"""
+Batch recommendation helpers used by RecommendationAlgorithm.getRecommendationsBatch.
+
+Requests are processed in chunks. Inside a chunk, requests with the same
+preferences and normalized filters share one catalog filtering pass; the
+exact filters and the per-user scoring are applied per request. Chunks run on a process pool whose
+workers receive the catalog once, through the pool initializer.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from model.behavior_profile import BehaviorProfile
+from model.catalog import MenuCatalog, rank
+from model.filters import Filters
+from model.menu_item import MenuItem
+from model.preferences import Preferences
+from model.recommendation_cache import normalize_filters
+
+try:
+    from model.catalog_columns import ColumnarCatalog
+except ImportError:  # NumPy not installed: fall back to the scalar path
+    ColumnarCatalog = None
+
+# (preferences, filters, profile) as shipped to a worker
+BatchRequest = Tuple[Optional[Preferences], Optional[Filters], Optional[BehaviorProfile]]
+
+_worker_catalog = None
+_worker_columns = None
+_worker_rows = None
+
+
+def init_worker(catalog: MenuCatalog) -> None:
+    """Pool initializer: index the catalog once per worker process."""
+    global _worker_catalog, _worker_columns, _worker_rows
+    _worker_catalog = catalog
+    _worker_columns = ColumnarCatalog(catalog) if ColumnarCatalog else None
+    _worker_rows = {id(m): i for i, m in enumerate(catalog.items)}
+
+
+def rank_chunk(chunk: List[BatchRequest], limit: int) -> List[List[int]]:
+    """
+    Answer a chunk of requests, filtering once per distinct query.
+    Results are row numbers into catalog.items, which keeps the data sent
+    back to the parent process small.
+    """
+    groups = {}
+    for i, (prefs, fltrs, profile) in enumerate(chunk):
+        bucket = normalize_filters(fltrs)
+        key = (
+            (prefs.cuisine, prefs.meal_type) if prefs else None,
+            (bucket.max_price, bucket.max_distance, bucket.max_time) if bucket else None,
+        )
+        groups.setdefault(key, (prefs, bucket, []))[2].append(i)
+
+    results = [None] * len(chunk)
+    for prefs, bucket, indices in groups.values():
+        if _worker_columns is not None:
+            candidates = _worker_columns.rows(prefs, bucket)
+        else:
+            candidates = _worker_catalog.query(prefs, bucket)
+        for i in indices:
+            _, fltrs, profile = chunk[i]
+            if _worker_columns is not None:
+                top = _worker_columns.rank(candidates, fltrs, limit, profile)
+            else:
+                distances = _worker_catalog.distances_from(fltrs)
+                top = rank(candidates, fltrs, limit, profile, distances)
+            results[i] = [_worker_rows[id(m)] for m in top]
+    return results
+
+
+def run_batch(
+    catalog: MenuCatalog,
+    requests: Iterable[BatchRequest],
+    limit: int,
+    workers: Optional[int],
+    chunk_size: int,
+) -> Iterator[List[MenuItem]]:
+    """
+    Yield one result list per request, in input order. At most
+    2 * workers chunks are in flight, so memory stays flat however long
+    `requests` is. workers=0 runs everything in the calling process.
+    """
+    items = catalog.items
+    requests = iter(requests)
+    chunks = iter(lambda: list(islice(requests, chunk_size)), [])
+
+    if workers == 0:
+        init_worker(catalog)
+        for chunk in chunks:
+            for rows in rank_chunk(chunk, limit):
+                yield [items[r] for r in rows]
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(catalog,)
+    ) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(rank_chunk, chunk, limit))
+            if len(in_flight) < 2 * workers:
+                continue
+            for rows in in_flight.popleft().result():
+                yield [items[r] for r in rows]
+        while in_flight:
+            for rows in in_flight.popleft().result():
+                yield [items[r] for r in rows]
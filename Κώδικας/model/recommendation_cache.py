@@ -0,0 +1,74 @@
+# model/recommendation_cache.py
+import math
+from typing import Optional, Sequence, Tuple
+
+from model.filters import Filters
+from model.preferences import Preferences
+from model.ttl_cache import TTLCache
+
+# Bucket widths used to normalise filters before they become cache keys.
+PRICE_STEP = 0.5  # euros
+DISTANCE_STEP = 0.5  # kilometers
+TIME_STEP = 5  # minutes
+
+
+def _ceil_to(value: float, step: float) -> float:
+    return math.ceil(value / step) * step
+
+
+def normalize_filters(fltrs: Optional[Filters]) -> Optional[Filters]:
+    """
+    Round every limit *up* to its bucket, for use as a cache key only.
+    Candidates matching the normalized filters include every item matching
+    any query in the bucket; each query then applies its exact limits.
+    A distance measured from an origin is left to the exact pass, so the
+    bucket has no distance limit and no origin.
+    """
+    if fltrs is None:
+        return None
+    if fltrs.origin is not None:
+        max_distance = math.inf
+    else:
+        max_distance = _ceil_to(fltrs.max_distance, DISTANCE_STEP)
+    return Filters(
+        max_price=_ceil_to(fltrs.max_price, PRICE_STEP),
+        max_distance=max_distance,
+        max_time=int(_ceil_to(fltrs.max_time, TIME_STEP)),
+    )
+
+
+class RecommendationCache:
+    """
+    Memoizes the candidates of a query, keyed on (preferences, normalized
+    filters), with LRU + TTL eviction. Candidates are not personalized:
+    callers apply their exact filters and rank them per user. Call
+    invalidate() whenever the catalog changes.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, **kwargs):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, **kwargs)
+
+    @staticmethod
+    def key(prefs: Optional[Preferences], fltrs: Optional[Filters]) -> Tuple:
+        """Cache key of a query; `fltrs` should already be normalized."""
+        prefs_key = (prefs.cuisine, prefs.meal_type) if prefs else None
+        fltrs_key = (
+            (fltrs.max_price, fltrs.max_distance, fltrs.max_time) if fltrs else None
+        )
+        return prefs_key, fltrs_key
+
+    def get(self, key: Tuple) -> Optional[Sequence]:
+        return self._cache.get(key)
+
+    def peek(self, key: Tuple) -> Optional[Sequence]:
+        return self._cache.peek(key)
+
+    def put(self, key: Tuple, candidates: Sequence) -> None:
+        # callers pass an immutable sequence (tuple or read-only array)
+        self._cache.put(key, candidates)
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
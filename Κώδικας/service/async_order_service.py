@@ -0,0 +1,318 @@
+# service/async_order_service.py
+
+import asyncio
+import hashlib
+import logging
+import weakref
+from typing import Dict, List, Union
+
+from model.idempotency_cache import IdempotencyCache
+from model.money import Cents, from_cents, sum_cents
+from model.order import Order
+from model.errors import (
+    PaymentDeclinedError,
+    PaymentTimeoutError,
+    PaymentProviderUnavailableError,
+    MissingPaymentMethodError,
+    MissingAddressError,
+)
+
+
+def request_fingerprint(items: list, total: Cents, payment_method) -> str:
+    """
+    Digest of what an idempotency key stands for: the cart, its total and
+    the card (holder, last four digits and expiry; never the full number).
+    """
+    number = str(getattr(payment_method, "number", "")).replace(" ", "")
+    request = (
+        [(getattr(item, "name", None), item.price_cents) for item in items],
+        total,
+        getattr(payment_method, "holder", None),
+        number[-4:],
+        getattr(payment_method, "expiry", None),
+    )
+    return hashlib.sha256(repr(request).encode()).hexdigest()
+
+
+class ProviderPool:
+    """
+    Per-provider slot pool for one event loop: at most
+    `provider.max_concurrency` transactions are in flight at a time and each
+    caller stops waiting after `provider.timeout` seconds.
+
+    A transaction that times out keeps its slot until it really finishes:
+    the worker thread behind processTransactionAsync() cannot be stopped,
+    so freeing the slot early would let more than max_concurrency calls
+    reach the provider.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+        self._slots = asyncio.Semaphore(provider.max_concurrency)
+        self.in_flight = 0
+
+    async def charge(self, payment_method, amount: float) -> bool:
+        await self._slots.acquire()
+        self.in_flight += 1
+        try:
+            task = asyncio.ensure_future(
+                self.provider.processTransactionAsync(payment_method, amount)
+            )
+        except BaseException:
+            self._release()
+            raise
+        task.add_done_callback(self._finished)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.provider.timeout)
+        except asyncio.TimeoutError:
+            raise PaymentTimeoutError(
+                f"{self.provider.name} did not answer within {self.provider.timeout}s."
+            )
+
+    def _finished(self, task: asyncio.Future) -> None:
+        self._release()
+        if not task.cancelled() and task.exception() is not None:
+            # nobody may be waiting any more (timed out); just note it
+            logging.debug(
+                f"ProviderPool.charge(): {self.provider.name} failed: {task.exception()}"
+            )
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._slots.release()
+
+
+class AsyncOrderService:
+    """
+    Asyncio implementation of order placement; OrderService wraps it.
+    A single event loop can run thousands of checkouts concurrently, with
+    each provider limited through its own ProviderPool.
+    """
+
+    def __init__(
+        self,
+        idempotency: IdempotencyCache = None,
+        repository=None,
+        state_store=None,
+        registry=None,
+    ):
+        self.idempotency = idempotency if idempotency is not None else IdempotencyCache()
+        # optional OrderRepository; confirmed orders are saved to it
+        self.repository = repository
+        # optional OrderStateStore journaling every status transition
+        self.state_store = state_store
+        # optional ProviderRegistry for payment methods without a provider
+        self.registry = registry
+        # (provider, payment_method, amount) of charges that timed out and
+        # must be reconciled with that provider before anyone retries them
+        self.unsettled = []
+        # event loop -> {provider id -> pool}; asyncio primitives are per loop
+        self._pools = weakref.WeakKeyDictionary()
+
+    def pool_for(self, provider) -> ProviderPool:
+        pools: Dict[int, ProviderPool] = self._pools.setdefault(
+            asyncio.get_running_loop(), {}
+        )
+        pool = pools.get(id(provider))
+        if pool is None or pool.provider is not provider:
+            pool = pools[id(provider)] = ProviderPool(provider)
+        return pool
+
+    async def place_order(
+        self,
+        items: list,
+        payment_method,
+        address: str,
+        note: str = None,
+        idempotency_key: str = None,
+        customer_id: str = None,
+    ) -> Order:
+        """
+        Complete an order:
+          1) Validate that a payment method and address exist.
+          2) Calculate total.
+          3) Process payment via the method's provider.
+          4) On success, create & confirm an Order.
+        With an `idempotency_key`, repeats of a successful call return the
+        original Order without charging again.
+        """
+        self.validate(payment_method, address)
+        total = self.total(items)
+        return await self.once(
+            idempotency_key,
+            lambda: self.charge_and_build(
+                items, total, payment_method, address, note, customer_id
+            ),
+            request_fingerprint(items, total, payment_method),
+        )
+
+    async def once(self, key, place, fingerprint: str = None):
+        """
+        Await place() unless `key` already has (or is getting) a result.
+        After a PaymentTimeoutError the key is held: the charge may have gone
+        through, so repeats get that error until the idempotency cache is
+        reconciled (settle() or forget()) instead of charging again.
+        """
+        if key is None:
+            return await place()
+        fut, owner = self.idempotency.claim(key, fingerprint)
+        if not owner:
+            return await asyncio.wrap_future(fut)
+        try:
+            order = await place()
+        except PaymentTimeoutError as e:
+            self.idempotency.hold(key, e)
+            raise
+        except BaseException as e:
+            self.idempotency.reject(key, e)
+            raise
+        self.idempotency.resolve(key, order)
+        return order
+
+    async def charge_and_build(
+        self,
+        items: list,
+        total: Cents,
+        payment_method,
+        address: str,
+        note: str,
+        customer_id: str = None,
+    ) -> Order:
+        await self.charge(payment_method, total)
+        order = self.build(items, total, address, note, customer_id)
+        if self.repository is not None:
+            await asyncio.to_thread(self.repository.add, order)
+        return order
+
+    async def place_orders(
+        self, requests: List[dict], max_in_flight: int = 8
+    ) -> List[Union[Order, Exception]]:
+        """
+        Place many orders concurrently; see OrderService.place_orders.
+        Everything is validated and totalled before the first charge.
+        """
+        results: List[Union[Order, Exception, None]] = [None] * len(requests)
+        to_charge = []
+        for i, req in enumerate(requests):
+            try:
+                self.validate(req.get("payment_method"), req.get("address"))
+                to_charge.append((i, self.total(req["items"])))
+            except Exception as e:
+                results[i] = e
+
+        gate = asyncio.Semaphore(max_in_flight)
+
+        async def place(i, total):
+            req = requests[i]
+            async with gate:
+                try:
+                    return await self.once(
+                        req.get("idempotency_key"),
+                        lambda: self.charge_and_build(
+                            req["items"], total, req["payment_method"],
+                            req["address"], req.get("note"), req.get("customer_id"),
+                        ),
+                        request_fingerprint(req["items"], total, req["payment_method"]),
+                    )
+                except Exception as e:
+                    return e
+
+        charged = await asyncio.gather(*(place(i, t) for i, t in to_charge))
+        for (i, _), result in zip(to_charge, charged):
+            results[i] = result
+        return results
+
+    @staticmethod
+    def validate(payment_method, address: str) -> None:
+        # 1) Basic validation
+        if payment_method is None:
+            raise MissingPaymentMethodError("You must select a payment method.")
+        if not address or not address.strip():
+            raise MissingAddressError("A delivery address is required.")
+
+    @staticmethod
+    def total(items: list) -> Cents:
+        # 2) Total amount, exact in cents
+        return sum_cents(items)
+
+    async def charge(self, payment_method, total: Cents) -> None:
+        # 3) Charge; providers take euros
+        amount = from_cents(total)
+        provider = getattr(payment_method, "provider", None)
+        if provider is not None:
+            try:
+                success = await self.pool_for(provider).charge(payment_method, amount)
+            except PaymentTimeoutError:
+                self.unsettled.append((provider, payment_method, amount))
+                logging.warning(
+                    f"AsyncOrderService.charge(): {provider.name} timed out; "
+                    f"outcome of the {amount:.2f} charge is unknown."
+                )
+                raise
+        elif self.registry is not None and self.registry.route(payment_method):
+            success = await self.charge_with_failover(payment_method, amount)
+        else:
+            # assume payment_method itself can process
+            success = await asyncio.to_thread(
+                payment_method.processTransaction, payment_method, amount
+            )
+
+        if not success:
+            raise PaymentDeclinedError("Payment was declined by the provider.")
+
+    async def charge_with_failover(self, payment_method, amount: float) -> bool:
+        """
+        Try the registry's providers for this card in order.
+
+        Only errors raised before the request reached the provider (a
+        refused connection, an unavailable provider) move on to the next
+        one. A timeout leaves the outcome unknown, since the first charge
+        may still go through: it is recorded in `unsettled` for
+        reconciliation with that provider and PaymentTimeoutError is raised
+        without trying another. A decline is an answer and is returned as is.
+        """
+        last_error = None
+        for provider in self.registry.candidates(payment_method):
+            reported = False
+            try:
+                success = await self.pool_for(provider).charge(payment_method, amount)
+            except (ConnectionError, PaymentProviderUnavailableError) as e:
+                logging.debug(f"AsyncOrderService.charge(): {provider.name} failed: {e}")
+                self.registry.record_failure(provider)
+                reported = True
+                last_error = e
+                continue
+            except PaymentTimeoutError:
+                self.registry.record_failure(provider)
+                reported = True
+                self.unsettled.append((provider, payment_method, amount))
+                logging.warning(
+                    f"AsyncOrderService.charge(): {provider.name} timed out; "
+                    f"outcome of the {amount:.2f} charge is unknown, not failing over."
+                )
+                raise
+            except Exception:
+                self.registry.record_failure(provider)
+                reported = True
+                raise
+            else:
+                self.registry.record_success(provider)
+                reported = True
+                return success
+            finally:
+                if not reported:
+                    # cancelled mid-call: nothing was learned, free a half-open trial
+                    self.registry.release(provider)
+        raise PaymentProviderUnavailableError(
+            "No payment provider is available right now."
+        ) from last_error
+
+    def build(
+        self, items: list, total: Cents, address: str, note: str, customer_id: str = None
+    ) -> Order:
+        # 4) Create and confirm order
+        order = Order(items, from_cents(total), address, note, customer_id)
+        if self.state_store is not None:
+            self.state_store.track(order)
+        order.confirm()
+        return order
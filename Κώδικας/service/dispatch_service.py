@@ -0,0 +1,185 @@
+# service/dispatch_service.py
+import logging
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Set
+
+from model.delivery_person import DeliveryPerson
+from model.geo import GeoGridIndex
+from model.geopoint import GeoPoint
+from model.order import Order
+
+# Average urban speed per vehicle type, km/h.
+VEHICLE_SPEED_KMH = {
+    "Bicycle": 15.0,
+    "Motorbike": 30.0,
+    "Car": 25.0,
+    "Van": 22.0,
+}
+DEFAULT_SPEED_KMH = 20.0
+
+
+def eta_minutes(courier: DeliveryPerson, distance_km: float) -> float:
+    speed = VEHICLE_SPEED_KMH.get(courier.vehicle_type, DEFAULT_SPEED_KMH)
+    return distance_km / speed * 60.0
+
+
+class DispatchService:
+    """
+    Matches confirmed Orders to available DeliveryPersons by ETA to pickup.
+
+    Available couriers live in a GeoGridIndex kept current by
+    DeliveryPerson.updateLocation. Orders are queued by submit() and
+    assigned in batches by tick() every `batch_interval` seconds (or at
+    once with dispatch_pending()). Each order is offered to the courier with
+    the lowest ETA among the `candidates` nearest ones. A rejected order is
+    queued for a re-offer to the next-best courier; tick() re-offers on
+    every call, without waiting for the batch interval. Re-offers are made
+    in a loop, never from inside on_reject, so couriers that answer from
+    within on_offer cannot nest calls however many of them reject.
+    """
+
+    def __init__(
+        self,
+        cell_km: float = 1.0,
+        batch_interval: float = 3.0,
+        candidates: int = 8,
+        max_radius_km: float = 15.0,
+        on_offer: Callable[[DeliveryPerson, Order], None] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.batch_interval = batch_interval
+        self.candidates = candidates
+        self.max_radius_km = max_radius_km
+        self.on_offer = on_offer
+        self._clock = clock
+        self._last_batch = clock()
+        self.couriers: Dict[object, DeliveryPerson] = {}
+        self.available = GeoGridIndex(cell_km=cell_km)
+        self.pending = deque()  # orders waiting for the next batch
+        self.reoffers = deque()  # rejected orders waiting for the next tick
+        self.pickups: Dict[object, GeoPoint] = {}
+        self.offers: Dict[object, DeliveryPerson] = {}  # order id -> courier
+        self.assignments: Dict[object, DeliveryPerson] = {}  # order id -> courier
+        self._rejected: Dict[object, Set[object]] = {}  # order id -> courier ids
+        self._busy: Set[object] = set()  # couriers holding an offer or an order
+
+    # ---- couriers ------------------------------------------------------
+    def register(self, courier: DeliveryPerson) -> None:
+        """Start tracking `courier`; it is available once it has a location."""
+        courier.dispatcher = self
+        self.couriers[courier.id] = courier
+        if courier.currentLocation is not None:
+            self.available.insert(courier.id, courier.currentLocation)
+
+    def unregister(self, courier: DeliveryPerson) -> None:
+        courier.dispatcher = None
+        self.couriers.pop(courier.id, None)
+        self.available.remove(courier.id)
+
+    def on_location(self, courier: DeliveryPerson, loc: GeoPoint) -> None:
+        if courier.id in self.couriers and courier.id not in self._busy:
+            self.available.insert(courier.id, loc)
+
+    # ---- orders --------------------------------------------------------
+    def submit(self, order: Order, pickup: GeoPoint) -> None:
+        """Queue a confirmed order for the next dispatch batch."""
+        if order.status != "confirmed":
+            raise ValueError("Only confirmed orders can be dispatched")
+        self.pickups[order.id] = pickup
+        self.pending.append(order)
+
+    def tick(self) -> int:
+        """
+        Re-offer rejected orders, then run a batch if `batch_interval` has
+        passed. Returns orders offered.
+        """
+        offered = self.drain_reoffers()
+        now = self._clock()
+        if now - self._last_batch < self.batch_interval:
+            return offered
+        self._last_batch = now
+        return offered + self.dispatch_pending()
+
+    def dispatch_pending(self) -> int:
+        """
+        Offer every queued order to its best courier, oldest order first,
+        then re-offer any that were rejected meanwhile.
+        """
+        offered = 0
+        for _ in range(len(self.pending)):
+            order = self.pending.popleft()
+            if self._offer(order):
+                offered += 1
+            else:
+                self.pending.append(order)  # nobody free nearby; retry next batch
+        return offered + self.drain_reoffers()
+
+    def drain_reoffers(self) -> int:
+        """
+        Offer rejected orders to their next-best courier until none are
+        left. Orders nobody can take go back to the batch queue.
+        """
+        offered = 0
+        while self.reoffers:
+            order = self.reoffers.popleft()
+            if self._offer(order):
+                offered += 1
+            else:
+                self.pending.append(order)
+        return offered
+
+    def _best_courier(self, order: Order) -> Optional[DeliveryPerson]:
+        pickup = self.pickups[order.id]
+        rejected = self._rejected.get(order.id, ())
+        best, best_eta = None, None
+        for distance, courier_id in self.available.nearest(
+            pickup, k=self.candidates + len(rejected), max_radius_km=self.max_radius_km
+        ):
+            if courier_id in rejected:
+                continue
+            courier = self.couriers[courier_id]
+            eta = eta_minutes(courier, distance)
+            if best_eta is None or eta < best_eta:
+                best, best_eta = courier, eta
+        return best
+
+    def _offer(self, order: Order) -> bool:
+        courier = self._best_courier(order)
+        if courier is None:
+            return False
+        self.available.remove(courier.id)
+        self._busy.add(courier.id)
+        self.offers[order.id] = courier
+        logging.debug(f"DispatchService: offering order {order.id} to {courier.id}")
+        if self.on_offer is not None:
+            self.on_offer(courier, order)
+        return True
+
+    def on_accept(self, courier: DeliveryPerson, order: Order) -> None:
+        if self.offers.get(order.id) is not courier:
+            return
+        del self.offers[order.id]
+        self.assignments[order.id] = courier
+        self._rejected.pop(order.id, None)
+
+    def on_reject(self, courier: DeliveryPerson, order: Order) -> None:
+        if self.offers.get(order.id) is not courier:
+            return
+        del self.offers[order.id]
+        self._rejected.setdefault(order.id, set()).add(courier.id)
+        self._busy.discard(courier.id)
+        if courier.currentLocation is not None:
+            self.available.insert(courier.id, courier.currentLocation)
+        # offered to the next-best courier by the next tick()
+        self.reoffers.append(order)
+
+    def complete(self, order: Order) -> None:
+        """Order delivered: its courier becomes available again."""
+        courier = self.assignments.pop(order.id, None)
+        self.pickups.pop(order.id, None)
+        if courier is None:
+            return
+        self._busy.discard(courier.id)
+        if courier.currentLocation is not None:
+            self.available.insert(courier.id, courier.currentLocation)
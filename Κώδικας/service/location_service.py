@@ -0,0 +1,35 @@
+# service/location_service.py
+from typing import Iterable
+
+from model.geopoint import GeoPoint
+from model.location_table import LocationTable, Ping
+
+
+class LocationIngestService:
+    """
+    Entry point for courier GPS pings.
+
+    Batches of (courier_id, lat, lon, ts) go into a LocationTable. Only
+    couriers whose latest fix changed are forwarded to the dispatcher, once
+    per batch, so a burst of pings costs one index update per courier.
+    Nothing on this path writes to the console.
+    """
+
+    def __init__(self, table: LocationTable = None, dispatcher=None):
+        self.table = table if table is not None else LocationTable()
+        self.dispatcher = dispatcher
+
+    def ingest(self, pings: Iterable[Ping]) -> int:
+        """Apply a batch of pings; returns how many couriers moved."""
+        changed = self.table.ingest(pings)
+        if self.dispatcher is not None:
+            couriers = self.dispatcher.couriers
+            for courier_id in changed:
+                courier = couriers.get(courier_id)
+                if courier is None:
+                    continue
+                lat, lon, _ = self.table.latest(courier_id)
+                loc = GeoPoint(lat, lon)
+                courier.currentLocation = loc
+                self.dispatcher.on_location(courier, loc)
+        return len(changed)
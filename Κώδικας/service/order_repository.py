@@ -0,0 +1,242 @@
+# service/order_repository.py
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from model.menu_item import MenuItem
+from model.money import to_cents
+from model.order import Order
+
+# Keyset cursor: (placed_at in microseconds, order id bytes) of the last row
+# of the previous page.
+Cursor = Tuple[int, bytes]
+
+ITEM_FIELDS = (
+    "name",
+    "price",
+    "image",
+    "cuisine",
+    "meal_type",
+    "distance",
+    "prep_time",
+    "rating",
+)
+
+# PRAGMA user_version of the current layout:
+#   1  totals in euros (total_amount REAL); files from before versioning
+#   2  totals in integer cents (total_cents)
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id               BLOB PRIMARY KEY,
+    customer_id      TEXT,
+    status           TEXT NOT NULL,
+    placed_at        INTEGER NOT NULL,
+    total_cents      INTEGER NOT NULL,
+    delivery_address TEXT NOT NULL,
+    customer_note    TEXT,
+    items            TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_orders_customer
+    ON orders (customer_id, placed_at, id);
+CREATE INDEX IF NOT EXISTS idx_orders_status
+    ON orders (status, placed_at, id);
+CREATE INDEX IF NOT EXISTS idx_orders_placed
+    ON orders (placed_at, id);
+"""
+
+_COLUMNS = (
+    "id, customer_id, status, placed_at, total_cents,"
+    " delivery_address, customer_note, items"
+)
+
+
+def _micros(dt: datetime) -> int:
+    return round(dt.timestamp() * 1_000_000)
+
+
+class OrderRepository:
+    """
+    SQLite store for Orders (WAL journal, one shared connection).
+
+    Every lookup is served by an index: by customer, by status and by
+    placedAt range. The "recent" queries page with keyset cursors on
+    (placed_at, id), not OFFSET, so page 1000 costs the same as page 1.
+    Pass path=":memory:" for a throwaway store.
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Create the schema, or bring an older file up to SCHEMA_VERSION."""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0 and self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'orders'"
+        ).fetchone():
+            version = 1
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"{self.path} has schema version {version}; "
+                f"this build supports up to {SCHEMA_VERSION}."
+            )
+        if version == 0:
+            self._conn.executescript(_SCHEMA)
+        with self._conn:
+            if version == 1:
+                # Same rounding as the rest of the app (half up, via Decimal).
+                self._conn.create_function("to_cents", 1, to_cents, deterministic=True)
+                self._conn.execute(
+                    "ALTER TABLE orders RENAME COLUMN total_amount TO total_cents"
+                )
+                self._conn.execute("UPDATE orders SET total_cents = to_cents(total_cents)")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ---- writes --------------------------------------------------------
+    @staticmethod
+    def _row(order: Order) -> tuple:
+        items = [{f: getattr(item, f) for f in ITEM_FIELDS} for item in order.items]
+        return (
+            order.id.bytes,
+            order.customer_id,
+            order.status,
+            _micros(order.placedAt),
+            order.total_cents,
+            order.delivery_address,
+            order.customer_note,
+            json.dumps(items, ensure_ascii=False),
+        )
+
+    def add(self, order: Order) -> None:
+        self.add_many((order,))
+
+    def add_many(self, orders: Iterable[Order]) -> int:
+        """
+        Insert (or replace) orders, `batch_size` rows per transaction.
+        Returns the number of rows written.
+        """
+        sql = f"INSERT OR REPLACE INTO orders ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        written = 0
+        batch = []
+        with self._lock:
+            for order in orders:
+                batch.append(self._row(order))
+                if len(batch) >= self.batch_size:
+                    with self._conn:
+                        self._conn.executemany(sql, batch)
+                    written += len(batch)
+                    batch.clear()
+            if batch:
+                with self._conn:
+                    self._conn.executemany(sql, batch)
+                written += len(batch)
+        return written
+
+    def update_status(self, order_id: uuid.UUID, status: str) -> bool:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE orders SET status = ? WHERE id = ?", (status, order_id.bytes)
+            )
+        return cur.rowcount == 1
+
+    # ---- reads ---------------------------------------------------------
+    def _query(self, sql: str, params: tuple) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _to_order(row) -> Order:
+        oid, customer_id, status, placed_at, total_cents, address, note, items = row
+        order = Order(
+            [MenuItem(**item) for item in json.loads(items)],
+            0,
+            address,
+            note,
+            customer_id,
+        )
+        # int(): a migrated column keeps its REAL affinity and reads back 550.0
+        order.total_cents = int(total_cents)
+        order.id = uuid.UUID(bytes=oid)
+        order.status = status
+        order.placedAt = datetime.fromtimestamp(placed_at / 1_000_000)
+        return order
+
+    def _page(self, rows: list, limit: int) -> Tuple[List[Order], Optional[Cursor]]:
+        orders = [self._to_order(r) for r in rows]
+        cursor = (rows[-1][3], rows[-1][0]) if len(rows) == limit else None
+        return orders, cursor
+
+    def get(self, order_id: uuid.UUID) -> Optional[Order]:
+        rows = self._query(
+            f"SELECT {_COLUMNS} FROM orders WHERE id = ?", (order_id.bytes,)
+        )
+        return self._to_order(rows[0]) if rows else None
+
+    def recent(
+        self, customer_id: str = None, limit: int = 10, before: Cursor = None
+    ) -> Tuple[List[Order], Optional[Cursor]]:
+        """
+        Newest orders first, for one customer or (customer_id=None) for all.
+        Returns (orders, cursor); pass the cursor as `before` for the next
+        page. The cursor is None on the last page.
+        """
+        where, params = [], []
+        if customer_id is not None:
+            where.append("customer_id = ?")
+            params.append(customer_id)
+        if before is not None:
+            where.append("(placed_at, id) < (?, ?)")
+            params.extend(before)
+        sql = f"SELECT {_COLUMNS} FROM orders"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY placed_at DESC, id DESC LIMIT ?"
+        rows = self._query(sql, (*params, limit))
+        return self._page(rows, limit)
+
+    def by_status(
+        self, status: str, limit: int = 50, after: Cursor = None
+    ) -> Tuple[List[Order], Optional[Cursor]]:
+        """Orders in `status`, oldest first (a work queue), keyset paged."""
+        sql = f"SELECT {_COLUMNS} FROM orders WHERE status = ?"
+        params = [status]
+        if after is not None:
+            sql += " AND (placed_at, id) > (?, ?)"
+            params.extend(after)
+        sql += " ORDER BY placed_at, id LIMIT ?"
+        rows = self._query(sql, (*params, limit))
+        return self._page(rows, limit)
+
+    def placed_between(
+        self, start: datetime, end: datetime, customer_id: str = None, limit: int = 100
+    ) -> List[Order]:
+        """Orders with start <= placedAt < end, oldest first."""
+        sql = f"SELECT {_COLUMNS} FROM orders WHERE placed_at >= ? AND placed_at < ?"
+        params = [_micros(start), _micros(end)]
+        if customer_id is not None:
+            sql = (
+                f"SELECT {_COLUMNS} FROM orders WHERE customer_id = ?"
+                " AND placed_at >= ? AND placed_at < ?"
+            )
+            params.insert(0, customer_id)
+        sql += " ORDER BY placed_at, id LIMIT ?"
+        return [self._to_order(r) for r in self._query(sql, (*params, limit))]
+
+    def count(self, status: str = None) -> int:
+        if status is None:
+            return self._query("SELECT COUNT(*) FROM orders", ())[0][0]
+        return self._query("SELECT COUNT(*) FROM orders WHERE status = ?", (status,))[0][0]
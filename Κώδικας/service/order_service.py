@@ -1,17 +1,72 @@
 # service/order_service.py
 
+import asyncio
+import threading
+from typing import List, Union
+
 from model.order import Order
-from model.errors import (
-    PaymentDeclinedError,
-    MissingPaymentMethodError,
-    MissingAddressError,
-)
+from service.async_order_service import AsyncOrderService
+
+# Shared async implementation behind the blocking API below.
+async_order_service = AsyncOrderService()
+
+
+class EventLoopThread:
+    """
+    One event loop running forever on a daemon thread, started on first use.
+    Blocking callers submit coroutines to it, so asyncio state kept per loop
+    (such as the per-provider ProviderPool limits) is shared between them.
+    """
+
+    def __init__(self, name: str = "order-service-loop"):
+        self.name = name
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                ).start()
+            return self._loop
+
+    def run(self, coro):
+        """Run `coro` on the loop thread and block until it finishes."""
+        loop = self.loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "OrderService would block its own event loop; await async_order_service instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+_service_loop = EventLoopThread()
 
 
 class OrderService:
+    """
+    Blocking order API. Each call runs the asyncio implementation
+    (AsyncOrderService) on one shared background event loop and waits for
+    it. It can be called from any thread, including one running its own
+    event loop (which is blocked meanwhile); async code should await
+    async_order_service directly.
+    """
+
     @staticmethod
     def place_order(
-        items: list, payment_method, address: str, note: str = None
+        items: list,
+        payment_method,
+        address: str,
+        note: str = None,
+        idempotency_key: str = None,
+        customer_id: str = None,
     ) -> Order:
         """
         Complete an order:
@@ -19,29 +74,41 @@ class OrderService:
           2) Calculate total.
           3) Process payment via the method's provider.
           4) On success, create & confirm an Order.
+
+        Clients should send the same `idempotency_key` when retrying a
+        checkout. Within the cache window, a repeat returns the original
+        Order and skips the provider. A repeat that arrives while the first
+        call is still charging waits for that call's result. A declined or
+        invalid attempt is not remembered, so the key can be retried. A
+        timed-out attempt may still have been charged: repeats raise its
+        PaymentTimeoutError until async_order_service.idempotency is
+        reconciled with settle() or forget(). Reusing a key for a different
+        cart, total or card raises IdempotencyKeyReuseError.
+
+        If async_order_service.repository is set, confirmed orders are
+        saved to it.
         """
+        return _service_loop.run(
+            async_order_service.place_order(
+                items, payment_method, address, note, idempotency_key, customer_id
+            )
+        )
 
-        # 1) Basic validation
-        if payment_method is None:
-            raise MissingPaymentMethodError("You must select a payment method.")
-        if not address or not address.strip():
-            raise MissingAddressError("A delivery address is required.")
-
-        # 2) Total amount
-        total = sum(item.price for item in items)
-
-        # 3) Charge
-        provider = getattr(payment_method, "provider", None)
-        if provider is None:
-            # assume payment_method itself can process
-            success = payment_method.processTransaction(payment_method, total)
-        else:
-            success = provider.processTransaction(payment_method, total)
-
-        if not success:
-            raise PaymentDeclinedError("Payment was declined by the provider.")
-
-        # 4) Create and confirm order
-        order = Order(items, total, address, note)
-        order.confirm()
-        return order
+    @staticmethod
+    def place_orders(
+        requests: List[dict], max_in_flight: int = 8
+    ) -> List[Union[Order, Exception]]:
+        """
+        Place many orders at once, e.g. when replaying queued checkouts.
+
+        Each request is a dict with the keyword arguments of place_order(),
+        including an optional idempotency_key.
+        Every order is validated and totalled up front; only the valid ones
+        are charged, with at most `max_in_flight` payments running
+        concurrently. Returns one entry per request, in order: the confirmed
+        Order, or the exception that stopped it (MissingAddressError,
+        PaymentDeclinedError, ...). One failure never aborts the batch.
+        """
+        return _service_loop.run(
+            async_order_service.place_orders(requests, max_in_flight)
+        )
@@ -0,0 +1,116 @@
+# service/order_state_store.py
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional
+
+from model.errors import InvalidOrderTransitionError
+from model.order import Order, check_transition
+from model.order_log import OrderEvent, OrderEventLog, read_snapshot, write_snapshot
+
+
+class OrderStateStore:
+    """
+    Current status of every order, materialized from an OrderEventLog.
+
+    Opening the store loads the latest snapshot and replays only the log
+    tail written after it, so recovery time is bounded by
+    `snapshot_every` rather than the log length. A new snapshot is taken
+    every `snapshot_every` events.
+
+    Tracked orders change status through transition(), which holds a
+    per-order lock (one of `lock_stripes`) while it checks the move,
+    appends it to the log and, if a `repository` is given, writes the new
+    status to its row, so the log and the repository agree. Log writers
+    serialize on one lock. Readers (status, __len__) never lock: the view
+    is a dict updated one key at a time, and snapshots work on a copy taken
+    under the writer lock.
+    """
+
+    def __init__(
+        self,
+        log_path: str,
+        snapshot_path: str = None,
+        snapshot_every: int = 10_000,
+        fsync: bool = False,
+        clock: Callable[[], float] = time.time,
+        repository=None,
+        lock_stripes: int = 64,
+    ):
+        self.repository = repository  # OrderRepository kept in step, if any
+        self._order_locks = [threading.Lock() for _ in range(lock_stripes)]
+        self.snapshot_path = snapshot_path or log_path + ".snap"
+        self.snapshot_every = snapshot_every
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()  # one snapshot write at a time
+        self.log = OrderEventLog(log_path, fsync=fsync)
+        self._offset, self._view = read_snapshot(self.snapshot_path)
+        if self._offset > self.log.size():
+            # the log lost its tail (e.g. power loss before it reached disk):
+            # the snapshot covers events that no longer exist, so rebuild
+            self._offset, self._view = 0, {}
+        self._since_snapshot = 0
+        for event in self.log.replay(self._offset):
+            self._view[event.order_id] = (event.new_status, event.timestamp)
+            self._since_snapshot += 1
+        self._offset = self.log.size()
+
+    def track(self, order: Order) -> Order:
+        """Journal the order's future transitions in this store."""
+        order.journal = self
+        return order
+
+    def transition(self, order: Order, new_status: str) -> None:
+        """Move a tracked order to `new_status` (see Order._transition)."""
+        with self._order_locks[hash(order.id) % len(self._order_locks)]:
+            check_transition(order, new_status)
+            self.record(order.id, order.status, new_status)
+            if self.repository is not None:
+                # no row yet for an order that has not been saved; add() will
+                # write its status
+                self.repository.update_status(order.id, new_status)
+            order.status = new_status
+
+    def record(self, order_id: uuid.UUID, old_status: str, new_status: str) -> None:
+        """
+        Append a transition. Raises InvalidOrderTransitionError if the
+        stored status is not `old_status` (another copy of the order moved
+        it first).
+        """
+        with self._lock:
+            current = self._view.get(order_id)
+            if current is not None and current[0] != old_status:
+                raise InvalidOrderTransitionError(
+                    f"Order {order_id} is {current[0]}, not {old_status}."
+                )
+            ts = self._clock()
+            self._offset = self.log.append(OrderEvent(order_id, old_status, new_status, ts))
+            self._view[order_id] = (new_status, ts)
+            self._since_snapshot += 1
+            due = self._since_snapshot >= self.snapshot_every
+        if due:
+            self.snapshot()
+
+    def status(self, order_id: uuid.UUID) -> Optional[str]:
+        entry = self._view.get(order_id)
+        return entry[0] if entry is not None else None
+
+    def __len__(self):
+        return len(self._view)
+
+    def history(self, order_id: uuid.UUID) -> List[OrderEvent]:
+        """Every transition of one order, oldest first (scans the whole log)."""
+        return [e for e in self.log.replay() if e.order_id == order_id]
+
+    def snapshot(self) -> None:
+        with self._snapshot_lock:
+            with self._lock:
+                offset, state = self._offset, dict(self._view)
+                self._since_snapshot = 0
+            # the log must be durable up to `offset` before a snapshot says so
+            self.log.sync()
+            write_snapshot(self.snapshot_path, offset, state)
+
+    def close(self) -> None:
+        self.log.close()
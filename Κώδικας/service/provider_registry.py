@@ -0,0 +1,182 @@
+# service/provider_registry.py
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterator, List
+
+from model.payment_method import detect_brand
+from model.payment_provider import PaymentProvider
+from model.ttl_cache import TTLCache
+
+# Route used for brands without providers of their own
+ANY_BRAND = "*"
+
+
+class CircuitBreaker:
+    """
+    Stops traffic to a failing provider.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    allow() is False for `reset_timeout` seconds. It then lets a single
+    trial call through (half-open). If that call succeeds the breaker
+    closes; if it fails the breaker opens again.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_running = False
+        # half-open: one trial at a time
+        if self._trial_running:
+            return False
+        self._trial_running = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_running = False
+
+    def release(self) -> None:
+        """End a call that produced no result (e.g. cancelled) without judging it."""
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_running = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+
+
+class ProviderRegistry:
+    """
+    Routes payments to providers by card brand, with failover.
+
+    register() adds providers per brand in priority order: the first is
+    the primary and the rest are secondaries. ANY_BRAND serves brands
+    with no route of their own. candidates() yields the providers a
+    payment may try, in order. It skips providers whose circuit is open
+    or whose last health check failed.
+
+    candidates() never calls a provider: health comes only from the TTL
+    cache, which refresh_health() fills off the checkout path. While a
+    provider has no fresh result it is assumed healthy, and the circuit
+    breaker catches it if it fails. A dead provider therefore costs the
+    hot path nothing once it has been detected.
+    """
+
+    def __init__(
+        self,
+        health_ttl: float = 30.0,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._routes: Dict[str, List[PaymentProvider]] = {}
+        self._breakers: Dict[int, CircuitBreaker] = {}
+        self._health = TTLCache(maxsize=1024, ttl=health_ttl, clock=clock)
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def register(self, brand: str, provider: PaymentProvider) -> None:
+        with self._lock:
+            self._routes.setdefault(brand, []).append(provider)
+            self._breakers.setdefault(
+                id(provider),
+                CircuitBreaker(self._failure_threshold, self._reset_timeout, self._clock),
+            )
+
+    def providers(self) -> List[PaymentProvider]:
+        """Every registered provider, once each."""
+        seen = {}
+        for route in self._routes.values():
+            for provider in route:
+                seen.setdefault(id(provider), provider)
+        return list(seen.values())
+
+    def breaker(self, provider: PaymentProvider) -> CircuitBreaker:
+        return self._breakers[id(provider)]
+
+    def route(self, payment_method) -> List[PaymentProvider]:
+        """Every provider configured for the method's brand, in priority order."""
+        brand = getattr(payment_method, "brand", None) or detect_brand(payment_method.number)
+        return self._routes.get(brand) or self._routes.get(ANY_BRAND, [])
+
+    def candidates(self, payment_method) -> Iterator[PaymentProvider]:
+        """
+        Providers worth trying for this payment, primary first. Lazy: a
+        provider's breaker is only consulted (and a half-open trial only
+        claimed) when the caller asks for the next provider, so report each
+        attempt with record_success() / record_failure(), or release() if
+        it ended without a result.
+        """
+        for provider in self.route(payment_method):
+            if self._health.peek(id(provider)) is False:
+                continue
+            with self._lock:
+                allowed = self._breakers[id(provider)].allow()
+            if allowed:
+                yield provider
+
+    def record_success(self, provider: PaymentProvider) -> None:
+        with self._lock:
+            self._breakers[id(provider)].record_success()
+
+    def record_failure(self, provider: PaymentProvider) -> None:
+        with self._lock:
+            self._breakers[id(provider)].record_failure()
+
+    def release(self, provider: PaymentProvider) -> None:
+        with self._lock:
+            self._breakers[id(provider)].release()
+
+    def refresh_health(self) -> Dict[str, bool]:
+        """
+        Run testConnection() on every provider and cache the results for
+        `health_ttl` seconds. Meant for a timer or background thread.
+        """
+        results = {}
+        for provider in self.providers():
+            try:
+                healthy = bool(provider.testConnection())
+            except Exception as e:
+                logging.debug(f"ProviderRegistry.refresh_health(): {provider.name}: {e}")
+                healthy = False
+            self._health.put(id(provider), healthy)
+            results[provider.name] = healthy
+        return results
+
+
+def default_registry() -> ProviderRegistry:
+    """Brand routes used by the app, with a shared backup gateway."""
+    registry = ProviderRegistry()
+    backup = PaymentProvider(name="Backup Gateway", apiKey="backup-key")
+    registry.register("visa", PaymentProvider(name="Visa", apiKey="visa-key"))
+    registry.register("visa", backup)
+    registry.register("mastercard", PaymentProvider(name="Mastercard", apiKey="mastercard-key"))
+    registry.register("mastercard", backup)
+    registry.register(ANY_BRAND, backup)
+    return registry
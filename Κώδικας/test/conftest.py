@@ -0,0 +1,27 @@
+# test/conftest.py
+import os
+
+import pytest
+
+# Qt tests run headless; must be set before the first QApplication exists.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The one QApplication shared by every Qt test."""
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def card():
+    """Factory for a test card charged through `provider`: card(provider, cvv="123")."""
+    from model.payment_method import PaymentMethod
+
+    def make(provider, cvv="123"):
+        pm = PaymentMethod(holder="Alice", number="4111111111111111", expiry="12/30", cvv=cvv)
+        pm.provider = provider
+        return pm
+
+    return make
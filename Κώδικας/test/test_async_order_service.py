@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model.errors import PaymentDeclinedError, PaymentTimeoutError
+from model.menu_item import MenuItem
+from model.order import Order
+from model.payment_provider import PaymentProvider
+from service.async_order_service import AsyncOrderService
+from service.order_service import OrderService
+
+
+class AsyncStubProvider(PaymentProvider):
+    """Answers after `latency` seconds without blocking the loop."""
+
+    def __init__(self, latency=0.01, max_concurrency=16, timeout=1.0):
+        super().__init__(
+            name="Visa", apiKey="key", max_concurrency=max_concurrency, timeout=timeout
+        )
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def processTransactionAsync(self, payment_method, amount):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        return payment_method.cvv != "000"
+
+
+ITEMS = [MenuItem("Burger", 5.0, "b.png"), MenuItem("Cola", 2.0, "c.png")]
+
+
+def test_thousands_of_concurrent_checkouts_respect_provider_limit(card):
+    provider = AsyncStubProvider(latency=0.005, max_concurrency=32)
+    service = AsyncOrderService()
+
+    async def run():
+        return await asyncio.gather(
+            *(service.place_order(ITEMS, card(provider), "Παγκράτι") for _ in range(2000))
+        )
+
+    orders = asyncio.run(run())
+    assert len(orders) == 2000
+    assert all(o.status == "confirmed" and o.total_amount == 7.0 for o in orders)
+    assert provider.calls == 2000
+    assert provider.peak == 32
+
+
+def test_place_orders_returns_per_order_results(card):
+    provider = AsyncStubProvider(latency=0)
+    requests = [
+        {"items": ITEMS, "payment_method": card(provider), "address": "Παγκράτι"},
+        {"items": ITEMS, "payment_method": card(provider, cvv="000"), "address": "Παγκράτι"},
+    ]
+    results = asyncio.run(AsyncOrderService().place_orders(requests))
+    assert isinstance(results[0], Order)
+    assert isinstance(results[1], PaymentDeclinedError)
+
+
+def test_slow_provider_times_out(card):
+    provider = AsyncStubProvider(latency=1.0, timeout=0.01)
+    with pytest.raises(PaymentTimeoutError):
+        asyncio.run(AsyncOrderService().place_order(ITEMS, card(provider), "Παγκράτι"))
+    # the outcome is unknown, so it must not read as a decline
+    assert not issubclass(PaymentTimeoutError, PaymentDeclinedError)
+
+
+class BlockingProvider(PaymentProvider):
+    """Blocks a worker thread in processTransaction() until released."""
+
+    def __init__(self):
+        super().__init__(name="Visa", apiKey="key", max_concurrency=1, timeout=0.01)
+        self.release = threading.Event()
+
+    def processTransaction(self, payment_method, amount):
+        self.release.wait(5)
+        return True
+
+
+def test_timed_out_charge_keeps_its_slot_until_the_thread_finishes(card):
+    provider = BlockingProvider()
+    service = AsyncOrderService()
+
+    async def run():
+        pool = service.pool_for(provider)
+        with pytest.raises(PaymentTimeoutError):
+            await service.place_order(ITEMS, card(provider), "Παγκράτι")
+        # the worker thread is still charging: the slot is not handed out
+        assert pool.in_flight == 1 and pool._slots.locked()
+        provider.release.set()
+        while pool.in_flight:
+            await asyncio.sleep(0.01)
+        assert not pool._slots.locked()
+
+    asyncio.run(run())
+    assert [u[0] for u in service.unsettled] == [provider]
+
+
+def test_sync_wrapper_uses_async_provider_path(card):
+    provider = AsyncStubProvider(latency=0)
+    order = OrderService.place_order(ITEMS, card(provider), "Παγκράτι")
+    assert order.status == "confirmed"
+    assert provider.calls == 1
+
+
+def test_sync_callers_share_one_loop_and_provider_limit(card):
+    provider = AsyncStubProvider(latency=0.02, max_concurrency=2)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        orders = list(
+            pool.map(
+                lambda _: OrderService.place_order(ITEMS, card(provider), "Παγκράτι"),
+                range(16),
+            )
+        )
+    assert all(o.status == "confirmed" for o in orders)
+    assert provider.peak == 2  # one ProviderPool across all blocking callers
+
+
+def test_sync_wrapper_works_inside_a_running_loop(card):
+    provider = AsyncStubProvider(latency=0)
+
+    async def caller():
+        return OrderService.place_order(ITEMS, card(provider), "Παγκράτι")
+
+    assert asyncio.run(caller()).status == "confirmed"
@@ -0,0 +1,68 @@
+import threading
+import time
+import pytest
+
+from model.errors import MissingAddressError, PaymentDeclinedError
+from model.menu_item import MenuItem
+from model.order import Order
+from model.payment_provider import PaymentProvider
+from service.order_service import OrderService
+
+
+class SlowProvider(PaymentProvider):
+    """Declines cvv '000' and tracks how many charges overlap."""
+
+    def __init__(self, delay=0.02):
+        super().__init__(name="Visa", apiKey="key")
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def processTransaction(self, payment_method, amount):
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return payment_method.cvv != "000"
+
+
+@pytest.fixture
+def order_request(card):
+    def make(provider, address="Παγκράτι", cvv="123"):
+        return {
+            "items": [MenuItem("Burger", 5.0, "b.png"), MenuItem("Cola", 2.0, "c.png")],
+            "payment_method": card(provider, cvv),
+            "address": address,
+        }
+
+    return make
+
+
+def test_batch_returns_per_order_results(order_request):
+    provider = SlowProvider(delay=0)
+    results = OrderService.place_orders(
+        [
+            order_request(provider),
+            order_request(provider, address=""),
+            order_request(provider, cvv="000"),
+        ]
+    )
+    assert isinstance(results[0], Order) and results[0].total_amount == 7.0
+    assert isinstance(results[1], MissingAddressError)
+    assert isinstance(results[2], PaymentDeclinedError)
+    # the invalid order is rejected before any charge is sent
+    assert provider.calls == 2
+
+
+def test_charges_run_concurrently_but_bounded(order_request):
+    provider = SlowProvider(delay=0.02)
+    results = OrderService.place_orders(
+        [order_request(provider) for _ in range(20)], max_in_flight=4
+    )
+    assert all(isinstance(r, Order) for r in results)
+    assert 1 < provider.peak <= 4
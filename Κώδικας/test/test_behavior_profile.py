@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+import pytest
+
+from model.behavior_profile import BehaviorProfile
+from model.catalog import MenuCatalog
+from model.event_log import UserEvent
+from model.filters import Filters
+from model.menu_item import MenuItem
+from model.person import Person
+from model.recommendation_algorithm import RecommendationAlgorithm
+
+T0 = datetime(2025, 5, 1, 13, 0, 0)
+SUSHI = MenuItem("Sushi", 12.0, "s.png", "Ασιατική", "Βραδινό", 1.0, 20, 4.0)
+PASTA = MenuItem("Pasta", 8.0, "p.png", "Ιταλική", "Μεσημεριανό", 1.0, 20, 4.0)
+
+
+def test_profile_counts_and_price():
+    profile = BehaviorProfile()
+    profile.update(UserEvent("order", T0, item=SUSHI))
+    profile.update(UserEvent("order", T0, item=PASTA))
+    profile.update(UserEvent("login", T0))
+    assert profile.cuisine_share("Ασιατική") == pytest.approx(0.5)
+    assert profile.meal_share("Μεσημεριανό") == pytest.approx(0.5)
+    assert profile.mean_price() == pytest.approx(10.0)
+    assert profile.peak_hour() == 13
+
+
+def test_older_events_weigh_less():
+    profile = BehaviorProfile(half_life=timedelta(days=1))
+    profile.update(UserEvent("order", T0, item=SUSHI))
+    profile.update(UserEvent("order", T0 + timedelta(days=1), item=PASTA))
+    # sushi is one half-life old: weight 1 against 2
+    assert profile.cuisine_share("Ασιατική") == pytest.approx(1 / 3)
+
+
+def test_rescale_keeps_shares():
+    profile = BehaviorProfile(half_life=timedelta(hours=1))
+    profile.update(UserEvent("order", T0, item=SUSHI))
+    later = T0 + timedelta(hours=100)
+    profile.update(UserEvent("order", later, item=SUSHI))
+    profile.update(UserEvent("order", later, item=PASTA))
+    assert profile.cuisine_share("Ασιατική") == pytest.approx(0.5)
+
+
+def test_recommendations_follow_profile():
+    catalog = MenuCatalog([SUSHI, PASTA])
+    algo = RecommendationAlgorithm(catalog=catalog)
+    user = Person("Eleni")
+    fltrs = Filters(max_price=20.0, max_distance=5.0, max_time=60)
+    # pasta wins on price alone
+    assert algo.getRecommendations(user, None, fltrs)[0] is PASTA
+    for _ in range(3):
+        algo.record(UserEvent("order", user_id=user.id, item=SUSHI))
+    assert algo.analyzeBehavior(user) is algo.profile(user)
+    assert algo.getRecommendations(user, None, fltrs)[0] is SUSHI
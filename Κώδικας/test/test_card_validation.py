@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from model.card_validation import (
+    BAD_EXPIRY_FORMAT,
+    EXPIRED,
+    INVALID_NUMBER,
+    LUHN_FAILED,
+    MISSING_CVV,
+    MISSING_HOLDER,
+    OK,
+    luhn_ok,
+    validate_cards,
+    validate_methods,
+)
+from model.payment_method import PaymentMethod
+
+NOW = datetime(2025, 5, 15)
+
+
+def test_luhn():
+    assert luhn_ok("4111111111111111")
+    assert luhn_ok("5500000000000004")
+    assert luhn_ok("79927398713")
+    assert not luhn_ok("4111111111111112")
+    assert not luhn_ok("1234567812345678")
+
+
+def test_each_error_code():
+    rows = [
+        ("Alice", "4111 1111 1111 1111", "12/30", "123"),
+        ("  ", "4111111111111111", "12/30", "123"),
+        ("Alice", "4111111111111111", "12/30", ""),
+        ("Alice", "1234 5678", "12/30", "123"),
+        ("Alice", "4111111111111112", "12/30", "123"),
+        ("Alice", "5500000000000004", "13/30", "123"),
+        ("Alice", "5500000000000004", "04/25", "123"),
+        ("Alice", "5500000000000004", "05/25", "123"),  # valid through May
+    ]
+    result = validate_cards(*zip(*rows), now=NOW)
+    assert list(result.codes) == [
+        OK,
+        MISSING_HOLDER,
+        MISSING_CVV,
+        INVALID_NUMBER,
+        LUHN_FAILED,
+        BAD_EXPIRY_FORMAT,
+        EXPIRED,
+        OK,
+    ]
+    assert result.brands[0] == "visa" and result.brands[7] == "mastercard"
+    assert result.brands[3] == ""
+    assert result.failures() == [1, 2, 3, 4, 5, 6]
+
+
+def test_agrees_with_per_object_validate():
+    methods = [
+        PaymentMethod("John Doe", "4111111111111111", "12/30", "123"),
+        PaymentMethod("", "4111111111111111", "12/30", "123"),
+        PaymentMethod("John Doe", "4111111111111111", "bad-format", "123"),
+        PaymentMethod("John Doe", "4111111111111111", "01/20", "123"),
+        # the documented edge cases
+        PaymentMethod("John Doe", "4111 1111 1111 1111", "12/30", "123"),
+        PaymentMethod("John Doe", "4111111111111111", "1/30", "123"),
+        PaymentMethod("John Doe", "4111111111111111", "12/99", "123"),  # 1999
+        PaymentMethod("John Doe", "4111111111111111", "12/69", "123"),  # 1969
+        PaymentMethod("John Doe", "4111111111111111", "12/68", "123"),  # 2068
+        PaymentMethod("John Doe", "4111111111111111", "00/30", "123"),
+        PaymentMethod("John Doe", "4111111111111111", "12/2030", "123"),
+    ]
+    bulk = validate_methods(methods).codes
+    for method, code in zip(methods, bulk):
+        try:
+            method.validate()
+            single = OK
+        except Exception:
+            single = None
+        assert (code == OK) == (single == OK)
+
+
+def test_expiry_parsing_follows_strptime():
+    rows = [("Alice", "4111111111111111", expiry, "123") for expiry in ("1/30", "12/99", "12/68")]
+    assert list(validate_cards(*zip(*rows), now=NOW).codes) == [OK, EXPIRED, OK]
@@ -0,0 +1,86 @@
+import pytest
+
+from model.cart import Cart, LINE_ADDED, LINE_REMOVED, LINE_UPDATED, TOTALS_CHANGED
+from model.menu_item import MenuItem
+
+BURGER = MenuItem("Burger", 8.5, "b.png")
+COLA = MenuItem("Cola", 2.0, "c.png")
+
+
+def test_totals_follow_every_change():
+    cart = Cart(delivery_fee_cents=250, free_delivery_from_cents=3000)
+    events = []
+    cart.subscribe(lambda kind, line: events.append((kind, line and line.key)))
+
+    cart.add(BURGER)
+    cart.add(COLA, quantity=2)
+    assert (cart.subtotal_cents, cart.item_count) == (1250, 3)
+    assert cart.delivery_fee_cents == 250
+    assert cart.total_cents == 1500
+
+    cart.add(BURGER)  # same line, quantity 2
+    cart.set_quantity("Cola", 5)
+    assert (cart.subtotal_cents, cart.item_count) == (2700, 7)
+
+    cart.set_discount(500)
+    assert cart.total_cents == 2700 - 500 + 250
+
+    cart.set_quantity("Burger", 3)  # subtotal 3550 -> free delivery
+    assert cart.delivery_fee_cents == 0
+    assert cart.total_cents == 3050
+
+    cart.remove("Cola")
+    assert (cart.subtotal_cents, cart.item_count) == (2550, 3)
+
+    assert events == [
+        (LINE_ADDED, "Burger"),
+        (LINE_ADDED, "Cola"),
+        (LINE_UPDATED, "Burger"),
+        (LINE_UPDATED, "Cola"),
+        (TOTALS_CHANGED, None),
+        (LINE_UPDATED, "Burger"),
+        (LINE_REMOVED, "Cola"),
+    ]
+
+
+def test_totals_match_full_recount_after_many_changes():
+    cart = Cart()
+    items = [MenuItem(f"item-{i}", 0.1 * (i % 7 + 1), "x.png") for i in range(200)]
+    for i, item in enumerate(items):
+        cart.add(item, quantity=i % 3 + 1)
+    for i in range(0, 200, 3):
+        cart.set_quantity(f"item-{i}", 0)
+    assert cart.subtotal_cents == sum(line.total_cents for line in cart)
+    assert cart.item_count == sum(line.quantity for line in cart)
+    assert len(cart.items()) == cart.item_count
+
+
+def test_discount_never_makes_total_negative():
+    cart = Cart()
+    cart.add(COLA)
+    cart.set_discount(1000)
+    assert cart.total_cents == 0
+    with pytest.raises(ValueError):
+        cart.set_quantity("Cola", -1)
+
+
+def test_cart_screen_updates_rows_in_place(app):
+    from view.cart_screen import CartScreen
+
+    cart = Cart()
+    cart.add(BURGER)
+    screen = CartScreen(cart=cart)
+    burger_row, price_label, spinbox = screen._rows["Burger"]
+
+    spinbox.setValue(3)  # user edits the quantity
+    assert cart.line("Burger").quantity == 3
+    assert price_label.text() == "€25.50"
+    assert screen.lbl_total.text() == "Total   €25.50"
+
+    cart.add(COLA)
+    assert screen._rows["Burger"][0] is burger_row  # existing row untouched
+    assert screen.lbl_items.text() == "Total Items (4)"
+
+    cart.remove("Cola")
+    assert "Cola" not in screen._rows
+    assert screen.lbl_total.text() == "Total   €25.50"
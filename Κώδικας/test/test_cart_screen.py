@@ -0,0 +1,18 @@
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from model.errors import InvalidPromoCodeError
+from view.cart_screen import CartScreen
+
+
+def test_first_order_promo_follows_the_flag(app):
+    screen = CartScreen(first_order=True)
+    screen.promo_input.setText("WELCOME10")
+    screen.on_apply_promo()
+    assert screen.promo_code == "WELCOME10"
+    assert screen.cart.discount_cents == screen.cart.subtotal_cents // 10
+
+    returning = CartScreen()
+    with pytest.raises(InvalidPromoCodeError):
+        returning.promos.discount_for("WELCOME10", returning.cart, returning.first_order)
@@ -0,0 +1,36 @@
+import pytest
+from model.catalog import MenuCatalog
+from model.menu_item import MenuItem
+from model.preferences import Preferences
+from model.filters import Filters
+
+
+@pytest.fixture
+def catalog():
+    return MenuCatalog(
+        [
+            MenuItem("Moussaka", 9.0, "m.png", "Μεσογειακή", "Βραδινό", 2.0, 40),
+            MenuItem("Gyros", 4.5, "g.png", "Μεσογειακή", "Βραδινό", 1.0, 10),
+            MenuItem("Souvlaki", 3.0, "s.png", "Μεσογειακή", "Βραδινό", 8.0, 10),
+            MenuItem("Sushi", 12.0, "su.png", "Ασιατική", "Βραδινό", 1.0, 25),
+        ]
+    )
+
+
+def test_query_respects_all_filters(catalog):
+    prefs = Preferences(cuisine="Μεσογειακή", meal_type="Βραδινό")
+    fltrs = Filters(max_price=10.0, max_distance=5.0, max_time=30)
+    recs = catalog.query(prefs, fltrs)
+    # Souvlaki is too far, Moussaka takes too long
+    assert [m.name for m in recs] == ["Gyros"]
+
+
+def test_query_returns_cheapest_first_and_honours_limit(catalog):
+    fltrs = Filters(max_price=100.0, max_distance=100.0, max_time=100)
+    recs = catalog.query(None, fltrs, limit=2)
+    assert [m.name for m in recs] == ["Souvlaki", "Gyros"]
+
+
+def test_unknown_cuisine_returns_nothing(catalog):
+    prefs = Preferences(cuisine="Μεξικάνικη", meal_type="Βραδινό")
+    assert catalog.query(prefs, None) == []
@@ -0,0 +1,105 @@
+import pytest
+
+from model.delivery_person import DeliveryPerson
+from model.geopoint import GeoPoint
+from model.order import Order
+from service.dispatch_service import DispatchService
+
+PICKUP = GeoPoint(37.9755, 23.7348)
+
+
+def courier(name, plate, vehicle="Motorbike"):
+    return DeliveryPerson(
+        name=name,
+        email=f"{name.lower()}@example.com",
+        phone="+301234567890",
+        vehicle_type=vehicle,
+        license_plate=plate,
+        password="Secret123",
+        experience=1,
+    )
+
+
+def confirmed_order():
+    order = Order(items=[], total_amount=10.0, delivery_address="Παγκράτι")
+    order.confirm()
+    return order
+
+
+@pytest.fixture
+def fleet():
+    offers = []
+    dispatcher = DispatchService(on_offer=lambda c, o: offers.append((c, o)))
+    near_bike = courier("Nikos", "AB-1", vehicle="Bicycle")
+    mid_moto = courier("Eleni", "AB-2")
+    far_moto = courier("Petros", "AB-3")
+    for c in (near_bike, mid_moto, far_moto):
+        dispatcher.register(c)
+    near_bike.updateLocation(GeoPoint(37.9760, 23.7350))  # ~0.06 km
+    mid_moto.updateLocation(GeoPoint(37.9790, 23.7400))  # ~0.6 km
+    far_moto.updateLocation(GeoPoint(37.9900, 23.7600))  # ~2.7 km
+    return dispatcher, offers, (near_bike, mid_moto, far_moto)
+
+
+def test_best_eta_wins_and_accept_assigns(fleet):
+    dispatcher, offers, (near_bike, mid_moto, far_moto) = fleet
+    order = confirmed_order()
+    dispatcher.submit(order, PICKUP)
+    assert dispatcher.dispatch_pending() == 1
+    # the bicycle is closest and still fastest at this distance
+    assert offers == [(near_bike, order)]
+    near_bike.acceptOrder(order)
+    assert dispatcher.assignments[order.id] is near_bike
+    assert near_bike.id not in dispatcher.available
+
+
+def test_reject_moves_to_next_candidate(fleet):
+    dispatcher, offers, (near_bike, mid_moto, far_moto) = fleet
+    order = confirmed_order()
+    dispatcher.submit(order, PICKUP)
+    dispatcher.dispatch_pending()
+    near_bike.rejectOrder(order)
+    assert near_bike.id in dispatcher.available
+    assert list(dispatcher.reoffers) == [order]
+    assert dispatcher.tick() == 1  # re-offers do not wait for the batch
+    assert offers[-1] == (mid_moto, order)
+    mid_moto.rejectOrder(order)
+    dispatcher.tick()
+    assert offers[-1] == (far_moto, order)
+
+
+def test_tick_batches_by_interval():
+    now = [0.0]
+    dispatcher = DispatchService(batch_interval=3.0, clock=lambda: now[0])
+    c = courier("Maria", "AB-4")
+    dispatcher.register(c)
+    c.updateLocation(PICKUP)
+    dispatcher.submit(confirmed_order(), PICKUP)
+    assert dispatcher.tick() == 0
+    now[0] = 3.5
+    assert dispatcher.tick() == 1
+
+
+def test_only_confirmed_orders_are_dispatched():
+    order = Order(items=[], total_amount=1.0, delivery_address="x")
+    with pytest.raises(ValueError):
+        DispatchService().submit(order, PICKUP)
+
+
+def test_many_synchronous_rejections_do_not_nest():
+    offers = []
+
+    def reject_at_once(c, o):
+        offers.append(c)
+        c.rejectOrder(o)
+
+    dispatcher = DispatchService(on_offer=reject_at_once)
+    for i in range(400):
+        c = courier("Courier", f"AB-{i}")
+        dispatcher.register(c)
+        c.updateLocation(GeoPoint(PICKUP.latitude + i * 1e-5, PICKUP.longitude))
+    order = confirmed_order()
+    dispatcher.submit(order, PICKUP)
+    dispatcher.dispatch_pending()  # used to raise RecursionError
+    assert len(offers) == 400
+    assert list(dispatcher.pending) == [order]  # everybody said no
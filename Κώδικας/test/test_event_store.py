@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from model.event_log import UserEvent
+from model.event_store import RingBufferEventRecorder
+
+T0 = datetime(2025, 5, 1, 12, 0, 0)
+
+
+def test_oldest_events_are_overwritten_when_full():
+    store = RingBufferEventRecorder(capacity=3)
+    for i in range(5):
+        store.record(UserEvent("login", T0 + timedelta(seconds=i)))
+    assert len(store) == 3
+    assert [e.timestamp for e in store] == [T0 + timedelta(seconds=i) for i in (2, 3, 4)]
+
+
+def test_event_types_round_trip_and_count():
+    store = RingBufferEventRecorder(capacity=10)
+    store.record(UserEvent("login", T0))
+    store.record(UserEvent("preference_submit", T0 + timedelta(minutes=1)))
+    store.record(UserEvent("login", T0 + timedelta(minutes=2)))
+    assert [e.type for e in store] == ["login", "preference_submit", "login"]
+    assert store.count("login") == 2
+    assert store.count("login", since=T0 + timedelta(minutes=1)) == 1
+    assert store.count("logout") == 0
+
+
+def test_retention_window_drops_old_events():
+    store = RingBufferEventRecorder(capacity=100, retention=timedelta(hours=1))
+    store.record(UserEvent("login", T0))
+    store.record(UserEvent("login", T0 + timedelta(minutes=30)))
+    store.record(UserEvent("login", T0 + timedelta(minutes=90)))
+    assert [e.timestamp for e in store] == [
+        T0 + timedelta(minutes=30),
+        T0 + timedelta(minutes=90),
+    ]
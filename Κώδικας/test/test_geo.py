@@ -0,0 +1,84 @@
+import random
+import pytest
+
+from model.catalog import MenuCatalog
+from model.filters import Filters
+from model.geo import GeoGridIndex, haversine_km, haversine_km_array
+from model.geopoint import GeoPoint
+from model.menu_item import MenuItem
+from model.recommendation_algorithm import RecommendationAlgorithm
+
+SYNTAGMA = GeoPoint(37.9755, 23.7348)
+PIRAEUS = GeoPoint(37.9420, 23.6465)
+
+
+def test_haversine_known_distance():
+    assert haversine_km(SYNTAGMA, PIRAEUS) == pytest.approx(8.5, abs=0.2)
+    assert haversine_km(SYNTAGMA, SYNTAGMA) == 0.0
+
+
+def test_vectorized_haversine_matches_scalar():
+    pytest.importorskip("numpy")
+    pts = [GeoPoint(37.9 + i * 0.01, 23.7 - i * 0.02) for i in range(10)]
+    d = haversine_km_array([p.latitude for p in pts], [p.longitude for p in pts], SYNTAGMA)
+    assert list(d) == pytest.approx([haversine_km(SYNTAGMA, p) for p in pts])
+
+
+def test_grid_within_matches_brute_force():
+    rnd = random.Random(1)
+    index = GeoGridIndex(cell_km=0.5)
+    points = {
+        i: GeoPoint(37.9 + rnd.uniform(-0.1, 0.1), 23.7 + rnd.uniform(-0.1, 0.1))
+        for i in range(2000)
+    }
+    for key, p in points.items():
+        index.insert(key, p)
+    for radius in (0.3, 2.0, 7.5):
+        expected = sorted(k for k, p in points.items() if haversine_km(SYNTAGMA, p) <= radius)
+        assert sorted(k for _, k in index.within(SYNTAGMA, radius)) == expected
+
+
+def test_grid_move_remove_and_nearest():
+    index = GeoGridIndex(cell_km=1.0)
+    index.insert("a", SYNTAGMA)
+    index.insert("b", PIRAEUS)
+    assert [k for _, k in index.nearest(PIRAEUS, k=1)] == ["b"]
+    index.insert("a", PIRAEUS)  # moved
+    assert index.position("a") == PIRAEUS
+    assert {k for _, k in index.within(PIRAEUS, 0.1)} == {"a", "b"}
+    index.remove("b")
+    assert len(index) == 1 and "b" not in index
+
+
+def test_catalog_nearby():
+    near = MenuItem("Souvlaki", 3.0, "s.png", location=GeoPoint(37.976, 23.735))
+    far = MenuItem("Fish", 15.0, "f.png", location=PIRAEUS)
+    catalog = MenuCatalog([near, far, MenuItem("Unknown", 1.0, "u.png")])
+    assert [m for _, m in catalog.nearby(SYNTAGMA, 2.0)] == [near]
+
+
+def test_origin_filters_by_measured_distance():
+    # stored distances are stale: only the locations are right
+    near = MenuItem("Souvlaki", 3.0, "s.png", distance=9.0, location=GeoPoint(37.976, 23.735))
+    close = MenuItem("Pita", 3.0, "p.png", distance=8.0, location=GeoPoint(37.985, 23.735))
+    far = MenuItem("Fish", 3.0, "f.png", distance=0.5, location=PIRAEUS)
+    unknown = MenuItem("Unknown", 1.0, "u.png", distance=0.1)
+    catalog = MenuCatalog([near, close, far, unknown])
+    around = Filters(20.0, 2.0, 60, origin=SYNTAGMA)
+    static = Filters(20.0, 2.0, 60)
+
+    assert catalog.top(None, around, 5) == [near, close]  # nearest scores best
+    assert catalog.top(None, static, 5) == [unknown, far]
+
+    algo = RecommendationAlgorithm(catalog=catalog)
+    assert algo.getRecommendations(None, None, around) == [near, close]
+    # the precomputed popular order stays; only the filter uses the origin
+    assert {m.name for m in algo.popular_recommendations(around)} == {"Souvlaki", "Pita"}
+    assert list(algo.getRecommendationsBatch([(None, None, around)], workers=0)) == [
+        [near, close]
+    ]
+    if algo.columns is not None:
+        assert algo.columns.top(None, around, 5) == [near, close]
+        algo.columns = None  # the scalar path agrees
+        algo.cache.invalidate()
+        assert algo.getRecommendations(None, None, around) == [near, close]
@@ -0,0 +1,147 @@
+import threading
+import time
+import pytest
+
+from model.errors import (
+    IdempotencyKeyReuseError,
+    PaymentDeclinedError,
+    PaymentTimeoutError,
+)
+from model.idempotency_cache import IdempotencyCache
+from model.menu_item import MenuItem
+from model.payment_method import PaymentMethod
+from model.payment_provider import PaymentProvider
+from service.order_service import OrderService, async_order_service
+
+
+class CountingProvider(PaymentProvider):
+    """Slow enough that concurrent retries overlap with the first charge."""
+
+    def __init__(self, delay=0.05):
+        super().__init__(name="Visa", apiKey="key")
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def processTransaction(self, payment_method, amount):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return payment_method.cvv != "000"
+
+
+ITEMS = [MenuItem("Burger", 5.0, "b.png")]
+
+
+def test_concurrent_retries_charge_once(card):
+    provider = CountingProvider()
+    pm = card(provider)
+    n = 16
+    start = threading.Barrier(n)
+    orders = [None] * n
+
+    def submit(i):
+        start.wait()
+        orders[i] = OrderService.place_order(
+            ITEMS, pm, "Παγκράτι", idempotency_key="checkout-concurrent"
+        )
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert provider.calls == 1
+    assert len({o.id for o in orders}) == 1
+
+
+def test_retry_after_success_returns_original_order(card):
+    provider = CountingProvider(delay=0)
+    pm = card(provider)
+    first = OrderService.place_order(ITEMS, pm, "Παγκράτι", idempotency_key="checkout-retry")
+    again = OrderService.place_order(ITEMS, pm, "Παγκράτι", idempotency_key="checkout-retry")
+    assert again is first
+    assert provider.calls == 1
+    # without a key every call is a new order
+    OrderService.place_order(ITEMS, pm, "Παγκράτι")
+    assert provider.calls == 2
+
+
+def test_failed_attempt_can_be_retried(card):
+    provider = CountingProvider(delay=0)
+    with pytest.raises(PaymentDeclinedError):
+        OrderService.place_order(
+            ITEMS, card(provider, cvv="000"), "Παγκράτι", idempotency_key="checkout-fail"
+        )
+    order = OrderService.place_order(
+        ITEMS, card(provider), "Παγκράτι", idempotency_key="checkout-fail"
+    )
+    assert order.status == "confirmed"
+    assert provider.calls == 2
+
+
+def test_batch_deduplicates_repeated_keys(card):
+    provider = CountingProvider(delay=0.01)
+    req = {"items": ITEMS, "payment_method": card(provider), "address": "Παγκράτι",
+           "idempotency_key": "checkout-batch"}
+    results = OrderService.place_orders([req, dict(req), dict(req)])
+    assert provider.calls == 1
+    assert results[0] is results[1] is results[2]
+
+
+def test_cache_window_expires():
+    now = [0.0]
+    cache = IdempotencyCache(ttl=10.0, clock=lambda: now[0])
+    fut, owner = cache.claim("k")
+    assert owner
+    cache.resolve("k", "order")
+    fut, owner = cache.claim("k")
+    assert not owner and fut.result() == "order"
+    now[0] = 11.0
+    _, owner = cache.claim("k")
+    assert owner
+
+
+def test_timed_out_key_is_held_instead_of_charging_again(card):
+    provider = CountingProvider(delay=0.2)
+    provider.timeout = 0.05
+    pm = card(provider)
+    for _ in range(2):
+        with pytest.raises(PaymentTimeoutError):
+            OrderService.place_order(ITEMS, pm, "Παγκράτι", idempotency_key="checkout-timeout")
+    assert provider.calls == 1  # the retry did not reach the provider
+
+    # reconciled: the provider did not charge, so the key may run again
+    provider.delay = 0
+    async_order_service.idempotency.forget("checkout-timeout")
+    order = OrderService.place_order(ITEMS, pm, "Παγκράτι", idempotency_key="checkout-timeout")
+    assert order.status == "confirmed"
+    assert provider.calls == 2
+
+
+def test_key_reused_for_a_different_cart_is_rejected(card):
+    provider = CountingProvider(delay=0)
+    pm = card(provider)
+    OrderService.place_order(ITEMS, pm, "Παγκράτι", idempotency_key="checkout-reuse")
+    with pytest.raises(IdempotencyKeyReuseError):
+        OrderService.place_order(
+            ITEMS * 2, pm, "Παγκράτι", idempotency_key="checkout-reuse"
+        )
+    other_card = PaymentMethod(holder="Bob", number="5500000000000004", expiry="11/29", cvv="1")
+    other_card.provider = provider
+    with pytest.raises(IdempotencyKeyReuseError):
+        OrderService.place_order(ITEMS, other_card, "Παγκράτι", idempotency_key="checkout-reuse")
+    assert provider.calls == 1
+
+
+def test_held_key_can_be_settled():
+    cache = IdempotencyCache()
+    cache.claim("k", "fp")
+    cache.hold("k", PaymentTimeoutError("no answer"))
+    fut, owner = cache.claim("k", "fp")
+    assert not owner and isinstance(fut.exception(), PaymentTimeoutError)
+    assert cache.unknown() == ["k"]
+    cache.settle("k", "order")
+    fut, owner = cache.claim("k", "fp")
+    assert not owner and fut.result() == "order"
@@ -0,0 +1,50 @@
+from model.delivery_person import DeliveryPerson
+from model.geopoint import GeoPoint
+from model.location_table import LocationTable
+from service.dispatch_service import DispatchService
+from service.location_service import LocationIngestService
+
+
+def test_latest_position_and_stale_pings():
+    table = LocationTable(track_len=4, initial_slots=1)
+    changed = table.ingest(
+        [
+            ("a", 37.0, 23.0, 10.0),
+            ("b", 38.0, 24.0, 10.0),
+            ("a", 37.1, 23.1, 12.0),
+            ("a", 36.9, 22.9, 11.0),  # older than the fix above: ignored
+        ]
+    )
+    assert changed == {"a", "b"}
+    assert table.latest("a") == (37.1, 23.1, 12.0)
+    assert table.latest("b") == (38.0, 24.0, 10.0)
+    assert table.latest("c") is None
+    assert table.ingest([("b", 38.0, 24.0, 10.0)]) == set()  # replay
+
+
+def test_track_is_a_bounded_ring():
+    table = LocationTable(track_len=3)
+    table.ingest([("a", 37.0 + i, 23.0, float(i)) for i in range(5)])
+    assert [fix[2] for fix in table.track("a")] == [2.0, 3.0, 4.0]
+    assert table.track("unknown") == []
+
+
+def test_ingest_updates_dispatcher_once_per_courier():
+    dispatcher = DispatchService()
+    courier = DeliveryPerson(
+        name="Maria",
+        email="maria@example.com",
+        phone="+301234567890",
+        vehicle_type="Motorbike",
+        license_plate="AB-1",
+        password="Secret123",
+        experience=1,
+    )
+    dispatcher.register(courier)
+    service = LocationIngestService(dispatcher=dispatcher)
+    moved = service.ingest(
+        [(courier.id, 37.97, 23.73, 1.0), (courier.id, 37.98, 23.74, 2.0), ("ghost", 0, 0, 1.0)]
+    )
+    assert moved == 2
+    assert courier.currentLocation == GeoPoint(37.98, 23.74)
+    assert dispatcher.available.position(courier.id) == GeoPoint(37.98, 23.74)
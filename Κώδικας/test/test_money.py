@@ -0,0 +1,33 @@
+from model.menu_item import MenuItem
+from model.money import format_cents, from_cents, sum_cents, to_cents
+from model.order import Order
+
+
+def test_to_cents_rounds_like_a_person():
+    assert to_cents(10) == 1000
+    assert to_cents(0.1) == 10
+    assert to_cents(2.675) == 268  # float 2.675 is 2.67499..., but was typed as 2.675
+    assert to_cents("9.99") == 999
+    assert to_cents(-1.5) == -150
+    assert from_cents(1999) == 19.99
+
+
+def test_large_cart_total_is_exact():
+    items = [MenuItem("Cola", 0.1, "c.png")] * 100_000
+    assert sum(item.price for item in items) != 10_000.0  # float drift
+    assert sum_cents(items) == 1_000_000
+
+
+def test_order_total_is_stored_in_cents():
+    order = Order([MenuItem("Burger", 5.1, "b.png")], 5.1, "Παγκράτι")
+    assert order.total_cents == 510
+    assert order.total_amount == 5.1
+    order.total_amount = 7
+    assert order.total_cents == 700
+
+
+def test_format_cents():
+    assert format_cents(1000) == "€10.00"
+    assert format_cents(5) == "€0.05"
+    assert format_cents(-150) == "-€1.50"
+    assert format_cents(1000) is format_cents(1000)  # served from the cache
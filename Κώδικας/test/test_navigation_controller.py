@@ -0,0 +1,162 @@
+import sys
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6.QtCore import QEvent
+from PyQt6.QtGui import QPixmap
+
+from controller.navigation_controller import NavigationController
+from view.product_details_screen import ProductDetailsScreen
+
+
+def counting_factory(built, name):
+    def factory():
+        built.append(name)
+        return QtWidgets.QWidget()
+
+    return factory
+
+
+def test_screens_are_built_on_first_visit(app):
+    stack = QtWidgets.QStackedWidget()
+    nav = NavigationController(stack)
+    built = []
+    for name in ("home", "cart", "profile"):
+        nav.register_factory(name, counting_factory(built, name))
+    assert built == [] and stack.count() == 0
+
+    nav.on_tab_clicked("cart")
+    assert built == ["cart"]
+    assert stack.currentWidget() is nav.screen("cart")
+
+    nav.on_tab_clicked("cart")
+    nav.on_back_clicked()
+    assert built == ["cart", "home"]
+    assert stack.currentWidget() is nav.screen("home")
+    assert nav.screen("missing") is None
+
+
+def test_prewarm_builds_in_idle_time(app):
+    stack = QtWidgets.QStackedWidget()
+    nav = NavigationController(stack)
+    built = []
+    for name in ("home", "search", "cart"):
+        nav.register_factory(name, counting_factory(built, name))
+    nav.prewarm("search", "cart")
+    assert built == []  # nothing happens until the event loop runs
+    for _ in range(5):
+        app.processEvents()
+    assert built == ["search", "cart"]
+    assert stack.count() == 2
+
+
+class FakeDetailsScreen(QtWidgets.QWidget):
+    """A small widget tree with a pixmap, standing in for ProductDetailsScreen."""
+
+    def __init__(self, title):
+        super().__init__()
+        layout = QtWidgets.QVBoxLayout(self)
+        image = QtWidgets.QLabel()
+        pixmap = QPixmap(398, 220)
+        pixmap.fill()
+        image.setPixmap(pixmap)
+        layout.addWidget(image)
+        for text in (title, "€10.00", "Description"):
+            layout.addWidget(QtWidgets.QLabel(text))
+        layout.addWidget(QtWidgets.QPushButton("Add to Cart"))
+
+
+def test_dynamic_screens_are_bounded(app):
+    stack = QtWidgets.QStackedWidget()
+    nav = NavigationController(stack, max_dynamic_screens=2)
+    first, second, third = (FakeDetailsScreen(str(i)) for i in range(3))
+    for screen in (first, second, first, third):  # re-showing first refreshes it
+        nav.add_screen("details", screen)
+    assert list(nav.dynamic_screens) == [first, third]
+    assert stack.indexOf(second) == -1
+    assert stack.currentWidget() is third
+
+
+def test_soak_memory_stays_flat_over_many_product_opens(app):
+    stack = QtWidgets.QStackedWidget()
+    nav = NavigationController(stack, max_dynamic_screens=3)
+    nav.register_screen("home", QtWidgets.QWidget())
+
+    def open_products(n):
+        for i in range(n):
+            nav.add_screen("details", FakeDetailsScreen(f"Product {i}"))
+            nav.on_back_clicked()
+            if i % 100 == 0:
+                app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    open_products(100)
+    widgets_before = len(app.allWidgets())
+    open_products(10_000)
+    # every evicted screen's widget tree (and its pixmap) was freed
+    assert stack.count() == 1 + 3
+    assert len(app.allWidgets()) == widgets_before
+
+
+class DetailsHost:
+    """
+    The parts of MainWindow that show_product_details() uses, with a copy
+    of that method, so the real screen is soaked where main.py can't be
+    imported (view/add_card_dialog.py needs Python 3.12).
+    """
+
+    def __init__(self, nav):
+        self.nav_controller = nav
+        self.product_details_screen = None
+
+    def show_product_details(self, product_data: dict):
+        if self.product_details_screen is None:
+            self.product_details_screen = ProductDetailsScreen()
+            self.product_details_screen.backClicked.connect(
+                self.nav_controller.on_back_clicked
+            )
+            self.product_details_screen.productClicked.connect(
+                self.show_product_details
+            )
+        self.product_details_screen.set_product(product_data)
+        self.nav_controller.add_screen("details", self.product_details_screen)
+
+
+def soak_details(app, host_class):
+    stack = QtWidgets.QStackedWidget()
+    nav = NavigationController(stack, max_dynamic_screens=3)
+    nav.register_screen("home", QtWidgets.QWidget())
+    host = host_class(nav)
+
+    def open_products(n):
+        for i in range(n):
+            host.show_product_details(
+                {"title": f"Product {i}", "image": "resources/images/smoked_burger.png"}
+            )
+            app.processEvents()  # loads the recommended strip
+            host.product_details_screen.backClicked.emit()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    open_products(20)
+    screen = host.product_details_screen
+    widgets_before = len(app.allWidgets())
+    open_products(500)
+    assert host.product_details_screen is screen  # rebound, never rebuilt
+    assert stack.count() == 2
+    assert stack.currentWidget() is nav.screen("home")
+    assert len(app.allWidgets()) == widgets_before
+
+
+def test_soak_real_details_screen_stays_bounded(app):
+    soak_details(app, DetailsHost)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="main.py needs Python 3.12")
+def test_soak_main_window_show_product_details_stays_bounded(app):
+    from main import MainWindow
+
+    class MainWindowHost(DetailsHost):
+        show_product_details = MainWindow.show_product_details
+
+    soak_details(app, MainWindowHost)
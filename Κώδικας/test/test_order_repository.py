@@ -0,0 +1,131 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from model.menu_item import MenuItem
+from model.order import Order
+from service.order_repository import SCHEMA_VERSION, OrderRepository
+
+T0 = datetime(2025, 5, 1, 12, 0)
+
+
+def make_order(i, customer="alice", status="confirmed"):
+    order = Order(
+        [MenuItem("Burger", 5.0, "b.png", cuisine="Αμερικάνικη", rating=4.5, distance=0.2)],
+        5.0 + i,
+        "Παγκράτι",
+        customer_id=customer,
+    )
+    order.status = status
+    order.placedAt = T0 + timedelta(minutes=i)
+    return order
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = OrderRepository(str(tmp_path / "orders.db"), batch_size=7)
+    yield repo
+    repo.close()
+
+
+def test_round_trip(repo):
+    order = make_order(0)
+    order.customer_note = "no onions"
+    repo.add(order)
+    loaded = repo.get(order.id)
+    assert loaded.id == order.id
+    assert loaded.placedAt == order.placedAt
+    assert loaded.customer_note == "no onions"
+    assert loaded.items == order.items
+    assert loaded.customer_id == "alice"
+
+
+def test_wal_mode(repo):
+    assert repo._query("PRAGMA journal_mode", ())[0][0] == "wal"
+
+
+def test_recent_pages_by_keyset(repo):
+    orders = [make_order(i, customer="alice" if i % 2 else "bob") for i in range(40)]
+    assert repo.add_many(orders) == 40
+
+    alice = sorted(
+        (o for o in orders if o.customer_id == "alice"),
+        key=lambda o: o.placedAt,
+        reverse=True,
+    )
+    seen, cursor = [], None
+    while True:
+        page, cursor = repo.recent("alice", limit=6, before=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+    assert [o.id for o in seen] == [o.id for o in alice]
+
+
+def test_status_and_range_lookups(repo):
+    repo.add_many(make_order(i, status="pending" if i < 5 else "delivered") for i in range(20))
+    pending, cursor = repo.by_status("pending", limit=10)
+    assert len(pending) == 5 and cursor is None
+    assert [o.placedAt for o in pending] == sorted(o.placedAt for o in pending)
+
+    window = repo.placed_between(T0 + timedelta(minutes=3), T0 + timedelta(minutes=8))
+    assert [o.placedAt.minute for o in window] == [3, 4, 5, 6, 7]
+
+    assert repo.update_status(pending[0].id, "confirmed")
+    assert repo.count("pending") == 4
+
+
+def test_lookups_use_indexes(repo):
+    plans = {
+        "customer": "SELECT * FROM orders WHERE customer_id = 'a'"
+        " ORDER BY placed_at DESC, id DESC LIMIT 10",
+        "status": "SELECT * FROM orders WHERE status = 'pending' ORDER BY placed_at, id LIMIT 10",
+        "range": "SELECT * FROM orders WHERE placed_at >= 0 AND placed_at < 10"
+        " ORDER BY placed_at, id LIMIT 10",
+    }
+    for sql in plans.values():
+        plan = " ".join(r[-1] for r in repo._query("EXPLAIN QUERY PLAN " + sql, ()))
+        assert "USING INDEX" in plan and "TEMP B-TREE" not in plan
+
+
+def test_euro_totals_are_migrated_to_cents(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE orders (
+            id BLOB PRIMARY KEY, customer_id TEXT, status TEXT NOT NULL,
+            placed_at INTEGER NOT NULL, total_amount REAL NOT NULL,
+            delivery_address TEXT NOT NULL, customer_note TEXT, items TEXT NOT NULL
+        );
+        """
+    )
+    old = make_order(0)
+    conn.execute(
+        "INSERT INTO orders VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (old.id.bytes, "alice", "confirmed", 0, 2.675, "Παγκράτι", None, "[]"),
+    )
+    conn.commit()
+    conn.close()
+
+    repo = OrderRepository(path)
+    try:
+        assert repo._query("PRAGMA user_version", ())[0][0] == SCHEMA_VERSION
+        loaded = repo.get(old.id)
+        assert loaded.total_cents == 268 and isinstance(loaded.total_cents, int)
+    finally:
+        repo.close()
+    # opening it again does not convert twice
+    repo = OrderRepository(path)
+    try:
+        assert repo.get(old.id).total_cents == 268
+    finally:
+        repo.close()
+
+
+def test_menu_item_cents_follow_price():
+    item = MenuItem("Burger", 5.0, "b.png")
+    assert vars(item)["price_cents"] == 500  # stored, not recomputed per read
+    item.price = 6.5
+    assert item.price_cents == 650
@@ -0,0 +1,148 @@
+import os
+import pickle
+import threading
+
+import pytest
+
+from model.errors import InvalidOrderTransitionError
+from model.menu_item import MenuItem
+from model.order import Order
+from service.order_repository import OrderRepository
+from service.order_state_store import OrderStateStore
+
+
+def new_order():
+    return Order([MenuItem("Burger", 5.0, "b.png")], 5.0, "Παγκράτι")
+
+
+def test_happy_path_and_invalid_transitions():
+    order = new_order()
+    with pytest.raises(InvalidOrderTransitionError):
+        order.deliver()
+    order.confirm()
+    order.prepare()
+    order.dispatch()
+    with pytest.raises(InvalidOrderTransitionError):
+        order.cancel()  # already with the courier
+    order.deliver()
+    assert order.status == "delivered"
+
+
+def test_concurrent_transitions_apply_once():
+    order = new_order()
+    order.confirm()
+    start = threading.Barrier(8)
+    outcomes = []
+
+    def cancel():
+        start.wait()
+        try:
+            order.cancel()
+            outcomes.append("ok")
+        except InvalidOrderTransitionError:
+            outcomes.append("rejected")
+
+    threads = [threading.Thread(target=cancel) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert outcomes.count("ok") == 1
+
+
+def test_log_records_history(tmp_path):
+    store = OrderStateStore(str(tmp_path / "orders.log"))
+    order = store.track(new_order())
+    order.confirm()
+    order.prepare()
+    assert store.status(order.id) == "preparing"
+    assert [(e.old_status, e.new_status) for e in store.history(order.id)] == [
+        ("pending", "confirmed"),
+        ("confirmed", "preparing"),
+    ]
+    assert os.path.getsize(tmp_path / "orders.log") == 2 * 30
+
+
+def test_stale_copy_cannot_overwrite(tmp_path):
+    store = OrderStateStore(str(tmp_path / "orders.log"))
+    order = store.track(new_order())
+    order.confirm()
+    stale = store.track(new_order())
+    stale.id = order.id
+    stale.status = "pending"
+    order.cancel()
+    with pytest.raises(InvalidOrderTransitionError):
+        stale.confirm()
+    assert store.status(order.id) == "canceled"
+
+
+def test_recovery_from_snapshot_plus_tail(tmp_path):
+    path = str(tmp_path / "orders.log")
+    store = OrderStateStore(path, snapshot_every=5)
+    orders = [store.track(new_order()) for _ in range(4)]
+    for order in orders:
+        order.confirm()
+    orders[0].prepare()  # 5th event triggers a snapshot
+    orders[1].cancel()  # tail after the snapshot
+    store.close()
+    assert os.path.exists(path + ".snap")
+
+    reopened = OrderStateStore(path)
+    assert reopened._since_snapshot == 1  # only the tail was replayed
+    assert reopened.status(orders[0].id) == "preparing"
+    assert reopened.status(orders[1].id) == "canceled"
+    assert reopened.status(orders[2].id) == "confirmed"
+    assert len(reopened) == 4
+
+
+def test_torn_tail_is_discarded(tmp_path):
+    path = str(tmp_path / "orders.log")
+    store = OrderStateStore(path)
+    order = store.track(new_order())
+    order.confirm()
+    store.close()
+    with open(path, "ab") as f:
+        f.write(b"\x01" * 20)  # crash in the middle of a record
+
+    reopened = OrderStateStore(path)
+    assert reopened.status(order.id) == "confirmed"
+    assert os.path.getsize(path) == 30
+
+
+def test_transitions_reach_the_repository(tmp_path):
+    repo = OrderRepository(":memory:")
+    store = OrderStateStore(str(tmp_path / "orders.log"), repository=repo)
+    order = store.track(new_order())
+    order.confirm()
+    repo.add(order)
+    order.prepare()
+    order.dispatch()
+    assert repo.get(order.id).status == store.status(order.id) == "dispatched"
+    repo.close()
+
+
+def test_tracked_order_pickles_without_its_store(tmp_path):
+    store = OrderStateStore(str(tmp_path / "orders.log"))
+    order = store.track(new_order())
+    order.confirm()
+    copy = pickle.loads(pickle.dumps(order))
+    assert copy.id == order.id and copy.status == "confirmed"
+    assert copy.journal is None
+    copy.prepare()  # untracked copies still transition on their own
+
+
+def test_snapshot_past_the_end_of_the_log_is_discarded(tmp_path):
+    path = str(tmp_path / "orders.log")
+    store = OrderStateStore(path, snapshot_every=4)
+    orders = [store.track(new_order()) for _ in range(2)]
+    for order in orders:
+        order.confirm()
+        order.prepare()  # 4th event: snapshot at offset 120
+    store.close()
+    with open(path, "r+b") as f:
+        f.truncate(60)  # only the first order's two events survived
+
+    reopened = OrderStateStore(path)
+    assert reopened.status(orders[0].id) == "preparing"
+    assert reopened.status(orders[1].id) is None  # nothing on disk backs it
+    assert reopened._offset == 60
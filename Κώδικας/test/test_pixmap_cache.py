@@ -0,0 +1,54 @@
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6.QtGui import QColor, QPixmap
+
+from view.pixmap_cache import PixmapCache, pixmap_bytes
+
+
+@pytest.fixture
+def image(app, tmp_path):
+    pixmap = QPixmap(64, 32)
+    pixmap.fill(QColor("orange"))
+    path = str(tmp_path / "food.png")
+    assert pixmap.save(path)
+    return path
+
+
+def test_decodes_once_per_size(image):
+    cache = PixmapCache()
+    small = cache.get(image, 16, 16)
+    assert (small.width(), small.height()) == (16, 8)
+    for _ in range(200):
+        assert cache.get(image, 16, 16) is small
+    assert cache.decodes == 1
+    assert len(cache) == 1  # the full-size original is not kept
+
+    cache.get(image)
+    cache.get(image, 32, 32)  # scaled from the cached original
+    assert cache.decodes == 2
+    assert cache.hits == 200 and cache.misses == 3
+
+
+def test_missing_file_is_a_cached_null_pixmap(app, tmp_path):
+    cache = PixmapCache()
+    missing = str(tmp_path / "missing.png")
+    assert cache.get(missing, 24, 24).isNull()
+    assert cache.get(missing, 24, 24).isNull()
+    assert cache.decodes == 1
+
+
+def test_evicts_least_recently_used_within_budget(image):
+    one_icon = pixmap_bytes(PixmapCache().get(image, 16, 16))
+    cache = PixmapCache(budget_bytes=2 * one_icon)
+    cache.get(image, 16, 16)
+    cache.get(image, 16, 17)
+    cache.get(image, 16, 16)  # now most recently used
+    cache.get(image, 16, 18)  # over budget: (16, 17) goes
+    assert cache.used_bytes <= cache.budget_bytes
+    assert cache.evictions == 1
+    misses = cache.misses
+    cache.get(image, 16, 16)
+    assert cache.misses == misses
+    cache.get(image, 16, 17)
+    assert cache.misses == misses + 1
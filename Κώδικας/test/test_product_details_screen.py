@@ -0,0 +1,65 @@
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from view.pixmap_cache import pixmap_cache
+from view.product_details_screen import ProductDetailsScreen
+
+BURGER = {
+    "image": "resources/images/smoked_burger.png",
+    "title": "Smoked Burger",
+    "price": "€10.00",
+    "rating": "4.5",
+    "description": "Smoky.",
+}
+PIZZA = {
+    "image": "resources/images/pizza.png",
+    "title": "Pizza",
+    "price": "€8.00",
+    "time": "10-15",
+}
+
+
+def test_set_product_rebinds_in_place(app):
+    requested = []
+
+    def recommendations(product):
+        requested.append(product["title"])
+        return [dict(product, title=f"More like {product['title']}")]
+
+    screen = ProductDetailsScreen(BURGER, recommendations=recommendations)
+    widgets = len(screen.findChildren(QtWidgets.QWidget))
+    assert screen.lbl_title.text() == "Smoked Burger"
+    assert screen.lbl_rating.text() == "4.5"
+    assert requested == []  # the strip loads after the event loop turns
+
+    screen.set_product(PIZZA)
+    assert screen.lbl_title.text() == "Pizza"
+    assert screen.lbl_price.text() == "€8.00"
+    assert screen.lbl_time.text() == "10-15"
+    assert screen.lbl_rating.text() == "N/A"
+    assert not screen.image_label.pixmap().isNull()
+    assert len(screen.findChildren(QtWidgets.QWidget)) == widgets
+
+    app.processEvents()
+    assert requested == ["Pizza"]  # superseded products are never loaded
+    assert screen.recommended_grid.products[0]["title"] == "More like Pizza"
+
+
+def test_reopening_a_product_hits_the_pixmap_cache(app):
+    screen = ProductDetailsScreen(BURGER)
+    decodes = pixmap_cache.decodes
+    for _ in range(100):
+        screen.set_product(PIZZA)
+        screen.set_product(BURGER)
+    assert pixmap_cache.decodes - decodes <= 1
+
+
+def test_recommended_click_is_forwarded(app):
+    screen = ProductDetailsScreen(BURGER)
+    app.processEvents()
+    clicked = []
+    screen.productClicked.connect(clicked.append)
+    grid = screen.recommended_grid
+    grid.clicked.emit(grid.model().index(1, 0))
+    assert clicked[0]["title"] == "Smoked Burger"
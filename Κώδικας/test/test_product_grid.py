@@ -0,0 +1,57 @@
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from view.components.product_grid import PRODUCT_ROLE, ProductGrid
+from view.pixmap_cache import pixmap_cache
+
+IMAGES = ["resources/images/burger.png", "resources/images/pizza.png"]
+
+
+def products(n):
+    return [
+        {
+            "image": IMAGES[i % 2],
+            "title": f"Product {i}",
+            "rating": "4.5",
+            "distance": "1.2km",
+            "price": "€10.00",
+        }
+        for i in range(n)
+    ]
+
+
+def test_large_catalog_is_fetched_in_batches(app):
+    grid = ProductGrid(products(10_000), batch_size=50)
+    model = grid.model()
+    assert model.rowCount() == 50
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 100
+    assert len(grid.products) == 10_000
+    # no per-product widgets: just the view's own scroll bars and viewport
+    assert len(grid.findChildren(QtWidgets.QFrame)) < 10
+
+
+def test_paints_only_visible_cards_from_the_cache(app):
+    grid = ProductGrid(products(2_000))
+    grid.resize(400, 800)
+    decodes = pixmap_cache.decodes
+    grid.grab()
+    assert pixmap_cache.decodes - decodes <= len(IMAGES) + 2  # images + icons
+    grid.verticalScrollBar().setValue(grid.verticalScrollBar().maximum())
+    app.processEvents()
+    assert grid.model().rowCount() > 40  # scrolling to the end fetched more
+
+
+def test_click_emits_product_dict(app):
+    grid = ProductGrid(products(4))
+    clicked = []
+    grid.productClicked.connect(clicked.append)
+    index = grid.model().index(3, 0)
+    grid.clicked.emit(index)
+    assert clicked == [index.data(PRODUCT_ROLE)]
+    assert clicked[0]["title"] == "Product 3"
+
+    grid.set_products(products(1))
+    assert grid.model().rowCount() == 1
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+
+from model.cart import Cart
+from model.errors import InvalidPromoCodeError
+from model.menu_item import MenuItem
+from model.promo import PromoEngine, PromoRule
+
+NOW = datetime(2025, 5, 1, 12, 0)
+BURGER = MenuItem("Burger", 10.0, "b.png", "Γρήγορο φαγητό")
+SALAD = MenuItem("Salad", 6.0, "s.png", "Μεσογειακή")
+
+
+def cart_with(*lines):
+    cart = Cart()
+    for item, qty in lines:
+        cart.add(item, qty)
+    return cart
+
+
+def engine(*rules):
+    return PromoEngine(rules, clock=lambda: NOW)
+
+
+def test_percent_and_min_basket():
+    promos = engine(PromoRule("SAVE10", percent_off=10, min_basket_cents=2000))
+    with pytest.raises(InvalidPromoCodeError):
+        promos.discount_for("save10", cart_with((BURGER, 1)))
+    assert promos.discount_for(" save10 ", cart_with((BURGER, 3))) == 300
+
+
+def test_category_promo_discounts_only_that_category():
+    promos = engine(PromoRule("FAST50", percent_off=50, cuisine="Γρήγορο φαγητό", max_discount_cents=800))
+    cart = cart_with((BURGER, 1), (SALAD, 2))
+    assert promos.discount_for("FAST50", cart) == 500
+    cart.set_quantity("Burger", 3)
+    assert promos.discount_for("FAST50", cart) == 800  # capped
+    cart.remove("Burger")
+    with pytest.raises(InvalidPromoCodeError):
+        promos.discount_for("FAST50", cart)
+
+
+def test_first_order_and_time_window():
+    promos = engine(
+        PromoRule("WELCOME", amount_off_cents=300, first_order_only=True),
+        PromoRule("LUNCH", percent_off=15, starts=datetime(2025, 5, 1, 11), ends=datetime(2025, 5, 1, 15)),
+    )
+    cart = cart_with((BURGER, 1))
+    with pytest.raises(InvalidPromoCodeError):
+        promos.discount_for("WELCOME", cart)
+    assert promos.discount_for("WELCOME", cart, first_order=True) == 300
+    assert promos.discount_for("LUNCH", cart) == 150
+    with pytest.raises(InvalidPromoCodeError):
+        promos.discount_for("LUNCH", cart, now=datetime(2025, 5, 1, 20))
+    with pytest.raises(InvalidPromoCodeError):
+        promos.discount_for("NOPE", cart)
+
+
+def test_best_matches_brute_force_over_many_campaigns():
+    rules = []
+    cuisines = [None, "Γρήγορο φαγητό", "Μεσογειακή", "Ασιατική"]
+    for i in range(2000):
+        rules.append(
+            PromoRule(
+                f"P{i}",
+                percent_off=i % 30,
+                amount_off_cents=(i % 7) * 50,
+                min_basket_cents=(i % 40) * 100,
+                cuisine=cuisines[i % 4],
+                first_order_only=i % 11 == 0,
+                ends=datetime(2025, 6, 1) if i % 3 else datetime(2025, 4, 1),
+            )
+        )
+    promos = engine(*rules)
+    cart = cart_with((BURGER, 2), (SALAD, 1))
+
+    qualifying = {rule.code: off for rule, off in promos.evaluate(cart)}
+    expected = {}
+    for rule in rules:
+        try:
+            expected[rule.code] = promos.discount_for(rule.code, cart)
+        except InvalidPromoCodeError:
+            pass
+    assert qualifying == expected
+
+    rule, off = promos.best(cart)
+    assert off == max(expected.values())
+
+
+def test_index_follows_the_clock():
+    now = [datetime(2025, 5, 1, 10)]
+    promos = PromoEngine(
+        [PromoRule("LUNCH", percent_off=15, starts=datetime(2025, 5, 1, 11), ends=datetime(2025, 5, 1, 15))],
+        clock=lambda: now[0],
+    )
+    cart = cart_with((BURGER, 1))
+    assert promos.best(cart) is None
+    now[0] = datetime(2025, 5, 1, 12)
+    assert promos.best(cart)[1] == 150
+    now[0] = datetime(2025, 5, 1, 15)
+    assert promos.evaluate(cart) == []
+    promos.add(PromoRule("ALWAYS", amount_off_cents=100))
+    assert [rule.code for rule, _ in promos.evaluate(cart)] == ["ALWAYS"]
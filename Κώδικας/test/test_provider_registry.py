@@ -0,0 +1,193 @@
+import asyncio
+import time
+
+import pytest
+
+from model.errors import (
+    PaymentDeclinedError,
+    PaymentProviderUnavailableError,
+    PaymentTimeoutError,
+)
+from model.menu_item import MenuItem
+from model.payment_method import PaymentMethod, detect_brand
+from model.payment_provider import PaymentProvider
+from service.async_order_service import AsyncOrderService
+from service.provider_registry import ANY_BRAND, CircuitBreaker, ProviderRegistry
+
+
+class FakeProvider(PaymentProvider):
+    def __init__(self, name, up=True):
+        super().__init__(name=name, apiKey="key", timeout=0.5)
+        self.up = up
+        self.calls = 0
+        self.health_checks = 0
+
+    def testConnection(self):
+        self.health_checks += 1
+        return self.up
+
+    async def processTransactionAsync(self, payment_method, amount):
+        self.calls += 1
+        if not self.up:
+            raise ConnectionError(f"{self.name} is down")
+        return payment_method.cvv != "000"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def visa(cvv="123"):
+    return PaymentMethod(holder="Alice", number="4111111111111111", expiry="12/30", cvv=cvv)
+
+
+ITEMS = [MenuItem("Burger", 5.0, "b.png")]
+
+
+def test_detect_brand():
+    assert detect_brand("4111111111111111") == "visa"
+    assert detect_brand("5500000000000004") == "mastercard"
+    assert detect_brand("3714496353984312") == "card"
+    assert visa().brand == "visa"
+
+
+def test_routes_by_brand_with_catch_all():
+    registry = ProviderRegistry()
+    v, backup = FakeProvider("Visa"), FakeProvider("Backup")
+    registry.register("visa", v)
+    registry.register(ANY_BRAND, backup)
+    assert registry.route(visa()) == [v]
+    amex = PaymentMethod(holder="Bob", number="3714496353984312", expiry="12/30", cvv="123")
+    assert registry.route(amex) == [backup]
+
+
+def test_breaker_opens_then_half_opens():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    clock.now = 10
+    assert breaker.allow()  # the single half-open trial
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failover_and_circuit_breaking():
+    clock = Clock()
+    registry = ProviderRegistry(failure_threshold=2, reset_timeout=30, clock=clock)
+    primary, secondary = FakeProvider("Visa", up=False), FakeProvider("Backup")
+    registry.register("visa", primary)
+    registry.register("visa", secondary)
+    service = AsyncOrderService(registry=registry)
+
+    for _ in range(5):
+        order = asyncio.run(service.place_order(ITEMS, visa(), "Παγκράτι"))
+        assert order.status == "confirmed"
+    # the dead primary was tried until its breaker opened, then skipped
+    assert primary.calls == 2
+    assert secondary.calls == 5
+
+    # a decline is an answer, not a provider failure: no failover
+    with pytest.raises(PaymentDeclinedError):
+        asyncio.run(service.place_order(ITEMS, visa(cvv="000"), "Παγκράτι"))
+    assert registry.breaker(secondary).state == CircuitBreaker.CLOSED
+
+    # after the reset timeout the primary gets one trial call again
+    primary.up = True
+    clock.now = 31
+    asyncio.run(service.place_order(ITEMS, visa(), "Παγκράτι"))
+    assert primary.calls == 3
+    assert registry.breaker(primary).state == CircuitBreaker.CLOSED
+
+
+def test_cached_health_keeps_dead_provider_off_the_hot_path():
+    clock = Clock()
+    registry = ProviderRegistry(health_ttl=60, clock=clock)
+    primary, secondary = FakeProvider("Visa", up=False), FakeProvider("Backup")
+    registry.register("visa", primary)
+    registry.register("visa", secondary)
+    assert registry.refresh_health() == {"Visa": False, "Backup": True}
+
+    service = AsyncOrderService(registry=registry)
+    asyncio.run(service.place_order(ITEMS, visa(), "Παγκράτι"))
+    assert primary.calls == 0  # never tried while marked unhealthy
+    assert primary.health_checks == 1  # and not probed on the checkout path
+
+    clock.now = 61  # health result expired: the primary is tried again
+    assert list(registry.candidates(visa()))[0] is primary
+
+
+def test_all_providers_down():
+    registry = ProviderRegistry()
+    registry.register("visa", FakeProvider("Visa", up=False))
+    service = AsyncOrderService(registry=registry)
+    with pytest.raises(PaymentProviderUnavailableError):
+        asyncio.run(service.place_order(ITEMS, visa(), "Παγκράτι"))
+
+
+class SlowProvider(FakeProvider):
+    """
+    Blocking SDK that charges after `latency` seconds; its worker thread
+    finishes even if the caller gave up waiting.
+    """
+
+    def __init__(self, name, latency, timeout):
+        super().__init__(name)
+        self.latency = latency
+        self.timeout = timeout
+        self.charged = []
+
+    def processTransaction(self, payment_method, amount):
+        time.sleep(self.latency)
+        self.charged.append(amount)
+        return True
+
+    async def processTransactionAsync(self, payment_method, amount):
+        self.calls += 1
+        return await PaymentProvider.processTransactionAsync(self, payment_method, amount)
+
+
+def test_timeout_does_not_fail_over():
+    registry = ProviderRegistry()
+    primary = SlowProvider("Visa", latency=0.3, timeout=0.1)
+    secondary = FakeProvider("Backup")
+    registry.register("visa", primary)
+    registry.register("visa", secondary)
+    service = AsyncOrderService(registry=registry)
+
+    async def checkout():
+        with pytest.raises(PaymentTimeoutError):
+            await service.place_order(ITEMS, visa(), "Παγκράτι")
+        await asyncio.sleep(0.3)  # the primary's charge lands anyway
+
+    asyncio.run(checkout())
+    assert primary.charged == [5.0]
+    assert secondary.calls == 0  # so the card was charged once, not twice
+    assert service.unsettled == [(primary, service.unsettled[0][1], 5.0)]
+
+
+def test_cancelled_half_open_trial_is_released():
+    clock = Clock()
+    registry = ProviderRegistry(failure_threshold=1, reset_timeout=10, clock=clock)
+    primary = SlowProvider("Visa", latency=0.2, timeout=60)
+    registry.register("visa", primary)
+    registry.record_failure(primary)
+    clock.now = 10  # half-open: the next call is the single trial
+    service = AsyncOrderService(registry=registry)
+
+    async def cancelled_checkout():
+        task = asyncio.create_task(service.place_order(ITEMS, visa(), "Παγκράτι"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled_checkout())
+    assert registry.breaker(primary).allow()  # another trial may run
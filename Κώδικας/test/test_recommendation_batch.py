@@ -0,0 +1,67 @@
+import random
+import pytest
+
+from model.catalog import MenuCatalog
+from model.event_log import UserEvent
+from model.filters import Filters
+from model.menu_item import MenuItem
+from model.person import Person
+from model.preferences import Preferences
+from model.recommendation_algorithm import RecommendationAlgorithm
+
+CUISINES = ["Μεσογειακή", "Ιταλική", "Ασιατική"]
+MEALS = ["Μεσημεριανό", "Βραδινό"]
+
+
+@pytest.fixture(scope="module")
+def setup():
+    rnd = random.Random(3)
+    items = [
+        MenuItem(
+            f"item-{i}",
+            rnd.choice([4.0, 6.5, 8.0, 12.0]),
+            "x.png",
+            rnd.choice(CUISINES),
+            rnd.choice(MEALS),
+            rnd.choice([0.5, 1.0, 2.5]),
+            rnd.choice([10, 20, 45]),
+            rnd.choice([3.5, 4.0, 4.5]),
+        )
+        for i in range(500)
+    ]
+    algo = RecommendationAlgorithm(catalog=MenuCatalog(items), limit=5)
+    users = [Person(f"User {i}") for i in range(20)]
+    for user in users[:10]:
+        for item in rnd.sample(items, 5):
+            algo.record(UserEvent("order", user_id=user.id, item=item))
+    requests = [
+        (
+            rnd.choice(users),
+            rnd.choice([None, Preferences(rnd.choice(CUISINES), rnd.choice(MEALS))]),
+            rnd.choice([None, Filters(10.0, 2.0, 30), Filters(7.0, 3.0, 60)]),
+        )
+        for _ in range(300)
+    ]
+    return algo, requests
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_batch_matches_single_requests(setup, workers):
+    algo, requests = setup
+    batch = list(algo.getRecommendationsBatch(requests, workers=workers, chunk_size=32))
+    expected = [algo.getRecommendations(*request) for request in requests]
+    assert batch == expected
+
+
+def test_batch_is_lazy(setup):
+    algo, requests = setup
+    consumed = []
+
+    def source():
+        for r in requests:
+            consumed.append(r)
+            yield r
+
+    results = algo.getRecommendationsBatch(source(), workers=0, chunk_size=10)
+    next(results)
+    assert len(consumed) == 10
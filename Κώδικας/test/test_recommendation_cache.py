@@ -0,0 +1,87 @@
+import pytest
+
+from model.catalog import MenuCatalog
+from model.event_log import UserEvent
+from model.filters import Filters
+from model.menu_item import MenuItem
+from model.person import Person
+from model.preferences import Preferences
+from model.recommendation_algorithm import RecommendationAlgorithm
+from model.recommendation_cache import RecommendationCache, normalize_filters
+from model.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_lru_and_expiry():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.stats() == {
+        "size": 1,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "expirations": 1,
+    }
+
+
+def test_normalize_filters_rounds_up():
+    f = normalize_filters(Filters(max_price=9.99, max_distance=2.7, max_time=33))
+    assert (f.max_price, f.max_distance, f.max_time) == (10.0, 3.0, 35)
+
+
+@pytest.fixture
+def algo():
+    catalog = MenuCatalog(
+        [
+            MenuItem("Gyros", 4.5, "g.png", "Μεσογειακή", "Βραδινό", 1.0, 10, 4.0),
+            MenuItem("Moussaka", 9.8, "m.png", "Μεσογειακή", "Βραδινό", 1.0, 10, 4.9),
+        ]
+    )
+    return RecommendationAlgorithm(catalog=catalog, cache=RecommendationCache())
+
+
+def test_near_identical_queries_share_an_entry(algo):
+    prefs = Preferences("Μεσογειακή", "Βραδινό")
+    first = algo.getRecommendations(None, prefs, Filters(9.6, 2.6, 31))
+    second = algo.getRecommendations(None, prefs, Filters(9.9, 3.0, 34))
+    assert algo.cache.stats()["hits"] == 1
+    assert algo.cache.stats()["misses"] == 1
+    # each query keeps its exact limits: Moussaka (9.80) breaks only 9.60
+    assert [m.name for m in first] == ["Gyros"]
+    assert [m.name for m in second] == ["Moussaka", "Gyros"]
+
+
+def test_users_sharing_a_favourite_cuisine_are_ranked_apart():
+    lunch = MenuItem("Souvlaki", 6.0, "s.png", "Μεσογειακή", "Μεσημεριανό", 1.0, 10, 4.0)
+    dinner = MenuItem("Moussaka", 6.0, "m.png", "Μεσογειακή", "Βραδινό", 1.0, 10, 4.0)
+    algo = RecommendationAlgorithm(catalog=MenuCatalog([lunch, dinner]))
+    at_noon, at_night = Person("Noon"), Person("Night")
+    algo.record(UserEvent("order", user_id=at_noon.id, item=lunch))
+    algo.record(UserEvent("order", user_id=at_night.id, item=dinner))
+    # same favourite cuisine, different meal affinity: one cache entry,
+    # two rankings
+    assert algo.getRecommendations(at_noon, None, None) == [lunch, dinner]
+    assert algo.getRecommendations(at_night, None, None) == [dinner, lunch]
+    assert algo.cache.stats()["hits"] == 1
+
+
+def test_catalog_change_invalidates(algo):
+    prefs = Preferences("Μεσογειακή", "Βραδινό")
+    fltrs = Filters(20.0, 3.0, 30)
+    assert len(algo.getRecommendations(None, prefs, fltrs)) == 2
+    algo.set_catalog(MenuCatalog([]))
+    assert algo.getRecommendations(None, prefs, fltrs) == []
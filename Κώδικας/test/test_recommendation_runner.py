@@ -0,0 +1,83 @@
+import threading
+import time
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from controller.recommendation_runner import RecommendationRunner
+from model.filters import Filters
+from model.menu_item import MenuItem
+from model.recommendation_algorithm import RecommendationAlgorithm
+
+
+class SlowAlgorithm(RecommendationAlgorithm):
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def getRecommendations(self, user, prefs, fltrs):
+        time.sleep(self.delay)
+        return [MenuItem(f"fresh-{fltrs.max_price}", 1.0, "x.png")]
+
+
+def wait_for(app, results, count=1, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while len(results) < count and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def test_only_latest_request_is_delivered(app):
+    runner = RecommendationRunner(SlowAlgorithm(0.05), budget_ms=1000)
+    results = []
+    runner.finished.connect(lambda recs, fallback: results.append((recs, fallback)))
+    runner.request(None, None, Filters(5.0, 1.0, 10))
+    runner.request(None, None, Filters(7.0, 1.0, 10))
+    wait_for(app, results)
+    wait_for(app, results, count=2, timeout=0.3)  # nothing else may arrive
+    assert len(results) == 1
+    recs, fallback = results[0]
+    assert [m.name for m in recs] == ["fresh-7.0"] and fallback is False
+
+
+def test_slow_request_falls_back_to_popular(app):
+    algo = SlowAlgorithm(0.5)
+    runner = RecommendationRunner(algo, budget_ms=20)
+    results = []
+    runner.finished.connect(lambda recs, fallback: results.append((recs, fallback)))
+    fltrs = Filters(10.0, 5.0, 60)
+    runner.request(None, None, fltrs)
+    wait_for(app, results)
+    recs, fallback = results[0]
+    assert fallback is True
+    assert recs == algo.popular_recommendations(fltrs)
+    # the fresh result replaces the fallback once it is ready
+    wait_for(app, results, count=2)
+    recs, fallback = results[1]
+    assert [m.name for m in recs] == ["fresh-10.0"] and fallback is False
+    runner.pool.waitForDone()
+
+
+class CachedSlowAlgorithm(SlowAlgorithm):
+    def __init__(self, delay):
+        super().__init__(delay)
+        self.cache_threads = []
+
+    def cached_recommendations(self, user, prefs, fltrs):
+        self.cache_threads.append(threading.get_ident())
+        return [MenuItem("cached", 1.0, "x.png")]
+
+
+def test_cached_fallback_is_looked_up_off_the_gui_thread(app):
+    algo = CachedSlowAlgorithm(0.3)
+    runner = RecommendationRunner(algo, budget_ms=50)
+    results = []
+    runner.finished.connect(lambda recs, fallback: results.append((recs, fallback)))
+    runner.request(None, None, Filters(10.0, 5.0, 60))
+    wait_for(app, results, count=2)
+    assert [(recs[0].name, fallback) for recs, fallback in results] == [
+        ("cached", True),
+        ("fresh-10.0", False),
+    ]
+    assert algo.cache_threads and threading.get_ident() not in algo.cache_threads
+    runner.pool.waitForDone()
@@ -0,0 +1,44 @@
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from model.menu_item import MenuItem
+from model.order import Order
+from service.order_repository import OrderRepository
+from view.profile_screen import ProfileScreen
+from view.search_screen import SearchScreen
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = OrderRepository(str(tmp_path / "orders.db"))
+    yield repo
+    repo.close()
+
+
+def labels(widget):
+    return [label.text() for label in widget.findChildren(QtWidgets.QLabel)]
+
+
+def test_no_orders_shows_an_empty_state_not_samples(app, repo):
+    search = SearchScreen(repository=repo, customer_id="alice")
+    assert search.recent_orders == []
+    assert "No orders yet" in labels(search)
+
+    profile = ProfileScreen(repository=repo, customer_id="alice")
+    assert "No orders yet" in labels(profile)
+    assert "Burger With Meat" not in labels(profile)
+
+
+def test_stored_orders_replace_the_empty_state(app, repo):
+    repo.add(Order([MenuItem("Gyros", 4.0, "g.png")], 4.0, "Παγκράτι", customer_id="alice"))
+
+    search = SearchScreen(repository=repo, customer_id="alice")
+    assert [o["name"] for o in search.recent_orders] == ["Gyros"]
+    assert "No orders yet" not in labels(search)
+    assert "Gyros" in labels(ProfileScreen(repository=repo, customer_id="alice"))
+
+
+def test_without_a_repository_the_samples_stay(app):
+    assert len(SearchScreen().recent_orders) == 4
+    assert "Burger With Meat" in labels(ProfileScreen())
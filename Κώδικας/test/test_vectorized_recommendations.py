@@ -0,0 +1,59 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from model.catalog import MenuCatalog
+from model.catalog_columns import ColumnarCatalog
+from model.menu_item import MenuItem
+from model.behavior_profile import BehaviorProfile
+from model.event_log import UserEvent
+from model.preferences import Preferences
+from model.filters import Filters
+
+CUISINES = ["Μεσογειακή", "Ιταλική", "Ασιατική"]
+MEALS = ["Μεσημεριανό", "Βραδινό"]
+
+
+@pytest.fixture(scope="module")
+def catalogs():
+    rnd = random.Random(7)
+    # coarse values on purpose so that many scores tie
+    items = [
+        MenuItem(
+            name=f"item-{i}",
+            price=rnd.choice([4.0, 6.5, 8.0, 12.0]),
+            image="burger.png",
+            cuisine=rnd.choice(CUISINES),
+            meal_type=rnd.choice(MEALS),
+            distance=rnd.choice([0.5, 1.0, 2.5, 6.0]),
+            prep_time=rnd.choice([10, 20, 45]),
+            rating=rnd.choice([3.5, 4.0, 4.5, 5.0]),
+        )
+        for i in range(3000)
+    ]
+    catalog = MenuCatalog(items)
+    return catalog, ColumnarCatalog(catalog)
+
+
+@pytest.mark.parametrize("k", [1, 5, 50, 5000])
+@pytest.mark.parametrize(
+    "prefs",
+    [None, Preferences("Ιταλική", "Βραδινό"), Preferences("Κινέζικη", "Βραδινό")],
+)
+@pytest.mark.parametrize(
+    "fltrs",
+    [None, Filters(10.0, 3.0, 30), Filters(1.0, 1.0, 1)],
+)
+def test_vectorized_top_matches_scalar(catalogs, prefs, fltrs, k):
+    scalar, columnar = catalogs
+    assert columnar.top(prefs, fltrs, k) == scalar.top(prefs, fltrs, k)
+
+
+def test_vectorized_top_matches_scalar_with_profile(catalogs):
+    scalar, columnar = catalogs
+    profile = BehaviorProfile()
+    for item in scalar.items[:40]:
+        profile.update(UserEvent("order", item=item))
+    fltrs = Filters(10.0, 3.0, 30)
+    assert columnar.top(None, fltrs, 25, profile) == scalar.top(None, fltrs, 25, profile)
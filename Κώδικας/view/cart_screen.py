@@ -3,25 +3,55 @@ import os
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QHBoxLayout, QLineEdit, QPushButton,
-    QFrame, QScrollArea, QCheckBox, QToolButton, QSpinBox, QSizePolicy
+    QFrame, QScrollArea, QCheckBox, QToolButton, QSpinBox, QSizePolicy,
+    QMessageBox
 )
 from PyQt6.QtGui import QFont, QIcon, QPixmap
 from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from config.settings import SETTINGS
 from view.components.bottom_nav import BottomNav
+from model.cart import Cart, CartLine, LINE_ADDED, LINE_REMOVED, LINE_UPDATED, TOTALS_CHANGED
+from model.errors import InvalidPromoCodeError
+from model.menu_item import MenuItem
+from model.money import format_cents
+from model.promo import PromoEngine, default_promos
 
 class CartScreen(QWidget):
     """
     A Cart Screen closely replicating the provided design.
     Includes a top bar, delivery location info, promo code row,
     cart items, payment summary, and an 'Order Now' button.
+
+    The screen renders a Cart model and listens to it: a change touches
+    only the affected row and the summary labels.
     """
     backClicked = pyqtSignal()  # Emitted when the back button is pressed
 
-    def __init__(self, parent=None):
+    def __init__(
+        self,
+        parent=None,
+        cart: Cart = None,
+        promos: PromoEngine = None,
+        first_order: bool = False,
+    ):
+        """
+        :param first_order: True when the customer has no earlier orders, which
+            makes first-order-only promos apply.
+        """
         super().__init__(parent)
         logging.debug("Initializing CartScreen.")
+        if cart is None:
+            # Placeholder cart contents
+            cart = Cart()
+            cart.add(MenuItem("Burger With Meat", 12.0, "smoked_burger.png", "Γρήγορο φαγητό"))
+            cart.add(MenuItem("Ordinary Burgers", 12.0, "classic_burger.png", "Γρήγορο φαγητό"))
+        self.cart = cart
+        self.promos = promos if promos is not None else PromoEngine(default_promos())
+        self.promo_code = None  # code currently applied to the cart
+        self.first_order = first_order
+        self._rows = {}  # line key -> (row widget, price label, quantity spinbox)
         self.setup_ui()
+        self.cart.subscribe(self.on_cart_changed)
 
     def setup_ui(self):
         """
@@ -53,7 +83,7 @@ class CartScreen(QWidget):
         promo_row = self.create_promo_row()
         content_layout.addWidget(promo_row)
 
-        # 4. Cart Items Section (2 placeholders for now)
+        # 4. Cart Items Section
         cart_items_section = self.create_cart_items_section()
         content_layout.addWidget(cart_items_section)
 
@@ -188,7 +218,7 @@ class CartScreen(QWidget):
         layout.setSpacing(8)
 
         # Promo Code Input
-        promo_input = QLineEdit()
+        self.promo_input = promo_input = QLineEdit()
         promo_input.setPlaceholderText("Promo Code. . .")
         promo_input.setFont(QFont(SETTINGS["font_family"], 12))
         promo_input.setStyleSheet("""
@@ -215,6 +245,7 @@ class CartScreen(QWidget):
                 background-color: #FF9E22;
             }
         """)
+        btn_apply.clicked.connect(self.on_apply_promo)
         layout.addWidget(btn_apply, alignment=Qt.AlignmentFlag.AlignRight)
 
         return container
@@ -231,31 +262,22 @@ class CartScreen(QWidget):
         logging.debug("Creating cart items section.")
         container = QFrame()
         container.setObjectName("cartItemsSection")
-        container_layout = QVBoxLayout(container)
-        container_layout.setContentsMargins(16, 8, 16, 8)
-        container_layout.setSpacing(16)
-
-        # Add two placeholder items
-        item1 = self.create_cart_item_widget(
-            image="resources/images/smoked_burger.png",
-            name="Burger With Meat",
-            price="€ 12"
-        )
-        item2 = self.create_cart_item_widget(
-            image="resources/images/classic_burger.png",
-            name="Ordinary Burgers",
-            price="€ 12"
-        )
+        self.items_layout = QVBoxLayout(container)
+        self.items_layout.setContentsMargins(16, 8, 16, 8)
+        self.items_layout.setSpacing(16)
 
-        container_layout.addWidget(item1)
-        container_layout.addWidget(item2)
+        for line in self.cart:
+            self.items_layout.addWidget(self.create_cart_item_widget(line))
 
         return container
 
-    def create_cart_item_widget(self, image: str, name: str, price: str) -> QWidget:
+    def create_cart_item_widget(self, line: CartLine) -> QWidget:
         """
-        Creates an individual cart item row.
+        Creates an individual cart item row and remembers its widgets so the
+        row can be updated in place.
         """
+        image = os.path.join("resources/images", line.item.image)
+        name = line.item.name
         item_container = QFrame()
         item_container.setStyleSheet("""
             QFrame {
@@ -292,7 +314,7 @@ class CartScreen(QWidget):
         name_label.setStyleSheet("color: #1E1E1E;")
         info_layout.addWidget(name_label)
 
-        price_label = QLabel(price)
+        price_label = QLabel(format_cents(line.total_cents))
         price_label.setFont(QFont(SETTINGS["font_family"], 12, QFont.Weight.Bold))
         price_label.setStyleSheet("color: #FE8C00;")
         info_layout.addWidget(price_label)
@@ -304,7 +326,7 @@ class CartScreen(QWidget):
 
         quantity_spinbox = QSpinBox()
         quantity_spinbox.setRange(1, 99)
-        quantity_spinbox.setValue(1)
+        quantity_spinbox.setValue(line.quantity)
         quantity_spinbox.setStyleSheet("""
             QSpinBox {
                 width: 40px;
@@ -313,6 +335,9 @@ class CartScreen(QWidget):
                 color: black;
             }
         """)
+        quantity_spinbox.valueChanged.connect(
+            lambda value, key=line.key: self.cart.set_quantity(key, value)
+        )
         qty_layout.addWidget(quantity_spinbox)
 
 
@@ -325,18 +350,20 @@ class CartScreen(QWidget):
         remove_btn.setIcon(QIcon("resources/icons/trash.png"))
         remove_btn.setIconSize(QSize(20, 20))
         remove_btn.setStyleSheet("border: none; background-color: transparent;")
-        # remove_btn.clicked.connect(...) # If you want to handle removal
+        remove_btn.clicked.connect(lambda _=False, key=line.key: self.cart.remove(key))
         layout.addWidget(remove_btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
+        self._rows[line.key] = (item_container, price_label, quantity_spinbox)
         return item_container
 
     def create_payment_summary(self) -> QWidget:
         """
-        Creates the Payment Summary block with placeholders:
-          - Total Items (3)
+        Creates the Payment Summary block:
+          - Total Items
           - Delivery Fee (Free)
           - Discount
           - Total
+        The labels are filled in by update_summary().
         """
         logging.debug("Creating payment summary section.")
         container = QFrame()
@@ -357,17 +384,17 @@ class CartScreen(QWidget):
         layout.addWidget(title_label)
 
         # Items
-        lbl_items = QLabel("Total Items (3)")
+        self.lbl_items = lbl_items = QLabel()
         lbl_items.setFont(QFont(SETTINGS["font_family"], 12))
         lbl_items.setStyleSheet("color: #646464;")
         layout.addWidget(lbl_items)
 
-        lbl_delivery_fee = QLabel("Delivery Fee   Free")
+        self.lbl_delivery_fee = lbl_delivery_fee = QLabel()
         lbl_delivery_fee.setFont(QFont(SETTINGS["font_family"], 12))
         lbl_delivery_fee.setStyleSheet("color: #646464;")
         layout.addWidget(lbl_delivery_fee)
 
-        lbl_discount = QLabel("Discount   -")
+        self.lbl_discount = lbl_discount = QLabel()
         lbl_discount.setFont(QFont(SETTINGS["font_family"], 12))
         lbl_discount.setStyleSheet("color: #646464;")
         layout.addWidget(lbl_discount)
@@ -378,13 +405,72 @@ class CartScreen(QWidget):
         divider.setFrameShadow(QFrame.Shadow.Sunken)
         layout.addWidget(divider)
 
-        lbl_total = QLabel("Total   €12")
+        self.lbl_total = lbl_total = QLabel()
         lbl_total.setFont(QFont(SETTINGS["font_family"], 14, QFont.Weight.Bold))
         lbl_total.setStyleSheet("color: #1E1E1E;")
         layout.addWidget(lbl_total)
 
+        self.update_summary()
         return container
 
+    # ----------------------------------------------------------------
+    #   Cart updates
+    # ----------------------------------------------------------------
+
+    def on_cart_changed(self, kind: str, line: CartLine):
+        """Apply one Cart change to the affected row, then the summary."""
+        if kind != TOTALS_CHANGED and self.promo_code is not None:
+            self.refresh_promo()  # may emit TOTALS_CHANGED; summary below covers it
+        if kind == LINE_ADDED:
+            self.items_layout.addWidget(self.create_cart_item_widget(line))
+        elif kind == LINE_REMOVED:
+            row, _, _ = self._rows.pop(line.key)
+            self.items_layout.removeWidget(row)
+            row.deleteLater()
+        elif kind == LINE_UPDATED:
+            _, price_label, spinbox = self._rows[line.key]
+            price_label.setText(format_cents(line.total_cents))
+            if spinbox.value() != line.quantity:
+                spinbox.blockSignals(True)
+                spinbox.setValue(line.quantity)
+                spinbox.blockSignals(False)
+        self.update_summary()
+
+    def on_apply_promo(self):
+        code = self.promo_input.text()
+        if not code.strip():
+            return
+        try:
+            discount = self.promos.discount_for(code, self.cart, self.first_order)
+        except InvalidPromoCodeError as e:
+            logging.debug(f"CartScreen.on_apply_promo(): {e}")
+            QMessageBox.warning(self, "Promo Code", str(e))
+            return
+        self.promo_code = code
+        self.cart.set_discount(discount)
+
+    def refresh_promo(self):
+        """Recompute the applied promo after the cart changed; drop it if it no longer qualifies."""
+        try:
+            discount = self.promos.discount_for(self.promo_code, self.cart, self.first_order)
+        except InvalidPromoCodeError:
+            self.promo_code = None
+            discount = 0
+        self.cart.set_discount(discount)
+
+    def update_summary(self):
+        cart = self.cart
+        self.lbl_items.setText(f"Total Items ({cart.item_count})")
+        fee = cart.delivery_fee_cents
+        self.lbl_delivery_fee.setText(
+            f"Delivery Fee   {format_cents(fee) if fee else 'Free'}"
+        )
+        discount = min(cart.discount_cents, cart.subtotal_cents)
+        self.lbl_discount.setText(
+            f"Discount   {format_cents(-discount) if discount else '-'}"
+        )
+        self.lbl_total.setText(f"Total   {format_cents(cart.total_cents)}")
+
     def create_order_button(self) -> QWidget:
         """
         Creates the 'Order Now' button at the bottom.
@@ -1,8 +1,11 @@
 # view/components/product_card.py
-import os
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFrame
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt, pyqtSignal
+from view.pixmap_cache import cached_pixmap
+
+STAR_ICON = "resources/icons/star.png"
+LOCATION_ICON = "resources/icons/location.png"
 
 
 class ProductCard(QFrame):
@@ -28,12 +31,7 @@ class ProductCard(QFrame):
 
         # --- Product Image ---
         image_label = QLabel()
-        pixmap = QPixmap(image).scaled(
-            144,
-            100,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        pixmap = cached_pixmap(image, 144, 100)
         image_label.setPixmap(pixmap)
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(image_label)
@@ -47,25 +45,9 @@ class ProductCard(QFrame):
         # --- Rating and Distance Row (with icons) ---
         info_layout = QHBoxLayout()
         info_layout.setSpacing(4)
-        # Compute the base directory relative to this file.
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        star_icon_path = os.path.join(
-            script_dir, "..", "..", "resources", "icons", "star.png"
-        )
-        location_icon_path = os.path.join(
-            script_dir, "..", "..", "resources", "icons", "location.png"
-        )
-        print(f"DEBUG: Star icon path: {star_icon_path}")
-        print(f"DEBUG: Location icon path: {location_icon_path}")
         # Star icon for rating
         star_label = QLabel()
-        star_pix = QPixmap(star_icon_path).scaled(
-            14,
-            14,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        star_label.setPixmap(star_pix)
+        star_label.setPixmap(cached_pixmap(STAR_ICON, 14, 14))
         info_layout.addWidget(star_label)
 
         # Rating text
@@ -80,13 +62,7 @@ class ProductCard(QFrame):
 
         # Location icon for distance
         location_icon_label = QLabel()
-        loc_pix = QPixmap(location_icon_path).scaled(
-            14,
-            14,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        location_icon_label.setPixmap(loc_pix)
+        location_icon_label.setPixmap(cached_pixmap(LOCATION_ICON, 14, 14))
         info_layout.addWidget(location_icon_label)
 
         # Distance text
@@ -1,44 +1,197 @@
 # view/components/product_grid.py
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGridLayout
-from PyQt6.QtCore import Qt, pyqtSignal
-from functools import partial
-from view.components.product_card import ProductCard
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QFrame
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QRect,
+    QRectF,
+    QSize,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QFont, QPainter, QPainterPath
+from view.components.product_card import LOCATION_ICON, STAR_ICON
+from view.pixmap_cache import cached_pixmap
 
-class ProductGrid(QWidget):
+# Item data role carrying the product dictionary.
+PRODUCT_ROLE = Qt.ItemDataRole.UserRole
+
+CARD_WIDTH = 160
+CARD_HEIGHT = 240
+
+
+class ProductListModel(QAbstractListModel):
+    """
+    List model over product dictionaries (image, title, rating, distance,
+    price). Rows are exposed `batch_size` at a time: the view asks for the
+    next batch through fetchMore() as the user scrolls towards the end.
+    """
+
+    def __init__(self, products=(), batch_size: int = 40, parent=None):
+        super().__init__(parent)
+        self.batch_size = batch_size
+        self.products = list(products)
+        self._loaded = min(batch_size, len(self.products))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        product = self.products[index.row()]
+        if role == PRODUCT_ROLE:
+            return product
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return product.get("title", "")
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self.products)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.batch_size, len(self.products) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def set_products(self, products):
+        """Replace the products, starting again from the first batch."""
+        self.beginResetModel()
+        self.products = list(products)
+        self._loaded = min(self.batch_size, len(self.products))
+        self.endResetModel()
+
+
+class ProductCardDelegate(QStyledItemDelegate):
+    """
+    Paints a product the way ProductCard lays it out: image, title,
+    rating and distance with icons, price. No widgets are created, and
+    images come from the shared pixmap cache.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Inter", 12, QFont.Weight.Bold)
+        self.info_font = QFont("Inter")
+        self.info_font.setPixelSize(11)
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index):
+        product = index.data(PRODUCT_ROLE)
+        if product is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card = QRect(option.rect.topLeft(), QSize(CARD_WIDTH, CARD_HEIGHT))
+
+        background = QPainterPath()
+        background.addRoundedRect(QRectF(card), 16, 16)
+        hovered = option.state & QStyle.StateFlag.State_MouseOver
+        painter.fillPath(background, QColor("#FFF4E8" if hovered else "white"))
+
+        inner = card.adjusted(8, 8, -8, -8)
+        image = cached_pixmap(product.get("image", ""), 144, 100)
+        if not image.isNull():
+            painter.drawPixmap(
+                inner.left() + (inner.width() - image.width()) // 2,
+                inner.top() + (100 - image.height()) // 2,
+                image,
+            )
+        y = inner.top() + 108
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#1E1E1E"))
+        title_rect = QRect(inner.left(), y, inner.width(), 22)
+        title = painter.fontMetrics().elidedText(
+            product.get("title", ""), Qt.TextElideMode.ElideRight, inner.width()
+        )
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignVCenter, title)
+        y += 30
+
+        painter.setFont(self.info_font)
+        painter.setPen(QColor("#9A9A9A"))
+        x = inner.left()
+        for icon, text in (
+            (STAR_ICON, product.get("rating", "")),
+            (LOCATION_ICON, product.get("distance", "")),
+        ):
+            painter.drawPixmap(x, y + 3, cached_pixmap(icon, 14, 14))
+            x += 18
+            painter.drawText(
+                QRect(x, y, 48, 20), Qt.AlignmentFlag.AlignVCenter, text
+            )
+            x += 52
+        y += 28
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#FE8C00"))
+        painter.drawText(
+            QRect(inner.left(), y, inner.width(), 22),
+            Qt.AlignmentFlag.AlignVCenter,
+            product.get("price", ""),
+        )
+        painter.restore()
+
+
+class ProductGrid(QListView):
     """
-    Displays products in a grid layout.
+    Displays products in a wrapping grid of cards.
+    Only the cards in the viewport are painted, and rows are fetched in
+    batches while scrolling, so thousands of products cost no widgets.
     Emits a signal with product details when any product card is clicked.
     """
     # Signal to emit a dictionary with product details.
     productClicked = pyqtSignal(dict)
 
-    def __init__(self, products, parent=None):
+    def __init__(self, products, parent=None, batch_size: int = 40):
         """
         :param products: A list of dictionaries containing product data.
         """
         super().__init__(parent)
-        self.products = products
+        self.product_model = ProductListModel(products, batch_size, self)
         self.setup_ui()
 
+    @property
+    def products(self):
+        return self.product_model.products
+
     def setup_ui(self):
-        layout = QVBoxLayout()
-        layout.setSpacing(16)
-
-        # Grid layout (2 columns) for the product cards.
-        grid = QGridLayout()
-        grid.setSpacing(10)
-
-        for i, product in enumerate(self.products):
-            # Create a product card for each product.
-            card = ProductCard(**product)
-            # Instead of lambda, use partial to capture the product dictionary.
-            card.clicked.connect(partial(self.emit_product, product))
-            row, col = divmod(i, 2)
-            grid.addWidget(card, row, col, alignment=Qt.AlignmentFlag.AlignCenter)
-
-        layout.addLayout(grid)
-        self.setLayout(layout)
+        self.setModel(self.product_model)
+        self.setItemDelegate(ProductCardDelegate(self))
+
+        # Wrapping grid of fixed-size cards (2 columns at the default width).
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setGridSize(QSize(CARD_WIDTH + 20, CARD_HEIGHT + 16))
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setMouseTracking(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setStyleSheet("QListView { background: transparent; }")
+        # Tall enough for two rows of cards inside an outer scroll area.
+        self.setMinimumHeight(2 * (CARD_HEIGHT + 16))
+
+        self.clicked.connect(self.on_item_clicked)
+
+    def set_products(self, products):
+        self.product_model.set_products(products)
+        self.scrollToTop()
+
+    def on_item_clicked(self, index: QModelIndex):
+        self.emit_product(index.data(PRODUCT_ROLE))
 
     def emit_product(self, product: dict):
         """
@@ -7,6 +7,7 @@ from view.components.topbar_widget import TopBarWidget
 from view.components.category_widget import CategoryWidget
 from view.components.product_grid import ProductGrid
 from view.components.bottom_nav import BottomNav
+from model.money import format_cents
 
 
 class HomeScreen(QWidget):
@@ -64,32 +65,32 @@ class HomeScreen(QWidget):
                 "title": "Smoked Burger",
                 "rating": "4.5",
                 "distance": "1.2km",
-                "price": "€10.00",
+                "price": format_cents(1000),
             },
             {
                 "image": "resources/images/classic_burger.png",
                 "title": "Classic Burger",
                 "rating": "4.7",
                 "distance": "2.0km",
-                "price": "€9.50",
+                "price": format_cents(950),
             },
             {
                 "image": "resources/images/cheeseburger.png",
                 "title": "Cheeseburger",
                 "rating": "4.9",
                 "distance": "3.0km",
-                "price": "€8.00",
+                "price": format_cents(800),
             },
             {
                 "image": "resources/images/ten_years_old_beef_burger.png",
                 "title": "Beef Burger",
                 "rating": "4.1",
                 "distance": "1.1km",
-                "price": "€15.50",
+                "price": format_cents(1550),
             },
         ]
         self.product_grid = ProductGrid(products)
-        self.content_layout.addWidget(self.product_grid)
+        self.content_layout.addWidget(self.product_grid, stretch=1)
 
         # IMPORTANT: Add bottom padding to the content layout so that the last elements
         # are not hidden behind the bottom nav.
@@ -224,14 +224,8 @@ class PaymentMethodsScreen(QWidget):
         self._populate_methods()
 
     def _detect_logo(self, pm: PaymentMethod) -> str:
-        """Quick hack: choose logo based on first digit."""
-        first = pm.number[0]
-        if first == "4":
-            return "visa.png"
-        if first == "5":
-            return "mastercard.png"
-        # fallback
-        return "card.png"
+        """Logo file for the card brand (visa.png, mastercard.png or card.png)."""
+        return f"{pm.brand}.png"
 
     def _populate_methods(self):
         """
@@ -0,0 +1,123 @@
+# view/pixmap_cache.py
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+
+from config.settings import SETTINGS
+
+KeepAspectRatio = Qt.AspectRatioMode.KeepAspectRatio
+KeepAspectRatioByExpanding = Qt.AspectRatioMode.KeepAspectRatioByExpanding
+
+# Project root, so "resources/icons/x.png" resolves the same from any view.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pixmap_bytes(pixmap: QPixmap) -> int:
+    """Approximate memory held by a decoded pixmap."""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class PixmapCache:
+    """
+    Process-wide cache of decoded and scaled pixmaps.
+
+    Entries are keyed on (path, size, aspect mode), so each asset is read
+    from disk and scaled once per size it is shown at. They are evicted least
+    recently used first when their total size exceeds `budget_bytes`.
+    Missing files are cached as null pixmaps, so a broken path is looked up
+    only once. Like all QPixmap use, call it from the GUI thread only.
+    """
+
+    def __init__(self, budget_bytes: int = 32 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # key -> (pixmap, size in bytes)
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def resolve(path: str) -> str:
+        return os.path.normpath(os.path.join(_ROOT, path))
+
+    def get(
+        self,
+        path: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        mode: Qt.AspectRatioMode = KeepAspectRatio,
+    ) -> QPixmap:
+        """
+        The image at `path` scaled into width x height with a smooth
+        transformation, or unscaled if no size is given. A null QPixmap is
+        returned if the file cannot be read.
+        """
+        path = self.resolve(path)
+        size = (width, height) if width is not None else None
+        key = (path, size, mode if size else None)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        # Full-size originals are only kept when asked for: decoded, some
+        # icons take megabytes and would crowd the scaled copies out.
+        original = self._entries.get((path, None, None))
+        if original is not None:
+            pixmap = original[0]
+        else:
+            pixmap = QPixmap(path)
+            self.decodes += 1
+        if size is not None and not pixmap.isNull():
+            pixmap = pixmap.scaled(
+                width, height, mode, Qt.TransformationMode.SmoothTransformation
+            )
+        self._store(key, pixmap)
+        return pixmap
+
+    def _store(self, key: Tuple, pixmap: QPixmap) -> None:
+        nbytes = pixmap_bytes(pixmap)
+        if nbytes > self.budget_bytes:
+            return  # would evict everything else; hand it out uncached
+        self._entries[key] = (pixmap, nbytes)
+        self.used_bytes += nbytes
+        while self.used_bytes > self.budget_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.used_bytes -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.used_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "decodes": self.decodes,
+            "evictions": self.evictions,
+        }
+
+
+pixmap_cache = PixmapCache(SETTINGS["pixmap_cache_mb"] * 1024 * 1024)
+
+
+def cached_pixmap(
+    path: str,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    mode: Qt.AspectRatioMode = KeepAspectRatio,
+) -> QPixmap:
+    """Shorthand for pixmap_cache.get()."""
+    return pixmap_cache.get(path, width, height, mode)
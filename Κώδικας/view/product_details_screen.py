@@ -1,14 +1,46 @@
-import os
 import logging
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QScrollArea,
-    QFrame, QHBoxLayout, QToolButton, QSpinBox, QSizePolicy, QGridLayout
+    QFrame, QHBoxLayout, QToolButton, QSpinBox, QSizePolicy
 )
-from PyQt6.QtGui import QPixmap, QFont, QIcon
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
 from config.settings import SETTINGS
-from view.components.product_card import ProductCard  # Ensure this component is available
+from view.components.product_grid import ProductGrid
+from view.pixmap_cache import cached_pixmap
+
+DEFAULT_DESCRIPTION = (
+    "Burger With Meat is a popular dish, known for its rich flavors and "
+    "high-quality ingredients. It is highly recommended."
+)
+
+
+def default_recommendations(product_data: dict) -> list:
+    """Hard-coded recommended product examples, used for every product."""
+    return [
+        {
+            "image": "resources/images/classic_burger.png",
+            "title": "Classic Burger",
+            "rating": "4.7",
+            "distance": "2.0km",
+            "price": "$9.50"
+        },
+        {
+            "image": "resources/images/smoked_burger.png",
+            "title": "Smoked Burger",
+            "rating": "4.5",
+            "distance": "1.5km",
+            "price": "$10.00"
+        },
+        {
+            "image": "resources/images/classic_burger.png",
+            "title": "Cheese Burger",
+            "rating": "4.6",
+            "distance": "1.8km",
+            "price": "$9.80"
+        }
+    ]
 
 
 class ProductDetailsScreen(QWidget):
@@ -21,13 +53,20 @@ class ProductDetailsScreen(QWidget):
           • A row for Price.
           • A row for Delivery info, Estimated Time, and Rating (each with an icon).
       - Product title and description.
-      - A horizontal "Recommended For You" section showing ProductCards.
+      - A horizontal "Recommended For You" section showing product cards.
       - A bottom bar with quantity controls and an Add to Cart button.
+
+    The widget tree is built once; set_product() rebinds it to another
+    product in place. The recommended strip is filled on a later event-loop
+    turn, so showing a product only updates a few labels and the image.
     """
     # Signal for the back button so the main application can navigate back.
     backClicked = pyqtSignal()
+    # Emitted with a product dictionary when a recommended product is clicked.
+    productClicked = pyqtSignal(dict)
 
-    def __init__(self, product_data: dict, parent=None):
+    def __init__(self, product_data: dict = None, parent=None,
+                 recommendations=default_recommendations):
         """
         :param product_data: Expected keys:
             'image'        - Path to product image.
@@ -37,11 +76,51 @@ class ProductDetailsScreen(QWidget):
             'rating'       - Rating (e.g. "4.5").
             'title'        - Product title/name (e.g. "Burger With Meat 🍔").
             'description'  - Product description.
+        :param recommendations: Callable returning the recommended product
+            dictionaries for a product.
         """
         super().__init__(parent)
-        self.product_data = product_data
-        logging.debug("Initializing ProductDetailsScreen with product_data: %s", self.product_data)
+        self.product_data = {}
+        self.recommendations = recommendations
+        self._pending_recommendations = None
+        logging.debug("Initializing ProductDetailsScreen with product_data: %s", product_data)
         self.setup_ui()
+        if product_data is not None:
+            self.set_product(product_data)
+
+    def set_product(self, product_data: dict):
+        """
+        Show `product_data` in the existing widgets. The recommended strip
+        is refreshed asynchronously; only the latest product's is loaded.
+        """
+        logging.debug("ProductDetailsScreen.set_product(): %s", product_data.get("title"))
+        self.product_data = product_data
+
+        pixmap = cached_pixmap(product_data.get("image", ""), 398, 220,
+                               Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+        if pixmap.isNull():
+            self.image_label.setText("No Image Found")
+        else:
+            self.image_label.setPixmap(pixmap)
+        self.lbl_title.setText(product_data.get("title", "No Title"))
+        self.lbl_price.setText(product_data.get("price", "€0"))
+        self.lbl_delivery.setText(product_data.get("delivery", "Free Delivery"))
+        self.lbl_time.setText(product_data.get("time", "20-30"))
+        self.lbl_rating.setText(product_data.get("rating", "N/A"))
+        self.lbl_description.setText(product_data.get("description", DEFAULT_DESCRIPTION))
+        self.quantity_spinbox.setValue(1)
+        self.scroll_area.verticalScrollBar().setValue(0)
+
+        if self._pending_recommendations is None:
+            QTimer.singleShot(0, self.load_recommendations)
+        self._pending_recommendations = product_data
+
+    def load_recommendations(self):
+        """Fill the recommended strip for the most recently set product."""
+        product_data, self._pending_recommendations = self._pending_recommendations, None
+        if product_data is None:
+            return
+        self.recommended_grid.set_products(self.recommendations(product_data))
 
     def setup_ui(self):
         """Sets up the entire UI for the Product Details screen."""
@@ -50,7 +129,7 @@ class ProductDetailsScreen(QWidget):
         main_layout.setSpacing(0)
 
         # Create a scroll area to wrap all content.
-        scroll_area = QScrollArea()
+        self.scroll_area = scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
 
         # Content widget holds the scrollable content.
@@ -110,20 +189,10 @@ class ProductDetailsScreen(QWidget):
         container.setLayout(QVBoxLayout())
         container.layout().setContentsMargins(0, 0, 0, 0)
 
-        # Product Image Label.
-        image_label = QLabel(container)
+        # Product Image Label; set_product() scales the image to fill it.
+        self.image_label = image_label = QLabel(container)
         image_label.setFixedSize(container.size())
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_path = self.product_data.get("image", "")
-        if os.path.isfile(image_path):
-            pixmap = QPixmap(image_path)
-            # Scale the image to fill container while keeping aspect ratio.
-            pixmap = pixmap.scaled(398, image_label.height(),
-                                   Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                   Qt.TransformationMode.SmoothTransformation)
-            image_label.setPixmap(pixmap)
-        else:
-            image_label.setText("No Image Found")
         image_label.setStyleSheet("background-color: #F7F7F7;")
         image_label.setObjectName("productImage")
         # image_label.setGeometry(0, 0, container.width(), container.height())
@@ -187,9 +256,7 @@ class ProductDetailsScreen(QWidget):
         logging.debug("Creating price row.")
         layout = QHBoxLayout()
         layout.setContentsMargins(16, 16, 16, 0)
-        # Retrieve price from product data.
-        price = self.product_data.get("price", "€0")
-        lbl_price = QLabel(price)
+        self.lbl_price = lbl_price = QLabel()
         lbl_price.setFont(QFont(SETTINGS["font_family"], 14, QFont.Weight.Bold))
         # Use a color from your config (for example, using a neutral value)
         lbl_price.setStyleSheet(f"color: {SETTINGS['colors']['primary']['hover']};")
@@ -208,18 +275,18 @@ class ProductDetailsScreen(QWidget):
         layout.setSpacing(70)
 
         # Delivery Section.
-        delivery = self.product_data.get("delivery", "Free Delivery")
-        delivery_widget = self.create_info_item("resources/icons/delivery.png", delivery)
+        delivery_widget = self.create_info_item("resources/icons/delivery.png", "")
+        self.lbl_delivery = delivery_widget.findChild(QLabel, "infoText")
         layout.addWidget(delivery_widget)
 
         # Time Section.
-        time_range = self.product_data.get("time", "20-30")
-        time_widget = self.create_info_item("resources/icons/clock.png", time_range)
+        time_widget = self.create_info_item("resources/icons/clock.png", "")
+        self.lbl_time = time_widget.findChild(QLabel, "infoText")
         layout.addWidget(time_widget)
 
         # Rating Section.
-        rating = self.product_data.get("rating", "N/A")
-        rating_widget = self.create_info_item("resources/icons/star.png", rating)
+        rating_widget = self.create_info_item("resources/icons/star.png", "")
+        self.lbl_rating = rating_widget.findChild(QLabel, "infoText")
         layout.addWidget(rating_widget)
 
         layout.addStretch()
@@ -235,13 +302,12 @@ class ProductDetailsScreen(QWidget):
         item_layout.setSpacing(4)
 
         icon_label = QLabel()
-        pixmap = QPixmap(icon_path)
-        pixmap = pixmap.scaled(16, 16, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        icon_label.setPixmap(pixmap)
+        icon_label.setPixmap(cached_pixmap(icon_path, 16, 16))
         icon_label.setFixedSize(16, 16)
         item_layout.addWidget(icon_label)
 
         text_label = QLabel(text)
+        text_label.setObjectName("infoText")
         text_label.setFont(QFont(SETTINGS["font_family"], 12))
         text_label.setStyleSheet("color: #646464;")
         item_layout.addWidget(text_label)
@@ -253,10 +319,9 @@ class ProductDetailsScreen(QWidget):
         Displays the product's main title, e.g., "Burger With Meat 🍔"
         """
         logging.debug("Creating product title label.")
-        product_title = self.product_data.get("title", "No Title")
-        lbl_title = QLabel(product_title)
+        self.lbl_title = lbl_title = QLabel()
         lbl_title.setFont(QFont(SETTINGS["font_family"], 24, QFont.Weight.Bold))
-        lbl_title.setStyleSheet(f"color: {SETTINGS["colors"]["neutral"]["Neutral 100"]};")
+        lbl_title.setStyleSheet(f"color: {SETTINGS['colors']['neutral']['Neutral 100']};")
         lbl_title.setContentsMargins(16, 8, 16, 0)
         return lbl_title
 
@@ -277,9 +342,7 @@ class ProductDetailsScreen(QWidget):
         layout.addWidget(lbl_subtitle)
 
         # Actual description.
-        description_text = self.product_data.get("description",
-                                                 "Burger With Meat is a popular dish, known for its rich flavors and high-quality ingredients. It is highly recommended.")
-        lbl_description = QLabel(description_text)
+        self.lbl_description = lbl_description = QLabel()
         lbl_description.setFont(QFont(SETTINGS["font_family"], 12))
         lbl_description.setStyleSheet(f"color: {SETTINGS['colors']['neutral']['Neutral 60']};")
         lbl_description.setWordWrap(True)
@@ -289,8 +352,8 @@ class ProductDetailsScreen(QWidget):
 
     def create_recommended_section(self) -> QWidget:
         """
-        Creates the 'Recommended For You' section using ProductCard components
-        in a horizontal scroll area.
+        Creates the 'Recommended For You' section: a horizontal, virtualized
+        ProductGrid strip.
         """
         logging.debug("Creating recommended section.")
         container = QFrame()
@@ -312,54 +375,15 @@ class ProductDetailsScreen(QWidget):
         title_row.addWidget(btn_see_all)
         layout.addLayout(title_row)
 
-        # Create a horizontal scroll area for recommended products.
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setFixedHeight(250)
-
-        # Create a container widget that will hold the grid layout.
-        rec_container = QFrame()
-        rec_layout = QGridLayout()
-        rec_layout.setContentsMargins(0, 0, 0, 0)
-        rec_layout.setSpacing(10)
-
-        # Hard-coded recommended product examples.
-        recommended_products = [
-            {
-                "image": "resources/images/classic_burger.png",
-                "title": "Classic Burger",
-                "rating": "4.7",
-                "distance": "2.0km",
-                "price": "$9.50"
-            },
-            {
-                "image": "resources/images/smoked_burger.png",
-                "title": "Smoked Burger",
-                "rating": "4.5",
-                "distance": "1.5km",
-                "price": "$10.00"
-            },
-            {
-                "image": "resources/images/classic_burger.png",
-                "title": "Cheese Burger",
-                "rating": "4.6",
-                "distance": "1.8km",
-                "price": "$9.80"
-            }
-        ]
-
-        # Add a ProductCard for each recommended product using enumerate.
-        for i, rec_prod in enumerate(recommended_products):
-            card = ProductCard(**rec_prod)
-            row, col = divmod(i, 2)
-            rec_layout.addWidget(card, row, col, alignment=Qt.AlignmentFlag.AlignCenter)
-
-        # Set the grid layout in a container widget.
-        rec_container.setLayout(rec_layout)
-        scroll_area.setWidget(rec_container)
-        layout.addWidget(scroll_area)
+        # Horizontal strip of product cards; filled by load_recommendations().
+        self.recommended_grid = ProductGrid([])
+        self.recommended_grid.setWrapping(False)
+        self.recommended_grid.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.recommended_grid.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.recommended_grid.setMinimumHeight(0)
+        self.recommended_grid.setFixedHeight(250)
+        self.recommended_grid.productClicked.connect(self.productClicked)
+        layout.addWidget(self.recommended_grid)
 
         logging.debug("Recommended section created successfully.")
         return container
@@ -378,7 +402,7 @@ class ProductDetailsScreen(QWidget):
         layout.setSpacing(8)
 
         # Create and style the QSpinBox (Quantity Controls)
-        quantity_spinbox = QSpinBox()
+        self.quantity_spinbox = quantity_spinbox = QSpinBox()
         quantity_spinbox.setRange(1, 99)
         quantity_spinbox.setValue(1)
         quantity_spinbox.setStyleSheet("""
@@ -16,6 +16,8 @@ from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont, QPixmap
 from config.settings import SETTINGS
 from view.components.bottom_nav import BottomNav
+from model.money import format_cents
+from view.pixmap_cache import cached_pixmap
 
 
 class ProfileScreen(QWidget):
@@ -32,9 +34,11 @@ class ProfileScreen(QWidget):
     backClicked = pyqtSignal()  # Emitted when the back button is pressed
     signOutClicked = pyqtSignal()  # Emitted when the back button is pressed
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, repository=None, customer_id=None):
         super().__init__(parent)
         logging.debug("Initializing ProfileScreen.")
+        self.repository = repository  # OrderRepository, or None for the sample card
+        self.customer_id = customer_id
         self.setup_ui()
 
     def setup_ui(self):
@@ -187,7 +191,8 @@ class ProfileScreen(QWidget):
         Creates the 'My Orders' section with:
           - Title 'My Orders'
           - 'See All' button
-          - A sample order card
+          - The customer's latest order from the repository, or an empty state
+            when there is none (a sample card when no repository is attached)
         """
         logging.debug("Creating orders section.")
         container = QFrame()
@@ -221,18 +226,46 @@ class ProfileScreen(QWidget):
         container_layout.addLayout(header_layout)
 
         # Order Card
-        order_card = self.create_order_card()
-        container_layout.addWidget(order_card)
+        if self.repository is None:
+            container_layout.addWidget(self.create_order_card())
+            return container
+        latest = None
+        if self.customer_id is not None:
+            orders, _ = self.repository.recent(self.customer_id, limit=1)
+            latest = orders[0] if orders else None
+        if latest is not None and latest.items:
+            container_layout.addWidget(self.create_order_card(latest))
+        else:
+            empty = QLabel("No orders yet")
+            empty.setFont(QFont(SETTINGS["font_family"], 12))
+            empty.setStyleSheet("color: #9A9A9A;")
+            container_layout.addWidget(empty)
 
         return container
 
-    def create_order_card(self) -> QWidget:
+    def create_order_card(self, order=None) -> QWidget:
         """
-        Creates a placeholder order card with:
+        Creates an order card for `order` (a placeholder when None) with:
          - Order ID
          - Status (In Delivery)
          - Product image, name, price, items
         """
+        if order is not None and order.items:
+            first = order.items[0]
+            order_id = str(order.id)[:8]
+            status = order.status.capitalize()
+            image_path = os.path.join("resources/images", first.image)
+            product_name = first.name
+            price = format_cents(order.total_cents)
+            item_count = len(order.items)
+        else:
+            order_id = "88833777"
+            status = "In Delivery"
+            image_path = "resources/images/smoked_burger.png"  # Placeholder
+            product_name = "Burger With Meat"
+            price = "€12"
+            item_count = 14
+
         card_container = QFrame()
         card_container.setStyleSheet(
             """
@@ -249,14 +282,14 @@ class ProfileScreen(QWidget):
         # 1) Row: order ID and status badge
         row1_layout = QHBoxLayout()
 
-        lbl_order_id = QLabel("Order ID 88833777")
+        lbl_order_id = QLabel(f"Order ID {order_id}")
         lbl_order_id.setFont(QFont(SETTINGS["font_family"], 12))
         lbl_order_id.setStyleSheet("color: #646464;")
         row1_layout.addWidget(lbl_order_id)
 
         row1_layout.addStretch()
 
-        status_label = QLabel("In Delivery")
+        status_label = QLabel(status)
         status_label.setFont(QFont(SETTINGS["font_family"], 12, QFont.Weight.Bold))
         status_label.setFixedHeight(24)
         status_label.setStyleSheet(
@@ -276,14 +309,8 @@ class ProfileScreen(QWidget):
         # 2) Row: product image, name, price, items
         row2_layout = QHBoxLayout()
         image_label = QLabel()
-        pixmap = QPixmap("resources/images/smoked_burger.png")  # Placeholder
+        pixmap = cached_pixmap(image_path, 60, 60)
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(
-                60,
-                60,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
             image_label.setPixmap(pixmap)
         else:
             image_label.setText("No Image")
@@ -293,14 +320,14 @@ class ProfileScreen(QWidget):
         info_layout = QVBoxLayout()
         info_layout.setSpacing(4)
 
-        product_name_label = QLabel("Burger With Meat")
+        product_name_label = QLabel(product_name)
         product_name_label.setFont(
             QFont(SETTINGS["font_family"], 14, QFont.Weight.Bold)
         )
         product_name_label.setStyleSheet("color: #1E1E1E;")
         info_layout.addWidget(product_name_label)
 
-        price_label = QLabel("€12")
+        price_label = QLabel(price)
         price_label.setFont(QFont(SETTINGS["font_family"], 12))
         price_label.setStyleSheet("color: #FE8C00;")
         info_layout.addWidget(price_label)
@@ -308,7 +335,7 @@ class ProfileScreen(QWidget):
         row2_layout.addLayout(info_layout)
         row2_layout.addStretch()
 
-        items_label = QLabel("14 items")
+        items_label = QLabel(f"{item_count} items")
         items_label.setFont(QFont(SETTINGS["font_family"], 12))
         items_label.setStyleSheet("color: #9A9A9A;")
         row2_layout.addWidget(items_label, alignment=Qt.AlignmentFlag.AlignRight)
@@ -358,14 +385,8 @@ class ProfileScreen(QWidget):
         row_layout.setSpacing(8)
 
         icon_label = QLabel()
-        pixmap = QPixmap(icon_path)
+        pixmap = cached_pixmap(icon_path, 24, 24)
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(
-                24,
-                24,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
             icon_label.setPixmap(pixmap)
         else:
             icon_label.setText("No Icon")
@@ -379,14 +400,8 @@ class ProfileScreen(QWidget):
 
         # Right arrow
         arrow_label = QLabel()
-        arrow_pix = QPixmap("resources/icons/arrow_right.png")
+        arrow_pix = cached_pixmap("resources/icons/arrow_right.png", 20, 20)
         if not arrow_pix.isNull():
-            arrow_pix = arrow_pix.scaled(
-                20,
-                20,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
             arrow_label.setPixmap(arrow_pix)
         else:
             arrow_label.setText(">")
@@ -20,6 +20,7 @@ from model.preferences import Preferences
 from model.filters import Filters
 from model.recommendation_algorithm import RecommendationAlgorithm
 from model.menu_item import MenuItem
+from controller.recommendation_runner import RecommendationRunner
 from view.components.product_card import ProductCard
 from config.settings import SETTINGS
 
@@ -30,6 +31,10 @@ class RecommendationScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.algorithm = RecommendationAlgorithm()
+        # Runs the algorithm on a worker thread so the window never freezes.
+        self.runner = RecommendationRunner(self.algorithm, parent=self)
+        self.runner.finished.connect(self.show_recommendations)
+        self.runner.failed.connect(self.on_algorithm_failed)
         self.setup_ui()
 
     def setup_ui(self):
@@ -157,16 +162,15 @@ class RecommendationScreen(QWidget):
             )
             return
 
-        # run algorithm
-        try:
-            self.algorithm.analyzeBehavior(None)  # user not modeled here
-            recs = self.algorithm.getRecommendations(None, prefs, fltrs)
-        except Exception:
-            QMessageBox.critical(
-                self, "Σφάλμα", "Πρόβλημα με τον αλγόριθμο. Δοκιμάστε ξανά."
-            )
-            return
+        # run algorithm in the background; a new click supersedes the old one
+        self.runner.request(None, prefs, fltrs)  # user not modeled here
+
+    def on_algorithm_failed(self, message: str):
+        QMessageBox.critical(
+            self, "Σφάλμα", "Πρόβλημα με τον αλγόριθμο. Δοκιμάστε ξανά."
+        )
 
+    def show_recommendations(self, recs: List[MenuItem], fallback: bool = False):
         # display
         # clear old
         for i in reversed(range(self.rec_layout.count())):
@@ -19,6 +19,7 @@ from config.settings import SETTINGS
 import logging
 import os
 from view.components.category_widget import CategoryWidget
+from view.pixmap_cache import cached_pixmap
 
 
 class SearchScreen(QWidget):
@@ -31,9 +32,24 @@ class SearchScreen(QWidget):
     deleteAllRecent = pyqtSignal()
     orderSelected = pyqtSignal(dict)
 
-    def __init__(self, parent=None, recent_searches=None, recent_orders=None):
+    def __init__(
+        self,
+        parent=None,
+        recent_searches=None,
+        recent_orders=None,
+        repository=None,
+        customer_id=None,
+    ):
         super().__init__(parent)
 
+        # recent orders come from the OrderRepository when one is attached;
+        # with no customer or no orders yet the list is empty, not samples
+        if recent_orders is None and repository is not None:
+            orders = []
+            if customer_id is not None:
+                orders, _ = repository.recent(customer_id, limit=4)
+            recent_orders = [self.order_to_card(o) for o in orders if o.items]
+
         # default data if none passed
         self.recent_searches = recent_searches or [
             "Burgers",
@@ -42,39 +58,54 @@ class SearchScreen(QWidget):
             "French",
             "Fastry",
         ]
-        self.recent_orders = recent_orders or [
-            {
-                "name": "Ordinary Burgers",
-                "subtitle": "Burger Restaurant",
-                "rating": "4.9",
-                "distance": "190m",
-                "image": "resources/images/smoked_burger.png",
-            },
-            {
-                "name": "Ordinary Burgers",
-                "subtitle": "Burger Restaurant",
-                "rating": "4.9",
-                "distance": "190m",
-                "image": "resources/images/smoked_burger.png",
-            },
-            {
-                "name": "Ordinary Burgers",
-                "subtitle": "Burger Restaurant",
-                "rating": "4.9",
-                "distance": "190m",
-                "image": "resources/images/smoked_burger.png",
-            },
-            {
-                "name": "Ordinary Burgers",
-                "subtitle": "Burger Restaurant",
-                "rating": "4.9",
-                "distance": "190m",
-                "image": "resources/images/smoked_burger.png",
-            },
-        ]
+        if recent_orders is None:
+            recent_orders = [
+                {
+                    "name": "Ordinary Burgers",
+                    "subtitle": "Burger Restaurant",
+                    "rating": "4.9",
+                    "distance": "190m",
+                    "image": "resources/images/smoked_burger.png",
+                },
+                {
+                    "name": "Ordinary Burgers",
+                    "subtitle": "Burger Restaurant",
+                    "rating": "4.9",
+                    "distance": "190m",
+                    "image": "resources/images/smoked_burger.png",
+                },
+                {
+                    "name": "Ordinary Burgers",
+                    "subtitle": "Burger Restaurant",
+                    "rating": "4.9",
+                    "distance": "190m",
+                    "image": "resources/images/smoked_burger.png",
+                },
+                {
+                    "name": "Ordinary Burgers",
+                    "subtitle": "Burger Restaurant",
+                    "rating": "4.9",
+                    "distance": "190m",
+                    "image": "resources/images/smoked_burger.png",
+                },
+            ]
+        self.recent_orders = recent_orders
 
         self._build_ui()
 
+    @staticmethod
+    def order_to_card(order) -> dict:
+        """Card data for a stored Order, in the shape of recent_orders."""
+        first = order.items[0]
+        return {
+            "name": first.name,
+            "subtitle": first.cuisine or f"{len(order.items)} items",
+            "rating": f"{first.rating:.1f}",
+            "distance": f"{round(first.distance * 1000)}m",
+            "image": os.path.join("resources/images", first.image),
+            "order_id": str(order.id),
+        }
+
     def _build_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -240,6 +271,16 @@ class SearchScreen(QWidget):
         content.addWidget(ro_label)
 
         # —— Recent orders list
+        if not self.recent_orders:
+            empty = QLabel("No orders yet")
+            empty.setFont(QFont(SETTINGS["font_family"], 12))
+            empty.setStyleSheet(
+                f"""
+                    color: {SETTINGS['colors']['neutral']['Neutral 60']};
+                    background: transparent;
+                """
+            )
+            content.addWidget(empty)
         for order in self.recent_orders:
             item = QFrame()
             item.setStyleSheet(
@@ -250,11 +291,8 @@ class SearchScreen(QWidget):
             )
             item.setFixedHeight(80)
             hl = QHBoxLayout(item)
-            pix = QPixmap(order["image"]).scaled(
-                60,
-                60,
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
+            pix = cached_pixmap(
+                order["image"], 60, 60, Qt.AspectRatioMode.KeepAspectRatioByExpanding
             )
             img = QLabel()
             img.setPixmap(pix)
@@ -309,14 +347,7 @@ class SearchScreen(QWidget):
         item_layout.setSpacing(4)
 
         icon_label = QLabel()
-        pixmap = QPixmap(icon_path)
-        pixmap = pixmap.scaled(
-            16,
-            16,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        icon_label.setPixmap(pixmap)
+        icon_label.setPixmap(cached_pixmap(icon_path, 16, 16))
         icon_label.setFixedSize(16, 16)
         item_layout.addWidget(icon_label)
 